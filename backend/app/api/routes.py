@@ -2,7 +2,8 @@
 API Routes for Mai Shan Yun Dashboard
 """
 from fastapi import APIRouter, HTTPException, Query, Body, UploadFile, File
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import Optional, Dict, Any
 import pandas as pd
 import json
@@ -560,6 +561,35 @@ async def chat(query: Dict[str, str] = Body(...)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/chat/stream")
+async def chat_stream(query: Dict[str, str] = Body(...)):
+    """
+    Chatbot endpoint that streams the response as it is generated
+    
+    The body is newline-delimited JSON: an optional {"type": "chart", "chart_info": ...} event,
+    then {"type": "text", "text": ...} events in order. A failure after streaming has started is
+    reported as a final {"type": "error", "detail": ...} event.
+    """
+    user_query = query.get("query", "")
+    if not user_query:
+        raise HTTPException(status_code=400, detail="Query is required")
+    
+    try:
+        chunks, chart_info = chatbot_service.ask_stream(user_query)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    def events():
+        if chart_info:
+            yield json.dumps({"type": "chart", "chart_info": jsonable_encoder(chart_info)}) + "\n"
+        try:
+            for chunk in chunks:
+                yield json.dumps({"type": "text", "text": chunk}) + "\n"
+        except Exception as e:
+            yield json.dumps({"type": "error", "detail": str(e)}) + "\n"
+    
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
 @router.post("/chat/clear")
 async def clear_chat():
     """Clear chatbot history"""
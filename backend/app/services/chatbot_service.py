@@ -2,7 +2,7 @@
 Chatbot Service - Wraps InventoryChatbot for API use
 """
 import os
-from typing import Optional
+from typing import Iterator, Optional, Tuple
 import sys
 from pathlib import Path
 
@@ -55,6 +55,21 @@ class ChatbotService:
         
         return chatbot.ask(query)
     
+    def ask_stream(self, query: str) -> Tuple[Iterator[str], Optional[dict]]:
+        """Process a chat query, returning (response text chunks as they are generated, chart_info)"""
+        chatbot = self.get_chatbot(force_reload=False)
+        if chatbot is None:
+            return iter(["Chatbot is not available. Please set OPENROUTER_API_KEY environment variable."]), None
+        
+        # Update chatbot's analytics reference to ensure it has latest data
+        try:
+            fresh_analytics = self.analytics_service.get_analytics()
+            chatbot.analytics = fresh_analytics
+        except:
+            pass  # If update fails, continue with existing analytics
+        
+        return chatbot.ask_stream(query)
+    
     def reload_chatbot(self):
         """Reload chatbot with fresh analytics data (call after data uploads)"""
         self._chatbot = None
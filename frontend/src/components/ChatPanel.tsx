@@ -30,24 +30,39 @@ export const ChatPanel: React.FC = () => {
   }, [messages])
 
   const chatMutation = useMutation({
-    mutationFn: (query: string) => apiEndpoints.chat(query),
-    onSuccess: (response) => {
-      const newMessage: ChatMessage = {
-        role: 'assistant',
-        content: response.data.response,
-        chart_info: response.data.chart_info,
-      }
-      setMessages((prev) => [...prev, newMessage])
+    mutationFn: (query: string) => {
+      // Start an empty assistant message and fill it in as the response streams in
+      setMessages((prev) => [...prev, { role: 'assistant', content: '' }])
+      return apiEndpoints.chatStream(query, (event) => {
+        setMessages((prev) => {
+          const last = prev[prev.length - 1]
+          const updated: ChatMessage = event.type === 'chart'
+            ? { ...last, chart_info: event.chart_info }
+            : { ...last, content: last.content + (event.type === 'text' ? event.text : '') }
+          return [...prev.slice(0, -1), updated]
+        })
+      })
     },
     onError: (error: any) => {
       const errorMessage: ChatMessage = {
         role: 'assistant',
         content: `Error: ${error.response?.data?.detail || error.message || 'Failed to get response'}`,
       }
-      setMessages((prev) => [...prev, errorMessage])
+      setMessages((prev) => {
+        // Replace the placeholder if nothing was streamed into it yet
+        const last = prev[prev.length - 1]
+        if (last?.role === 'assistant' && !last.content && !last.chart_info) {
+          return [...prev.slice(0, -1), errorMessage]
+        }
+        return [...prev, errorMessage]
+      })
     },
   })
 
+  // Show the loading bubble until the first chunk of the answer arrives
+  const lastMessage = messages[messages.length - 1]
+  const awaitingFirstChunk = chatMutation.isPending && lastMessage?.role === 'assistant' && !lastMessage.content
+
   const clearChatMutation = useMutation({
     mutationFn: () => apiEndpoints.clearChat(),
     onSuccess: () => {
@@ -159,7 +174,7 @@ export const ChatPanel: React.FC = () => {
                   </div>
                 </div>
               )}
-              {messages.map((message, idx) => (
+              {messages.map((message, idx) => message.role === 'assistant' && !message.content && !message.chart_info ? null : (
                 <div
                   key={idx}
                   className={cn(
@@ -197,7 +212,7 @@ export const ChatPanel: React.FC = () => {
                   </div>
                 </div>
               ))}
-              {chatMutation.isPending && (
+              {awaitingFirstChunk && (
                 <div className="flex justify-start">
                   <div className="bg-white/10 text-white rounded-lg px-4 py-2 flex items-center gap-2">
                     <Loader2 className="h-4 w-4 animate-spin" />
@@ -17,6 +17,45 @@ export const uploadApi = axios.create({
   },
 })
 
+// Events sent by /api/chat/stream, one JSON object per line
+export type ChatStreamEvent =
+  | { type: 'text'; text: string }
+  | { type: 'chart'; chart_info: any }
+  | { type: 'error'; detail: string }
+
+// axios buffers the whole response in the browser, so the streaming chat endpoint is read with fetch
+const chatStream = async (query: string, onEvent: (event: ChatStreamEvent) => void) => {
+  const response = await fetch(`${API_BASE_URL}/api/chat/stream`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ query }),
+  })
+  if (!response.ok || !response.body) {
+    const error = await response.json().catch(() => null)
+    throw new Error(error?.detail || `Request failed with status ${response.status}`)
+  }
+
+  const reader = response.body.getReader()
+  const decoder = new TextDecoder()
+  let buffered = ''
+  const emit = (line: string) => {
+    if (!line.trim()) return
+    const event: ChatStreamEvent = JSON.parse(line)
+    if (event.type === 'error') throw new Error(event.detail)
+    onEvent(event)
+  }
+
+  while (true) {
+    const { done, value } = await reader.read()
+    if (done) break
+    buffered += decoder.decode(value, { stream: true })
+    const lines = buffered.split('\n')
+    buffered = lines.pop() ?? ''
+    lines.forEach(emit)
+  }
+  emit(buffered + decoder.decode())
+}
+
 // API endpoints
 export const apiEndpoints = {
   overview: () => api.get('/api/overview'),
@@ -40,6 +79,7 @@ export const apiEndpoints = {
     api.get('/api/reorder', { params: { include_seasonality: includeSeasonality } }),
   simulate: (scenario: any) => api.post('/api/simulate', scenario),
   chat: (query: string) => api.post('/api/chat', { query }),
+  chatStream,
   clearChat: () => api.post('/api/chat/clear'),
   reload: () => api.post('/api/reload'),
   ingredients: () => api.get('/api/ingredients'),
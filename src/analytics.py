@@ -8,9 +8,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import StandardScaler
-import warnings
 import holidays
-warnings.filterwarnings('ignore')
 
 # Try to import DataPreprocessor
 try:
@@ -51,19 +49,19 @@ class InventoryAnalytics:
         usage = usage[usage['date'] <= current_date].copy()
         
         # Aggregate purchases by ingredient
-        purchase_agg = purchases.groupby('ingredient').agg({
+        purchase_agg = purchases.groupby('ingredient', observed=True).agg({
             'quantity': 'sum'
         }).reset_index()
         purchase_agg.columns = ['ingredient', 'total_purchased']
         
         # Aggregate usage by ingredient
-        usage_agg = usage.groupby('ingredient').agg({
+        usage_agg = usage.groupby('ingredient', observed=True).agg({
             'quantity_used': 'sum'
         }).reset_index()
         usage_agg.columns = ['ingredient', 'total_used']
         
         # Merge and calculate current inventory
-        inventory = purchase_agg.merge(usage_agg, on='ingredient', how='outer').fillna(0)
+        inventory = purchase_agg.merge(usage_agg, on='ingredient', how='outer').fillna({'total_purchased': 0, 'total_used': 0})
         inventory['current_stock'] = inventory['total_purchased'] - inventory['total_used']
         # Ensure current_stock is never negative (cap at 0)
         inventory['current_stock'] = inventory['current_stock'].apply(lambda x: max(0, float(x)) if pd.notna(x) else 0)
@@ -355,7 +353,7 @@ class InventoryAnalytics:
             if recent_usage.empty:
                 return pd.DataFrame()
             
-            top = recent_usage.groupby('ingredient').agg({
+            top = recent_usage.groupby('ingredient', observed=True).agg({
                 'quantity_used': 'sum'
             }).reset_index().sort_values('quantity_used', ascending=False).head(limit)
             top.columns = ['ingredient', 'value']
@@ -384,7 +382,7 @@ class InventoryAnalytics:
             # Estimate missing costs
             recent_purchases = self._estimate_missing_costs(recent_purchases)
             
-            top = recent_purchases.groupby('ingredient').agg({
+            top = recent_purchases.groupby('ingredient', observed=True).agg({
                 'total_cost': 'sum'
             }).reset_index().sort_values('total_cost', ascending=False).head(limit)
             top.columns = ['ingredient', 'value']
@@ -421,7 +419,7 @@ class InventoryAnalytics:
         if not has_date_info:
             return pd.DataFrame()
         
-        delay_analysis = shipments_copy.groupby('ingredient').agg({
+        delay_analysis = shipments_copy.groupby('ingredient', observed=True).agg({
             'delay_days': ['mean', 'max', 'count'],
             'status': lambda x: (x == 'Delayed').sum() if 'status' in shipments_copy.columns else pd.Series([0] * len(x))
         }).reset_index()
@@ -449,7 +447,7 @@ class InventoryAnalytics:
         
         if not purchases_with_cost.empty:
             # Calculate average unit cost per ingredient from purchases with cost data
-            avg_unit_costs = purchases_with_cost.groupby('ingredient').apply(
+            avg_unit_costs = purchases_with_cost.groupby('ingredient', observed=True)[['total_cost', 'quantity']].apply(
                 lambda x: (x['total_cost'].sum() / x['quantity'].sum()) if x['quantity'].sum() > 0 else 0
             ).to_dict()
             
@@ -535,7 +533,7 @@ class InventoryAnalytics:
         
         # Spending by supplier
         if 'supplier' in recent_purchases.columns and 'total_cost' in recent_purchases.columns:
-            spending_by_supplier = recent_purchases.groupby('supplier')['total_cost'].sum().to_dict()
+            spending_by_supplier = recent_purchases.groupby('supplier', observed=True)['total_cost'].sum().to_dict()
         else:
             spending_by_supplier = {}
         
@@ -683,7 +681,7 @@ class InventoryAnalytics:
                 recent_usage = usage[usage['date'] >= (current_date - timedelta(days=30))].copy()
                 if not recent_usage.empty:
                     # Aggregate usage by ingredient
-                    usage_totals = recent_usage.groupby('ingredient')['quantity_used'].sum().reset_index()
+                    usage_totals = recent_usage.groupby('ingredient', observed=True)['quantity_used'].sum().reset_index()
                     usage_totals['ingredient_normalized'] = usage_totals['ingredient'].apply(normalize_ingredient_name)
                     
                     ingredient_norm = normalize_ingredient_name(ingredient)
@@ -1135,7 +1133,7 @@ class InventoryAnalytics:
             return pd.DataFrame()
         
         # Get menu items and their usage of expiring ingredients
-        recipe_suggestions = recipes.groupby('menu_item').agg({
+        recipe_suggestions = recipes.groupby('menu_item', observed=True).agg({
             'ingredient': lambda x: ', '.join(x.unique()),
             'quantity_used': 'sum'
         }).reset_index()
@@ -1144,7 +1142,7 @@ class InventoryAnalytics:
         # Add popularity from sales if available
         if not sales.empty and 'menu_item' in sales.columns:
             recent_sales = sales[sales['date'] >= datetime.now() - timedelta(days=30)]
-            menu_popularity = recent_sales.groupby('menu_item')['quantity_sold'].sum().reset_index()
+            menu_popularity = recent_sales.groupby('menu_item', observed=True)['quantity_sold'].sum().reset_index()
             menu_popularity.columns = ['menu_item', 'sales_count']
             recipe_suggestions = recipe_suggestions.merge(menu_popularity, on='menu_item', how='left')
             recipe_suggestions['sales_count'] = recipe_suggestions['sales_count'].fillna(0)
@@ -1303,7 +1301,7 @@ class InventoryAnalytics:
                     
                     if not usage_with_sales.empty:
                         # Get average per serving per menu item
-                        per_serving_avg = usage_with_sales.groupby('menu_item')['per_serving'].mean().to_dict()
+                        per_serving_avg = usage_with_sales.groupby('menu_item', observed=True)['per_serving'].mean().to_dict()
                         # Use unit from recipe if available, otherwise infer from ingredient name
                         unit = ingredient_unit_from_recipe if ingredient_unit_from_recipe else 'units'
                         
@@ -1536,7 +1534,7 @@ class InventoryAnalytics:
         if recent_sales.empty:
             return pd.DataFrame()
         
-        menu_popularity = recent_sales.groupby('menu_item')['quantity_sold'].sum().reset_index()
+        menu_popularity = recent_sales.groupby('menu_item', observed=True)['quantity_sold'].sum().reset_index()
         menu_popularity.columns = ['menu_item', 'total_sales']
         
         if menu_popularity.empty or menu_popularity['total_sales'].max() == 0:
@@ -1838,11 +1836,13 @@ class InventoryAnalytics:
                         unit_map[ingredient] = str(unit).strip()
         
         # Calculate total purchased and used per ingredient
-        purchase_totals = recent_purchases.groupby('ingredient').agg({
+        purchase_totals = recent_purchases.groupby('ingredient', observed=True).agg({
             'quantity': 'sum',
             'total_cost': 'sum'
         }).reset_index()
         purchase_totals.columns = ['ingredient', 'total_purchased', 'total_cost']
+        # Aggregates are small - use plain strings so per-name helpers can return lists
+        purchase_totals['ingredient'] = purchase_totals['ingredient'].astype(object)
         purchase_totals['ingredient_normalized'] = purchase_totals['ingredient'].apply(normalize_ingredient_name)
         purchase_totals['base_ingredients'] = purchase_totals['ingredient'].apply(extract_base_ingredient)
         
@@ -1870,8 +1870,9 @@ class InventoryAnalytics:
             axis=1
         )
         
-        usage_totals = recent_usage.groupby('ingredient')['quantity_used'].sum().reset_index()
+        usage_totals = recent_usage.groupby('ingredient', observed=True)['quantity_used'].sum().reset_index()
         usage_totals.columns = ['ingredient', 'total_used']
+        usage_totals['ingredient'] = usage_totals['ingredient'].astype(object)
         usage_totals['ingredient_normalized'] = usage_totals['ingredient'].apply(normalize_ingredient_name)
         usage_totals['base_ingredients'] = usage_totals['ingredient'].apply(extract_base_ingredient)
         
@@ -1992,7 +1993,7 @@ class InventoryAnalytics:
         if matched_usage:
             matched_df = pd.DataFrame(matched_usage)
             # Group by purchase ingredient and sum usage
-            usage_by_purchase = matched_df.groupby('purchase_ingredient').agg({
+            usage_by_purchase = matched_df.groupby('purchase_ingredient', observed=True).agg({
                 'total_used': 'sum',
                 'total_used_grams': 'sum'
             }).reset_index()
@@ -2170,7 +2171,7 @@ class InventoryAnalytics:
             ].copy()
             
             if not future_purchases.empty:
-                expected_purchases = future_purchases.groupby('ingredient')['quantity'].sum().reset_index()
+                expected_purchases = future_purchases.groupby('ingredient', observed=True)['quantity'].sum().reset_index()
                 expected_purchases.columns = ['ingredient', 'expected_purchase_qty']
         
         # If no future purchases found, generate them based on shipment frequency
@@ -2229,7 +2230,7 @@ class InventoryAnalytics:
                     
                     if future_purchase_list:
                         future_purchases_df = pd.DataFrame(future_purchase_list)
-                        expected_purchases = future_purchases_df.groupby('ingredient')['quantity'].sum().reset_index()
+                        expected_purchases = future_purchases_df.groupby('ingredient', observed=True)['quantity'].sum().reset_index()
                         expected_purchases.columns = ['ingredient', 'expected_purchase_qty']
         
         # Get expected usage in the next days_ahead days (based on historical average)
@@ -2258,7 +2259,7 @@ class InventoryAnalytics:
                             return name
                     
                     # Calculate average daily usage by ingredient
-                    usage_totals = recent_usage.groupby('ingredient')['quantity_used'].sum().reset_index()
+                    usage_totals = recent_usage.groupby('ingredient', observed=True)['quantity_used'].sum().reset_index()
                     usage_totals.columns = ['ingredient', 'total_usage']
                     usage_totals['ingredient_normalized'] = usage_totals['ingredient'].apply(normalize_ingredient_name)
                     
@@ -2302,7 +2303,7 @@ class InventoryAnalytics:
                     if matched_usage_list:
                         matched_usage_df = pd.DataFrame(matched_usage_list)
                         # Aggregate by ingredient (in case multiple usage ingredients match one inventory ingredient)
-                        avg_daily_usage = matched_usage_df.groupby('ingredient')['avg_daily_usage'].sum().reset_index()
+                        avg_daily_usage = matched_usage_df.groupby('ingredient', observed=True)['avg_daily_usage'].sum().reset_index()
                         # Project usage for days_ahead
                         avg_daily_usage['expected_usage_qty'] = avg_daily_usage['avg_daily_usage'] * days_ahead
                         expected_usage = avg_daily_usage[['ingredient', 'expected_usage_qty']]
@@ -2315,7 +2316,7 @@ class InventoryAnalytics:
         if not expected_purchases.empty:
             projected_inventory = projected_inventory.merge(
                 expected_purchases, on='ingredient', how='left'
-            ).fillna(0)
+            ).fillna({'expected_purchase_qty': 0})
             projected_inventory['projected_stock'] = projected_inventory['projected_stock'] + projected_inventory['expected_purchase_qty']
         else:
             projected_inventory['expected_purchase_qty'] = 0
@@ -2324,7 +2325,7 @@ class InventoryAnalytics:
         if not expected_usage.empty:
             projected_inventory = projected_inventory.merge(
                 expected_usage, on='ingredient', how='left'
-            ).fillna(0)
+            ).fillna({'expected_usage_qty': 0})
             projected_inventory['projected_stock'] = projected_inventory.apply(
                 lambda row: max(0, row['projected_stock'] - row['expected_usage_qty']), axis=1
             )
@@ -2400,7 +2401,7 @@ class InventoryAnalytics:
                 shipments['delay_days'] = 0
         
         # Supplier analysis
-        supplier_metrics = shipments.groupby('supplier').agg({
+        supplier_metrics = shipments.groupby('supplier', observed=True).agg({
             'delay_days': ['mean', 'max', 'count'],
             'status': lambda x: (x == 'Delayed').sum()
         }).reset_index()
@@ -2412,22 +2413,22 @@ class InventoryAnalytics:
         # Calculate fulfillment accuracy (if we have purchase data)
         if not purchases.empty and 'supplier' in purchases.columns:
             # Match purchases to shipments (simplified - by ingredient and date proximity)
-            purchase_totals = purchases.groupby(['supplier', 'ingredient'])['quantity'].sum().reset_index()
-            shipment_totals = shipments.groupby(['supplier', 'ingredient'])['quantity'].sum().reset_index()
+            purchase_totals = purchases.groupby(['supplier', 'ingredient'], observed=True)['quantity'].sum().reset_index()
+            shipment_totals = shipments.groupby(['supplier', 'ingredient'], observed=True)['quantity'].sum().reset_index()
             
             fulfillment = purchase_totals.merge(
                 shipment_totals,
                 on=['supplier', 'ingredient'],
                 how='left',
                 suffixes=('_ordered', '_received')
-            ).fillna(0)
+            ).fillna({'quantity_ordered': 0, 'quantity_received': 0})
             
             fulfillment['fulfillment_rate'] = (
                 fulfillment['quantity_received'] / fulfillment['quantity_ordered'] * 100
             ).round(2)
             fulfillment['fulfillment_rate'] = fulfillment['fulfillment_rate'].clip(upper=100)
             
-            supplier_fulfillment = fulfillment.groupby('supplier')['fulfillment_rate'].mean().reset_index()
+            supplier_fulfillment = fulfillment.groupby('supplier', observed=True)['fulfillment_rate'].mean().reset_index()
             supplier_metrics = supplier_metrics.merge(supplier_fulfillment, on='supplier', how='left')
             supplier_metrics['fulfillment_rate'] = supplier_metrics['fulfillment_rate'].fillna(100)
         else:
@@ -2441,7 +2442,7 @@ class InventoryAnalytics:
         
         # Get spending per supplier
         if not purchases.empty and 'supplier' in purchases.columns:
-            supplier_spending = purchases.groupby('supplier')['total_cost'].sum().reset_index()
+            supplier_spending = purchases.groupby('supplier', observed=True)['total_cost'].sum().reset_index()
             supplier_spending.columns = ['supplier', 'total_spending']
             supplier_metrics = supplier_metrics.merge(supplier_spending, on='supplier', how='left')
             supplier_metrics['total_spending'] = supplier_metrics['total_spending'].fillna(0)
@@ -2581,7 +2582,7 @@ class InventoryAnalytics:
                     
                     if not usage_with_sales.empty:
                         # Get average ingredient usage per menu item (per serving)
-                        recipe_map = usage_with_sales.groupby(['menu_item', 'ingredient']).agg({
+                        recipe_map = usage_with_sales.groupby(['menu_item', 'ingredient'], observed=True).agg({
                             'per_serving': 'mean'
                         }).reset_index()
                         recipe_map.columns = ['menu_item', 'ingredient', 'avg_ingredient_per_serving']
@@ -2600,20 +2601,20 @@ class InventoryAnalytics:
         if recipe_map is None or recipe_map.empty:
             try:
                 # Group by date and menu_item, take minimum as proxy for single serving
-                usage_by_transaction = usage.groupby(['date', 'menu_item', 'ingredient']).agg({
+                usage_by_transaction = usage.groupby(['date', 'menu_item', 'ingredient'], observed=True).agg({
                     'quantity_used': 'sum'
                 }).reset_index()
                 
                 # For each menu_item+ingredient, use the minimum as proxy for per-serving
                 # This works if there are some single-serving transactions
-                recipe_map = usage_by_transaction.groupby(['menu_item', 'ingredient']).agg({
+                recipe_map = usage_by_transaction.groupby(['menu_item', 'ingredient'], observed=True).agg({
                     'quantity_used': lambda x: x.min() if len(x) > 0 else 0
                 }).reset_index()
                 recipe_map.columns = ['menu_item', 'ingredient', 'avg_ingredient_per_serving']
                 
                 # If minimum is still too high (likely multi-serving), try median divided by typical serving count
                 # Estimate typical servings per transaction
-                transaction_sizes = usage_by_transaction.groupby(['date', 'menu_item']).size()
+                transaction_sizes = usage_by_transaction.groupby(['date', 'menu_item'], observed=True).size()
                 if not transaction_sizes.empty:
                     typical_servings = max(1, int(transaction_sizes.median()))
                     recipe_map['avg_ingredient_per_serving'] = (
@@ -2621,7 +2622,7 @@ class InventoryAnalytics:
                     )
             except Exception as e:
                 # Last resort: use mean divided by estimated serving count
-                recipe_map = usage.groupby(['menu_item', 'ingredient']).agg({
+                recipe_map = usage.groupby(['menu_item', 'ingredient'], observed=True).agg({
                     'quantity_used': 'mean'
                 }).reset_index()
                 recipe_map.columns = ['menu_item', 'ingredient', 'avg_ingredient_per_serving']
@@ -2970,13 +2971,13 @@ class InventoryAnalytics:
         if not base_usage.empty and 'ingredient' in base_usage.columns:
             base_usage_filtered = base_usage[base_usage['date'] <= current_date].copy()
             if not base_usage_filtered.empty:
-                base_usage_agg = base_usage_filtered.groupby('ingredient')['quantity_used'].sum().reset_index()
+                base_usage_agg = base_usage_filtered.groupby('ingredient', observed=True)['quantity_used'].sum().reset_index()
                 base_usage_agg.columns = ['ingredient', 'total_used_base']
         
         if not simulated_usage.empty and 'ingredient' in simulated_usage.columns:
             simulated_usage_filtered = simulated_usage[simulated_usage['date'] <= current_date].copy()
             if not simulated_usage_filtered.empty:
-                simulated_usage_agg = simulated_usage_filtered.groupby('ingredient')['quantity_used'].sum().reset_index()
+                simulated_usage_agg = simulated_usage_filtered.groupby('ingredient', observed=True)['quantity_used'].sum().reset_index()
                 simulated_usage_agg.columns = ['ingredient', 'total_used_simulated']
         
         # Compare with base
@@ -2985,16 +2986,18 @@ class InventoryAnalytics:
             on='ingredient',
             how='outer',
             suffixes=('_base', '_simulated')
-        ).fillna(0)
+        )
+        # Fill everything but the merge key, which may be categorical
+        comparison = comparison.fillna({col: 0 for col in comparison.columns if col != 'ingredient'})
         
         # Add usage changes
         if not base_usage_agg.empty:
-            comparison = comparison.merge(base_usage_agg, on='ingredient', how='left').fillna(0)
+            comparison = comparison.merge(base_usage_agg, on='ingredient', how='left').fillna({'total_used_base': 0})
         else:
             comparison['total_used_base'] = 0
         
         if not simulated_usage_agg.empty:
-            comparison = comparison.merge(simulated_usage_agg, on='ingredient', how='left').fillna(0)
+            comparison = comparison.merge(simulated_usage_agg, on='ingredient', how='left').fillna({'total_used_simulated': 0})
         else:
             comparison['total_used_simulated'] = 0
         
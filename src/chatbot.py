@@ -3,9 +3,12 @@ AI Chatbot for Inventory Analytics
 Provides natural language querying of inventory data using OpenRouter API
 """
 import os
+import re
 import json
-from typing import Dict, List, Optional, Tuple, Any
+import logging
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
@@ -17,6 +20,17 @@ except ImportError:
     OPENAI_AVAILABLE = False
     openai = None
 
+logger = logging.getLogger(__name__)
+
+# Recipe columns look like "Braised Beef(g)" or "Ramen (count)": name, then optional unit in parentheses
+_INGREDIENT_UNIT_RE = re.compile(r'^([^(]*)(?:\(([^)]*)\))?')
+
+
+def _split_ingredient_unit(ingredient: str) -> Tuple[str, str]:
+    """Split a recipe column name into (ingredient name, unit) - unit is '' if absent"""
+    match = _INGREDIENT_UNIT_RE.match(ingredient)
+    return match.group(1).strip(), match.group(2) or ''
+
 class InventoryChatbot:
     """AI chatbot for querying inventory analytics"""
     
@@ -54,6 +68,8 @@ class InventoryChatbot:
             base_url="https://openrouter.ai/api/v1"
         )
         self.conversation_history = []
+        # Older turns are folded into a short summary so prompts stay small
+        self._history_summary: str = ""
         
         # System prompt describing available functions
         self.system_prompt = """You are Yun Chef, an AI assistant for a restaurant inventory management system. 
@@ -252,7 +268,7 @@ Remember: You are Yun Chef, an AI assistant that can generate creative content l
                 # Estimate revenue if price not available (use quantity as proxy)
                 filtered_sales['calculated_revenue'] = filtered_sales['quantity_sold']
             
-            revenue_by_dish = filtered_sales.groupby('menu_item').agg({
+            revenue_by_dish = filtered_sales.groupby('menu_item', observed=True).agg({
                 'calculated_revenue': 'sum',
                 'quantity_sold': 'sum'
             }).reset_index()
@@ -560,6 +576,72 @@ Remember: You are Yun Chef, an AI assistant that can generate creative content l
         Returns:
             Tuple of (response_text, chart_info_dict)
         """
+        result, data_fetched, chart_info = self._resolve_query(user_query)
+        
+        # Use LLM to generate response - it will handle both data formatting and creative content
+        if result and 'error' not in result:
+            if result.get('info') == 'greeting' or result.get('info') == 'help':
+                # Use template for greetings/help
+                response_text = self._format_response(user_query, result)
+            else:
+                # Use LLM for everything else - it will generate natural, creative responses
+                response_text = self._generate_llm_response(user_query, result, data_fetched)
+        elif result and 'error' in result:
+            # Use LLM even for errors to provide helpful context
+            response_text = self._generate_llm_response(user_query, result, False)
+        else:
+            # Unknown query - let LLM handle it with available context
+            response_text = self._generate_llm_response(user_query, {'info': 'general_query'}, False)
+        
+        # Add messages to history
+        self.conversation_history.append({"role": "user", "content": user_query})
+        self.conversation_history.append({"role": "assistant", "content": response_text})
+        self._fold_history()
+        
+        return response_text, chart_info
+    
+    def ask_stream(self, user_query: str) -> Tuple[Iterator[str], Optional[Dict]]:
+        """
+        Process user query, returning the response text as it is generated
+        
+        Returns:
+            Tuple of (iterator over response text chunks, chart_info_dict). The chart is known
+            before the LLM is called; template responses (greetings/help) and responses that
+            need post-filtering come through the iterator in one piece.
+        """
+        result, data_fetched, chart_info = self._resolve_query(user_query)
+        return self._stream_answer(user_query, result, data_fetched), chart_info
+    
+    def _stream_answer(self, user_query: str, result: Optional[Dict], data_fetched: bool) -> Iterator[str]:
+        """Yield the response to a resolved query chunk by chunk, then record the exchange"""
+        if result and 'error' not in result and result.get('info') in ('greeting', 'help'):
+            chunks = [self._format_response(user_query, result)]
+            yield chunks[0]
+        else:
+            if result and 'error' not in result:
+                data_result, has_data = result, data_fetched
+            elif result and 'error' in result:
+                data_result, has_data = result, False
+            else:
+                data_result, has_data = {'info': 'general_query'}, False
+            
+            chunks = []
+            for chunk in self._stream_llm_response(user_query, data_result, has_data):
+                chunks.append(chunk)
+                yield chunk
+        
+        # Add messages to history once the full response is known
+        self.conversation_history.append({"role": "user", "content": user_query})
+        self.conversation_history.append({"role": "assistant", "content": ''.join(chunks).strip()})
+        self._fold_history()
+    
+    def _resolve_query(self, user_query: str) -> Tuple[Optional[Dict], bool, Optional[Dict]]:
+        """
+        Route the user query to the matching analytics lookup
+        
+        Returns:
+            Tuple of (data_result, data_fetched, chart_info_dict)
+        """
         # Determine what data to fetch based on query intent
         query_lower = user_query.lower()
         chart_info = None
@@ -710,84 +792,172 @@ Remember: You are Yun Chef, an AI assistant that can generate creative content l
                 # For unclear queries, let LLM try to understand and help
                 result = {'info': 'general_query'}
         
-        # Use LLM to generate response - it will handle both data formatting and creative content
-        if result and 'error' not in result:
-            if result.get('info') == 'greeting' or result.get('info') == 'help':
-                # Use template for greetings/help
-                response_text = self._format_response(user_query, result)
-            else:
-                # Use LLM for everything else - it will generate natural, creative responses
-                response_text = self._generate_llm_response(user_query, result, data_fetched)
-        elif result and 'error' in result:
-            # Use LLM even for errors to provide helpful context
-            response_text = self._generate_llm_response(user_query, result, False)
-        else:
-            # Unknown query - let LLM handle it with available context
-            response_text = self._generate_llm_response(user_query, {'info': 'general_query'}, False)
+        return result, data_fetched, chart_info
+    
+    def _fold_history(self, max_turns: int = 4, max_chars: int = 200, max_summary_chars: int = 1200):
+        """Fold the oldest user/assistant pairs into the running history summary
         
-        # Add messages to history
-        self.conversation_history.append({"role": "user", "content": user_query})
-        self.conversation_history.append({"role": "assistant", "content": response_text})
+        Keeps at most `max_turns` raw messages in conversation_history; anything older is
+        truncated to `max_chars` per message and appended to self._history_summary.
+        """
+        while len(self.conversation_history) > max_turns:
+            oldest = self.conversation_history[:2]
+            self.conversation_history = self.conversation_history[2:]
+            
+            parts = []
+            for msg in oldest:
+                content = ' '.join(str(msg.get('content', '')).split())
+                if len(content) > max_chars:
+                    content = content[:max_chars].rstrip() + '...'
+                role = 'User' if msg.get('role') == 'user' else 'Assistant'
+                parts.append(f"{role}: {content}")
+            
+            entry = '- ' + ' | '.join(parts)
+            self._history_summary = f"{self._history_summary}\n{entry}".strip() if self._history_summary else entry
         
-        return response_text, chart_info
+        # Drop the oldest summary lines once the summary itself grows too large
+        while len(self._history_summary) > max_summary_chars and '\n' in self._history_summary:
+            self._history_summary = self._history_summary.split('\n', 1)[1]
     
     def _generate_llm_response(self, user_query: str, data_result: Dict, has_data: bool = True) -> str:
         """Generate natural language response using OpenRouter API"""
         try:
-            # Build the prompt based on what data we have
-            if data_result.get('info') == 'general_query':
-                # No specific data - let LLM answer based on its knowledge and context
-                user_content = f"""User question: {user_query}
+            messages = self._build_llm_messages(user_query, data_result, has_data)
+            max_tokens = self._max_tokens_for(data_result)
+            
+            # Call OpenRouter API with higher token limit for creative content
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.8,  # Slightly higher for more creative responses
+                max_tokens=max_tokens
+            )
+            
+            response_text = response.choices[0].message.content.strip()
+            if getattr(response.choices[0], 'finish_reason', None) == 'length':
+                logger.warning("LLM answer hit the %d token limit and was cut off", max_tokens)
+            
+            # Post-process to remove unwanted information about dishes that can't be made
+            if 'can_make_items' in data_result:
+                response_text = self._filter_unwanted_content(response_text)
+            
+            return response_text
+            
+        except Exception as e:
+            return self._llm_fallback_response(user_query, data_result, has_data, e)
+    
+    def _stream_llm_response(self, user_query: str, data_result: Dict, has_data: bool = True) -> Iterator[str]:
+        """Stream natural language response from OpenRouter API chunk by chunk"""
+        # Menu viability responses are filtered line by line after generation, so they can't be streamed
+        if 'can_make_items' in data_result:
+            yield self._generate_llm_response(user_query, data_result, has_data)
+            return
+        
+        streamed_any = False
+        try:
+            messages = self._build_llm_messages(user_query, data_result, has_data)
+            max_tokens = self._max_tokens_for(data_result)
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.8,
+                max_tokens=max_tokens,
+                stream=True
+            )
+            
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if content:
+                    streamed_any = True
+                    yield content
+                if getattr(chunk.choices[0], 'finish_reason', None) == 'length':
+                    logger.warning("Streamed LLM answer hit the %d token limit and was cut off", max_tokens)
+        
+        except Exception as e:
+            # Only fall back if nothing was sent yet - otherwise the partial answer stands
+            if not streamed_any:
+                yield self._llm_fallback_response(user_query, data_result, has_data, e)
+    
+    def _max_tokens_for(self, data_result: Dict) -> int:
+        """Pick the completion token budget for the kind of answer expected"""
+        if 'menu_item' in data_result and 'ingredients' in data_result:
+            return 800  # More tokens for recipes and detailed instructions
+        if 'metric' in data_result:
+            # "Top N ingredients" lists: a line per item (name, quantity, unit) plus a short explanation
+            return max(400, 150 + 40 * len(data_result.get('data', [])))
+        if 'can_make_items' in data_result or data_result.get('info') == 'general_query':
+            return 500  # Dish lists and open-ended questions
+        # Revenue by dish, reorder recommendations and inventory status list every matching row,
+        # so the answer needs room for each of them
+        rows = sum(
+            len(data_result[key]) for key in ('data', 'low_stock_items', 'reorder_items')
+            if isinstance(data_result.get(key), (list, pd.DataFrame))
+        )
+        return max(300, 150 + 40 * rows)
+    
+    def _llm_fallback_response(self, user_query: str, data_result: Dict, has_data: bool, error: Exception) -> str:
+        """Fallback to template response if LLM fails"""
+        error_msg = f"Error generating response: {str(error)}"
+        if has_data:
+            return self._format_response(user_query, data_result)
+        else:
+            return f"I apologize, but I encountered an error: {error_msg}. Please try rephrasing your question."
+    
+    def _build_llm_messages(self, user_query: str, data_result: Dict, has_data: bool = True) -> List[Dict]:
+        """Build the chat messages sent to the LLM for a query and its data"""
+        # Build the prompt based on what data we have
+        if data_result.get('info') == 'general_query':
+            # No specific data - let LLM answer based on its knowledge and context
+            user_content = f"""User question: {user_query}
 
 You are helping with a restaurant inventory management system. Answer the user's question helpfully and naturally. If you need specific data that wasn't provided, explain what information would be helpful."""
+        
+        elif 'menu_item' in data_result and 'ingredients' in data_result:
+            # Recipe query - provide ingredients and ask LLM to generate cooking instructions
+            dish_name = data_result.get('menu_item', 'Unknown')
+            ingredients = data_result.get('ingredients', {})
             
-            elif 'menu_item' in data_result and 'ingredients' in data_result:
-                # Recipe query - provide ingredients and ask LLM to generate cooking instructions
-                dish_name = data_result.get('menu_item', 'Unknown')
-                ingredients = data_result.get('ingredients', {})
-                
-                user_content = f"""User is asking about making {dish_name}. Here are the ingredients available:
+            user_content = f"""User is asking about making {dish_name}. Here are the ingredients available:
 
 """
-                for ingredient, quantity in ingredients.items():
-                    # Clean ingredient name
-                    ing_name = ingredient.split('(')[0].strip()
-                    unit = ''
-                    if '(' in ingredient and ')' in ingredient:
-                        unit = ingredient[ingredient.find('(')+1:ingredient.find(')')]
-                    if unit:
-                        user_content += f"- {ing_name}: {quantity} {unit}\n"
-                    else:
-                        user_content += f"- {ing_name}: {quantity}\n"
-                
-                user_content += f"""
+            lines = []
+            for ingredient, quantity in ingredients.items():
+                # Clean ingredient name
+                ing_name, unit = _split_ingredient_unit(ingredient)
+                lines.append(f"- {ing_name}: {quantity} {unit}" if unit else f"- {ing_name}: {quantity}")
+            if lines:
+                user_content += '\n'.join(lines) + '\n'
+            
+            user_content += f"""
 Based on these ingredients, please provide:
 1. A clear list of all ingredients with their quantities
 2. Step-by-step cooking instructions for making {dish_name}
 3. Any helpful cooking tips (temperature, timing, techniques) based on the dish type
 
 Be creative and practical - generate reasonable cooking instructions even if you don't have the exact recipe. Use your knowledge of cooking techniques."""
+        
+        elif 'can_make_items' in data_result or 'viability_score' in data_result:
+            # Menu viability query - format specially for "what can I make" questions
+            can_make = data_result.get('can_make_items', [])
+            viability_score = data_result.get('viability_score', 0)
             
-            elif 'can_make_items' in data_result or 'viability_score' in data_result:
-                # Menu viability query - format specially for "what can I make" questions
-                can_make = data_result.get('can_make_items', [])
-                viability_score = data_result.get('viability_score', 0)
-                
-                user_content = f"""User question: {user_query}
+            user_content = f"""User question: {user_query}
 
 Based on current inventory, here is what can be made:
 
 Dishes that CAN be made ({len(can_make)} dishes):"""
-                
-                if can_make:
-                    for item in can_make:
-                        servings = item.get('servings_possible', 0)
-                        dish_name = item.get('menu_item', 'Unknown')
-                        user_content += f"\n- {dish_name}: {servings} servings possible"
-                else:
-                    user_content += "\n- None (no dishes can be made with current inventory)"
-                
-                user_content += f"""
+            
+            if can_make:
+                for item in can_make:
+                    servings = item.get('servings_possible', 0)
+                    dish_name = item.get('menu_item', 'Unknown')
+                    user_content += f"\n- {dish_name}: {servings} servings possible"
+            else:
+                user_content += "\n- None (no dishes can be made with current inventory)"
+            
+            user_content += f"""
 
 CRITICAL INSTRUCTIONS:
 - The user asked "what can I make" - they ONLY want to know what dishes they CAN make
@@ -802,22 +972,22 @@ CRITICAL INSTRUCTIONS:
 - Optionally end with a brief follow-up suggestion like "Would you like cooking instructions?" or "Need help with anything else?"
 
 Your response should start directly with the dishes that can be made, nothing else."""
+        
+        elif has_data:
+            # Data-driven query - provide data and ask for natural response
+            data_summary = self._compact_for_prompt(data_result)
+            period_info = data_result.get('period_note', '')
             
-            elif has_data:
-                # Data-driven query - provide data and ask for natural response
-                data_summary = json.dumps(data_result, indent=2, default=str)
-                period_info = data_result.get('period_note', '')
-                
-                # Check if there's an error
-                if 'error' in data_result:
-                    error_msg = data_result.get('error', 'Unknown error')
-                    user_content = f"""User question: {user_query}
+            # Check if there's an error
+            if 'error' in data_result:
+                error_msg = data_result.get('error', 'Unknown error')
+                user_content = f"""User question: {user_query}
 
 I tried to retrieve the data but encountered: {error_msg}
 
 Please provide a helpful response explaining that the data might not be available for the requested period, and suggest checking if the data has been uploaded or if a different time period might work."""
-                else:
-                    user_content = f"""User question: {user_query}
+            else:
+                user_content = f"""User question: {user_query}
 
 Here is the relevant data for {period_info}:
 {data_summary}
@@ -831,49 +1001,76 @@ CRITICAL INSTRUCTIONS:
 - If the data shows items like "All Day Menu", "Ramen", etc., these are the actual menu items/categories
 - Do NOT repeat information from previous messages - use ONLY the current data provided
 - The user asked about {period_info} - make sure your answer reflects the data for that specific period"""
-            
-            else:
-                # Error or no data
-                error_msg = data_result.get('error', 'No data available')
-                user_content = f"""User question: {user_query}
+        
+        else:
+            # Error or no data
+            error_msg = data_result.get('error', 'No data available')
+            user_content = f"""User question: {user_query}
 
 I encountered an issue: {error_msg}
 
 Please provide a helpful response explaining the situation and suggesting what the user might try instead."""
+        
+        # Build messages for the API - turns folded out of conversation_history are sent as a
+        # compact summary, every message still kept there is included verbatim
+        messages = [self._build_system_message()]
+        if self._history_summary:
+            messages.append({"role": "system", "content": f"Prior context:\n{self._history_summary}"})
+        messages += [
+            *self.conversation_history,  # Recent exchanges not yet folded into the summary
+            {
+                "role": "user", 
+                "content": user_content
+            }
+        ]
+        
+        return messages
+    
+    def _compact_for_prompt(self, result: Dict) -> str:
+        """Serialize an analytics result into a compact JSON string for the LLM prompt
+        
+        Floats are rounded to 2 decimals and keys starting with '_' are skipped. Every row is
+        kept - the lookups already limit their results to what the query asked for.
+        """
+        def compact(value):
+            if isinstance(value, pd.DataFrame):
+                value = value.to_dict('records')
+            elif isinstance(value, pd.Series):
+                value = value.to_dict()
             
-            # Build messages for the API
-            messages = [
-                {"role": "system", "content": self.system_prompt},
-                *self.conversation_history[-6:],  # Include last 3 exchanges for context
-                {
-                    "role": "user", 
-                    "content": user_content
-                }
-            ]
-            
-            # Call OpenRouter API with higher token limit for creative content
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.8,  # Slightly higher for more creative responses
-                max_tokens=800  # More tokens for recipes and detailed instructions
-            )
-            
-            response_text = response.choices[0].message.content.strip()
-            
-            # Post-process to remove unwanted information about dishes that can't be made
-            if 'can_make_items' in data_result:
-                response_text = self._filter_unwanted_content(response_text)
-            
-            return response_text
-            
-        except Exception as e:
-            # Fallback to template response if LLM fails
-            error_msg = f"Error generating response: {str(e)}"
-            if has_data:
-                return self._format_response(user_query, data_result)
-            else:
-                return f"I apologize, but I encountered an error: {error_msg}. Please try rephrasing your question."
+            if isinstance(value, dict):
+                return {str(k): compact(v) for k, v in value.items() if not str(k).startswith('_')}
+            if isinstance(value, (list, tuple)):
+                return [compact(v) for v in value]
+            if isinstance(value, (bool, np.bool_)):
+                return bool(value)
+            if isinstance(value, (int, np.integer)):
+                return int(value)
+            if isinstance(value, (float, np.floating)):
+                return round(float(value), 2) if np.isfinite(value) else None
+            if value is None or isinstance(value, str):
+                return value
+            return str(value)
+        
+        return json.dumps(compact(result), separators=(',', ':'))
+    
+    def _build_system_message(self) -> Dict:
+        """Build the static system message, marked cacheable where the provider supports it
+        
+        OpenAI models cache repeated prompt prefixes automatically as long as the system prompt
+        is sent first and byte-for-byte identical. Anthropic models routed through OpenRouter
+        only reuse the prefix when it carries an explicit cache_control breakpoint.
+        """
+        if self.model.startswith('anthropic/'):
+            return {
+                "role": "system",
+                "content": [{
+                    "type": "text",
+                    "text": self.system_prompt,
+                    "cache_control": {"type": "ephemeral"}
+                }]
+            }
+        return {"role": "system", "content": self.system_prompt}
     
     def _filter_unwanted_content(self, text: str) -> str:
         """Filter out unwanted information about dishes that can't be made"""
@@ -1098,22 +1295,17 @@ Please ask: What is the recipe for [dish name]? or How do I make [dish name]?"""
             ingredients = result.get('ingredients', {})
             ingredient_count = result.get('ingredient_count', 0)
             
-            response = f"**Recipe for {menu_item}**\n\n"
-            response += f"Ingredients needed ({ingredient_count} total):\n\n"
+            lines = [
+                f"**Recipe for {menu_item}**\n",
+                f"Ingredients needed ({ingredient_count} total):\n"
+            ]
             
             for ingredient, quantity in ingredients.items():
                 # Format ingredient name (remove units if in parentheses)
-                ing_name = ingredient.split('(')[0].strip()
-                unit = ''
-                if '(' in ingredient and ')' in ingredient:
-                    unit = ingredient[ingredient.find('('):ingredient.find(')')+1]
-                
-                if unit:
-                    response += f"• {ing_name}: {quantity} {unit}\n"
-                else:
-                    response += f"• {ing_name}: {quantity}\n"
+                ing_name, unit = _split_ingredient_unit(ingredient)
+                lines.append(f"• {ing_name}: {quantity} ({unit})" if unit else f"• {ing_name}: {quantity}")
             
-            return response
+            return '\n'.join(lines) + '\n'
         
         else:
             # Generic response
@@ -1122,4 +1314,5 @@ Please ask: What is the recipe for [dish name]? or How do I make [dish name]?"""
     def clear_history(self):
         """Clear conversation history"""
         self.conversation_history = []
+        self._history_summary = ""
 
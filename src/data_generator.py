@@ -5,30 +5,61 @@ Creates realistic sample data for testing and demonstration
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from types import MappingProxyType
 import random
 
 
 class SampleDataGenerator:
     """Generate sample restaurant inventory data"""
     
+    # Static reference data - allocated once at class level instead of on every call
+    ingredients = (
+        'Rice', 'Soy Sauce', 'Ginger', 'Garlic', 'Green Onions',
+        'Sesame Oil', 'Chicken Breast', 'Pork Belly', 'Tofu', 'Noodles',
+        'Bok Choy', 'Carrots', 'Broccoli', 'Mushrooms', 'Bell Peppers',
+        'Chili Peppers', 'Scallions', 'Cilantro', 'Bean Sprouts', 'Cabbage',
+        'Eggs', 'Shrimp', 'Beef', 'Fish Sauce', 'Oyster Sauce',
+        'Shaoxing Wine', 'Cornstarch', 'Sugar', 'Salt', 'Pepper'
+    )
+    
+    menu_items = (
+        'Kung Pao Chicken', 'Mapo Tofu', 'Sweet and Sour Pork',
+        'General Tso Chicken', 'Beef and Broccoli', 'Hunan Beef',
+        'Szechuan Shrimp', 'Vegetable Lo Mein', 'Fried Rice',
+        'Hot and Sour Soup', 'Egg Drop Soup', 'Wonton Soup',
+        'Peking Duck', 'Orange Chicken', 'Honey Walnut Shrimp'
+    )
+    
+    # Units and categories line up index-for-index with `ingredients`
+    _UNITS = (
+        'lb', 'oz', 'lb', 'oz', 'bunch', 'oz', 'lb', 'lb', 'lb', 'lb',
+        'bunch', 'lb', 'lb', 'lb', 'lb', 'oz', 'bunch', 'bunch', 'lb', 'lb',
+        'dozen', 'lb', 'lb', 'oz', 'oz', 'oz', 'oz', 'lb', 'oz', 'oz'
+    )
+    
+    _CATEGORIES = (
+        'Grain', 'Sauce', 'Vegetable', 'Vegetable', 'Vegetable', 'Oil', 'Protein', 'Protein',
+        'Protein', 'Grain', 'Vegetable', 'Vegetable', 'Vegetable', 'Vegetable', 'Vegetable',
+        'Vegetable', 'Vegetable', 'Vegetable', 'Vegetable', 'Vegetable', 'Protein', 'Protein',
+        'Protein', 'Sauce', 'Sauce', 'Sauce', 'Starch', 'Spice', 'Spice', 'Spice'
+    )
+    
+    # Define storage types for ingredients
+    _STORAGE_TYPES = ('refrigerated', 'frozen', 'shelf')
+    _STORAGE_MAP = MappingProxyType({
+        'Rice': 'shelf', 'Soy Sauce': 'shelf', 'Ginger': 'refrigerated', 
+        'Garlic': 'shelf', 'Green Onions': 'refrigerated', 'Sesame Oil': 'shelf',
+        'Chicken Breast': 'refrigerated', 'Pork Belly': 'refrigerated', 'Tofu': 'refrigerated',
+        'Noodles': 'shelf', 'Bok Choy': 'refrigerated', 'Carrots': 'refrigerated',
+        'Broccoli': 'refrigerated', 'Mushrooms': 'refrigerated', 'Bell Peppers': 'refrigerated',
+        'Chili Peppers': 'refrigerated', 'Scallions': 'refrigerated', 'Cilantro': 'refrigerated',
+        'Bean Sprouts': 'refrigerated', 'Cabbage': 'refrigerated', 'Eggs': 'refrigerated',
+        'Shrimp': 'frozen', 'Beef': 'refrigerated', 'Fish Sauce': 'shelf',
+        'Oyster Sauce': 'shelf', 'Shaoxing Wine': 'shelf', 'Cornstarch': 'shelf',
+        'Sugar': 'shelf', 'Salt': 'shelf', 'Pepper': 'shelf'
+    })
+    
     def __init__(self):
-        self.ingredients = [
-            'Rice', 'Soy Sauce', 'Ginger', 'Garlic', 'Green Onions',
-            'Sesame Oil', 'Chicken Breast', 'Pork Belly', 'Tofu', 'Noodles',
-            'Bok Choy', 'Carrots', 'Broccoli', 'Mushrooms', 'Bell Peppers',
-            'Chili Peppers', 'Scallions', 'Cilantro', 'Bean Sprouts', 'Cabbage',
-            'Eggs', 'Shrimp', 'Beef', 'Fish Sauce', 'Oyster Sauce',
-            'Shaoxing Wine', 'Cornstarch', 'Sugar', 'Salt', 'Pepper'
-        ]
-        
-        self.menu_items = [
-            'Kung Pao Chicken', 'Mapo Tofu', 'Sweet and Sour Pork',
-            'General Tso Chicken', 'Beef and Broccoli', 'Hunan Beef',
-            'Szechuan Shrimp', 'Vegetable Lo Mein', 'Fried Rice',
-            'Hot and Sour Soup', 'Egg Drop Soup', 'Wonton Soup',
-            'Peking Duck', 'Orange Chicken', 'Honey Walnut Shrimp'
-        ]
-        
         # Menu item to ingredient mappings (simplified)
         self.menu_ingredients = {
             'Kung Pao Chicken': ['Chicken Breast', 'Peanuts', 'Chili Peppers', 'Soy Sauce', 'Ginger', 'Garlic'],
@@ -43,34 +74,14 @@ class SampleDataGenerator:
     
     def generate_ingredients(self, n: int = 30) -> pd.DataFrame:
         """Generate ingredient master list"""
-        # Define storage types for ingredients
-        storage_types = ['refrigerated', 'frozen', 'shelf']
-        ingredient_storage_map = {
-            'Rice': 'shelf', 'Soy Sauce': 'shelf', 'Ginger': 'refrigerated', 
-            'Garlic': 'shelf', 'Green Onions': 'refrigerated', 'Sesame Oil': 'shelf',
-            'Chicken Breast': 'refrigerated', 'Pork Belly': 'refrigerated', 'Tofu': 'refrigerated',
-            'Noodles': 'shelf', 'Bok Choy': 'refrigerated', 'Carrots': 'refrigerated',
-            'Broccoli': 'refrigerated', 'Mushrooms': 'refrigerated', 'Bell Peppers': 'refrigerated',
-            'Chili Peppers': 'refrigerated', 'Scallions': 'refrigerated', 'Cilantro': 'refrigerated',
-            'Bean Sprouts': 'refrigerated', 'Cabbage': 'refrigerated', 'Eggs': 'refrigerated',
-            'Shrimp': 'frozen', 'Beef': 'refrigerated', 'Fish Sauce': 'shelf',
-            'Oyster Sauce': 'shelf', 'Shaoxing Wine': 'shelf', 'Cornstarch': 'shelf',
-            'Sugar': 'shelf', 'Salt': 'shelf', 'Pepper': 'shelf'
-        }
-        
         data = {
             'ingredient': self.ingredients[:n],
-            'unit': ['lb', 'oz', 'lb', 'oz', 'bunch', 'oz', 'lb', 'lb', 'lb', 'lb',
-                    'bunch', 'lb', 'lb', 'lb', 'lb', 'oz', 'bunch', 'bunch', 'lb', 'lb',
-                    'dozen', 'lb', 'lb', 'oz', 'oz', 'oz', 'oz', 'lb', 'oz', 'oz'][:n],
-            'category': ['Grain', 'Sauce', 'Vegetable', 'Vegetable', 'Vegetable', 'Oil', 'Protein', 'Protein',
-                        'Protein', 'Grain', 'Vegetable', 'Vegetable', 'Vegetable', 'Vegetable', 'Vegetable',
-                        'Vegetable', 'Vegetable', 'Vegetable', 'Vegetable', 'Vegetable', 'Protein', 'Protein',
-                        'Protein', 'Sauce', 'Sauce', 'Sauce', 'Starch', 'Spice', 'Spice', 'Spice'][:n],
+            'unit': self._UNITS[:n],
+            'category': self._CATEGORIES[:n],
             'shelf_life_days': np.random.randint(3, 30, n),
             'min_stock_level': np.random.randint(10, 50, n),
             'max_stock_level': np.random.randint(100, 500, n),
-            'storage_type': [ingredient_storage_map.get(ing, random.choice(storage_types)) for ing in self.ingredients[:n]],
+            'storage_type': [self._STORAGE_MAP.get(ing, random.choice(self._STORAGE_TYPES)) for ing in self.ingredients[:n]],
             'storage_space_units': np.random.uniform(0.1, 2.0, n).round(2)  # cubic feet
         }
         return pd.DataFrame(data)
@@ -2,35 +2,389 @@
 Data Loading and Processing Module
 Handles loading and preprocessing of restaurant inventory data
 """
+import glob
+import hashlib
+import importlib
+import importlib.util
+import logging
 import pandas as pd
 import numpy as np
+from pandas.api.types import is_numeric_dtype
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
-import warnings
-warnings.filterwarnings('ignore')
+from typing import Dict, Iterator, List, Optional
 
-# Try to import MSY loader
+logger = logging.getLogger(__name__)
+
+
+def _try_import(name: str, package: Optional[str] = None):
+    """
+    Import a module if it can be found, or return None.
+    
+    Probes with find_spec first so a missing module doesn't cost a raised ImportError.
+    """
+    if name.startswith('.') and not package:
+        # Imported as a top-level module - there is no package to be relative to
+        return None
+    try:
+        if importlib.util.find_spec(name, package) is None:
+            return None
+        return importlib.import_module(name, package)
+    except (ImportError, ValueError):
+        # Found but failed to import (e.g. one of its own dependencies is missing)
+        return None
+
+
+# Sibling modules, imported relative to the package when there is one
+_msy_module = _try_import('.msy_data_loader', __package__) or _try_import('msy_data_loader')
+MSYDataLoader = getattr(_msy_module, 'MSYDataLoader', None)
+MSY_LOADER_AVAILABLE = MSYDataLoader is not None
+
+_preprocessor_module = _try_import('.data_preprocessor', __package__) or _try_import('data_preprocessor')
+DataPreprocessor = getattr(_preprocessor_module, 'DataPreprocessor', None)
+PREPROCESSOR_AVAILABLE = DataPreprocessor is not None
+
+# Try to import polars for faster CSV parsing (optional)
 try:
-    from .msy_data_loader import MSYDataLoader
-    MSY_LOADER_AVAILABLE = True
+    import polars as pl
+    POLARS_AVAILABLE = True
 except ImportError:
-    try:
-        from msy_data_loader import MSYDataLoader
-        MSY_LOADER_AVAILABLE = True
-    except ImportError:
-        MSY_LOADER_AVAILABLE = False
+    POLARS_AVAILABLE = False
+    pl = None
 
-# Try to import DataPreprocessor
+# Try to import pyarrow for pandas' multi-threaded CSV engine (optional)
 try:
-    from .data_preprocessor import DataPreprocessor
-    PREPROCESSOR_AVAILABLE = True
+    import pyarrow
+    PYARROW_AVAILABLE = True
 except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Expected dtypes for known columns of each CSV - columns missing from a file are ignored
+PURCHASES_DTYPES = {
+    'ingredient': 'object',
+    'quantity': 'float64',
+    'total_cost': 'float64',
+    'cost_per_unit': 'float64',
+    'price': 'float64',
+    'supplier': 'object',
+}
+SHIPMENTS_DTYPES = {
+    'ingredient': 'object',
+    'quantity': 'float64',
+    'supplier': 'object',
+}
+INGREDIENTS_DTYPES = {
+    'ingredient': 'object',
+    'unit': 'object',
+    'category': 'object',
+    'storage_type': 'object',
+    'storage_space_units': 'float64',
+}
+SALES_DTYPES = {
+    'menu_item': 'object',
+    'revenue': 'float64',
+    'price': 'float64',
+}
+USAGE_DTYPES = {
+    'ingredient': 'object',
+    'menu_item': 'object',
+    'quantity_used': 'float64',
+}
+
+# Columns read from each CSV: every accepted alias plus the columns used downstream.
+# Anything else in the file is skipped at parse time.
+ALLOWED_COLUMNS = {
+    'purchases': frozenset([
+        'date', 'purchase_date', 'Date', 'Purchase Date',
+        'ingredient', 'Ingredient', 'ingredient_name', 'item',
+        'quantity', 'qty', 'Quantity', 'Qty', 'amount',
+        'total_cost', 'Total Cost', 'cost', 'Cost', 'price', 'Price', 'cost_per_unit',
+        'unit', 'supplier',
+    ]),
+    'shipments': frozenset([
+        'date', 'ship_date', 'Date', 'Ship Date', 'expected_date', 'Expected Date',
+        'ingredient', 'quantity', 'quantity_ordered', 'quantity_received',
+        'unit', 'Unit of shipment', 'frequency', 'num_shipments',
+        'status', 'delay_days', 'supplier',
+    ]),
+    'ingredients': frozenset([
+        'ingredient', 'name', 'Name', 'ingredient_name', 'Ingredient Name',
+        'unit', 'category', 'shelf_life_days', 'min_stock_level', 'max_stock_level',
+        'storage_type', 'storage_space_units', 'cost_per_unit', 'supplier',
+    ]),
+    'sales': frozenset([
+        'date', 'sale_date', 'Date', 'Sale Date',
+        'menu_item', 'item_name', 'quantity_sold', 'revenue', 'price',
+    ]),
+    'usage': frozenset([
+        'date', 'usage_date', 'Date', 'Usage Date',
+        'ingredient', 'menu_item', 'Menu Item', 'menuItem', 'dish', 'Dish',
+        'quantity_used', 'unit',
+    ]),
+}
+
+# Alternative column names accepted for each canonical column, in priority order
+PURCHASES_ALIASES = {
+    'date': ('purchase_date', 'Date', 'Purchase Date'),
+    'quantity': ('qty', 'Quantity', 'Qty', 'amount'),
+    'total_cost': ('Total Cost', 'cost', 'Cost'),
+    'ingredient': ('Ingredient', 'ingredient_name', 'item'),
+}
+# Unit price columns fill a missing total_cost too (after the aliases above), but are copied rather
+# than renamed so the price column itself stays in the data
+PURCHASES_PRICE_COLUMNS = ('price', 'Price')
+SHIPMENTS_ALIASES = {
+    'date': ('ship_date', 'Date', 'Ship Date'),
+    'expected_date': ('Expected Date',),
+}
+INGREDIENTS_ALIASES = {
+    'ingredient': ('name', 'Name', 'ingredient_name', 'Ingredient Name'),
+}
+SALES_ALIASES = {
+    'date': ('sale_date', 'Date', 'Sale Date'),
+}
+USAGE_ALIASES = {
+    'date': ('usage_date', 'Date', 'Usage Date'),
+    'menu_item': ('Menu Item', 'menuItem', 'dish', 'Dish'),
+}
+
+# On-disk Feather copies of cleaned CSVs, kept under data_dir. Bump the version whenever
+# DataLoader's own cleaning changes so sidecars written by older code are ignored; changes to
+# the preprocessor are covered by DataPreprocessor.fingerprint() in the sidecar name.
+FEATHER_CACHE_DIR = '.cache'
+FEATHER_CACHE_VERSION = 5
+
+# Low-cardinality name columns stored as categoricals, matching DataPreprocessor output
+CATEGORICAL_COLUMNS = ['ingredient', 'supplier', 'menu_item', 'frequency', 'unit']
+
+_ALIASES_BY_KIND = {
+    'purchases': PURCHASES_ALIASES,
+    'shipments': SHIPMENTS_ALIASES,
+    'ingredients': INGREDIENTS_ALIASES,
+    'sales': SALES_ALIASES,
+    'usage': USAGE_ALIASES,
+}
+
+_DTYPES_BY_KIND = {
+    'purchases': PURCHASES_DTYPES,
+    'shipments': SHIPMENTS_DTYPES,
+    'ingredients': INGREDIENTS_DTYPES,
+    'sales': SALES_DTYPES,
+    'usage': USAGE_DTYPES,
+}
+
+# Files this small are checked for having no data rows before going through the parser
+HEADER_ONLY_MAX_BYTES = 4096
+
+# Files larger than this are streamed in chunks instead of being parsed in one piece
+STREAM_THRESHOLD_BYTES = 100 * 1024 * 1024
+CSV_CHUNK_SIZE = 50_000
+
+
+def _csv_columns(path, kind: str) -> List[str]:
+    """Columns of a CSV worth parsing for a file kind - the whole header if none are known"""
+    header = pd.read_csv(path, nrows=0).columns
+    allowed = ALLOWED_COLUMNS[kind]
+    return [col for col in header if col in allowed] or list(header)
+
+
+def _scan_csv_polars(path, kind: str, columns: List[str]) -> pd.DataFrame:
+    """
+    Read a CSV through one polars lazy query and hand the result to pandas.
+    
+    Projection, alias renames, numeric casts and dropping rows without a date are fused
+    into a single plan. Known columns are scanned as text and cast non-strictly, so a stray
+    bad value becomes null (like pd.to_numeric(errors='coerce')) instead of failing the read.
+    """
+    dtypes = _DTYPES_BY_KIND[kind]
+    renames = dict(_alias_plan(kind, tuple(columns)))
+    renamed = [renames.get(col, col) for col in columns]
+    overrides = {col: pl.Utf8 for col, name in zip(columns, renamed) if name in dtypes}
+    
+    lf = pl.scan_csv(path, infer_schema_length=10000, schema_overrides=overrides).select(columns)
+    if renames:
+        lf = lf.rename(renames)
+    casts = [pl.col(col).cast(pl.Float64, strict=False) for col in renamed if dtypes.get(col) == 'float64']
+    if casts:
+        lf = lf.with_columns(casts)
+    if 'date' in renamed:
+        lf = lf.filter(pl.col('date').is_not_null())
+    return lf.collect().to_pandas()
+
+
+def _read_csv(path, kind: str) -> pd.DataFrame:
+    """
+    Read a CSV file into a pandas DataFrame using the fastest available parser.
+    
+    Prefers a polars lazy scan, then pandas' pyarrow engine, then the default C engine.
+    Only the columns listed in ALLOWED_COLUMNS for the kind are parsed, and known columns
+    use the kind's dtypes instead of being inferred.
+    """
+    # Peek at the header so unused columns are never parsed
+    usecols = _csv_columns(path, kind)
+    
+    if POLARS_AVAILABLE:
+        try:
+            return _scan_csv_polars(path, kind, usecols)
+        except Exception:
+            # Fall back to pandas for files polars can't parse (e.g. ragged rows)
+            pass
+    
     try:
-        from data_preprocessor import DataPreprocessor
-        PREPROCESSOR_AVAILABLE = True
-    except ImportError:
-        PREPROCESSOR_AVAILABLE = False
-        DataPreprocessor = None
+        return pd.read_csv(path, engine='pyarrow' if PYARROW_AVAILABLE else 'c', dtype=_DTYPES_BY_KIND[kind], usecols=usecols)
+    except ValueError:
+        # Values don't fit the expected schema (e.g. "12 lbs" in a quantity column) - let pandas infer types
+        return pd.read_csv(path, usecols=usecols)
+
+
+def _iter_csv(path, kind: str, chunksize: int = CSV_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Yield a CSV file as DataFrame chunks so peak memory is bounded by one chunk.
+    
+    Files up to STREAM_THRESHOLD_BYTES are read in one piece with the fastest parser
+    (see _read_csv). Larger files are streamed through pandas' C reader.
+    """
+    if os.path.getsize(path) <= STREAM_THRESHOLD_BYTES:
+        yield _read_csv(path, kind)
+        return
+    
+    usecols = _csv_columns(path, kind)
+    
+    # Only pin string columns - a numeric column with a stray bad value can't be retried mid-stream
+    str_dtypes = {col: dtype for col, dtype in _DTYPES_BY_KIND[kind].items() if dtype == 'object'}
+    empty = True
+    for chunk in pd.read_csv(path, dtype=str_dtypes, usecols=usecols, chunksize=chunksize):
+        empty = False
+        yield chunk
+    if empty:
+        yield pd.read_csv(path, nrows=0, usecols=usecols)
+
+
+def _is_header_only(path) -> bool:
+    """True for empty files and small files with nothing below the header line"""
+    size = os.path.getsize(path)
+    if size == 0:
+        return True
+    if size > HEADER_ONLY_MAX_BYTES:
+        return False
+    with open(path, 'rb') as f:
+        lines = [line for line in f.read().splitlines() if line.strip()]
+    return len(lines) <= 1
+
+
+def _empty_frame(path, kind: str) -> pd.DataFrame:
+    """Empty DataFrame with a header-only file's columns under their canonical names and types"""
+    if os.path.getsize(path) == 0:
+        return pd.DataFrame()
+    columns = _csv_columns(path, kind)
+    renames = dict(_alias_plan(kind, tuple(columns)))
+    df = pd.DataFrame(columns=[renames.get(col, col) for col in columns])
+    dtypes = {col: _DTYPES_BY_KIND[kind].get(col, 'object') for col in df.columns}
+    for col in ('date', 'expected_date'):
+        if col in dtypes:
+            dtypes[col] = 'datetime64[ns]'
+    return df.astype(dtypes)
+
+
+def _concat_chunks(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate cleaned chunks once, returning a single chunk unchanged"""
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks, ignore_index=True, copy=False)
+
+
+def _to_categorical(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Store low-cardinality name columns as categoricals.
+    
+    Applied after chunks are concatenated so every chunk shares one set of categories.
+    """
+    for col in columns:
+        if col in df.columns and df[col].dtype == object:
+            df[col] = df[col].astype('category')
+    return df
+
+
+@lru_cache(maxsize=64)
+def _alias_plan(kind: str, columns: tuple) -> tuple:
+    """
+    Resolve the (alias, canonical) renames for one file kind and header.
+    
+    Cached because a deployment's files keep the same headers from load to load and chunk to chunk.
+    """
+    present = set(columns)
+    plan = []
+    for target, candidates in _ALIASES_BY_KIND[kind].items():
+        if target in present:
+            continue
+        alias = next((col for col in candidates if col in present), None)
+        if alias is not None:
+            plan.append((alias, target))
+    return tuple(plan)
+
+
+def _rename_aliases(df: pd.DataFrame, kind: str) -> set:
+    """
+    Rename the first alias present for each missing canonical column, in place.
+    
+    Returns the canonical names that were filled from an alias.
+    """
+    plan = _alias_plan(kind, tuple(df.columns))
+    if plan:
+        df.rename(columns=dict(plan), inplace=True)
+    return {target for _, target in plan}
+
+
+def _to_numeric(values: pd.Series) -> pd.Series:
+    """Coerce a column to numbers, skipping the pass when the CSV reader already typed it"""
+    if is_numeric_dtype(values):
+        return values
+    return pd.to_numeric(values, errors='coerce')
+
+
+_NS_PER_DAY = 24 * 3600 * 10**9
+_NAT_I8 = np.iinfo('i8').min
+
+
+def _days_between(end: pd.Series, start: pd.Series) -> np.ndarray:
+    """
+    Whole days from start to end (floored, like .dt.days), computed on int64 nanosecond views.
+    
+    Returns int64, or float64 with NaN where either side is NaT.
+    """
+    end_ns = np.asarray(end, dtype='datetime64[ns]').view('i8')
+    start_ns = np.asarray(start, dtype='datetime64[ns]').view('i8')
+    days = np.subtract(end_ns, start_ns) // _NS_PER_DAY
+    missing = (end_ns == _NAT_I8) | (start_ns == _NAT_I8)
+    if missing.any():
+        days = days.astype('float64')
+        days[missing] = np.nan
+    return days
+
+
+def _file_stamp(path) -> tuple:
+    """(mtime_ns, size) of a file, used to tell whether a cached load is still current"""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _to_datetime(values: pd.Series) -> pd.Series:
+    """
+    Parse a column to datetime, assuming ISO 8601 (the common case for exported logs).
+    
+    Entries that aren't ISO formatted are re-parsed individually instead of being dropped.
+    Columns already parsed as datetime by the CSV reader are returned unchanged.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    
+    parsed = pd.to_datetime(values, errors='coerce', format='ISO8601', cache=True)
+    missed = parsed.isna() & values.notna()
+    if missed.any():
+        parsed[missed] = pd.to_datetime(values[missed], errors='coerce', format='mixed', cache=True)
+    return parsed
 
 
 class DataLoader:
@@ -44,110 +398,181 @@ class DataLoader:
             self.preprocessor = DataPreprocessor()
         else:
             self.preprocessor = None
+        # Cleaned DataFrames by (path, kind), invalidated when the file's mtime or size changes
+        self._frame_cache = {}
+        # Sidecars hold preprocessed frames, so they are only reused under the same preprocessing
+        self._preprocessor_tag = self.preprocessor.fingerprint() if self.preprocessor is not None else 'raw'
         
     def load_purchases(self, file_path: Optional[str] = None) -> pd.DataFrame:
         """Load monthly purchase logs"""
         if file_path:
-            df = pd.read_csv(file_path)
+            purchase_file = file_path
         else:
             # Try to find purchase file
             purchase_file = self.data_dir / "purchases.csv"
-            if purchase_file.exists():
-                df = pd.read_csv(purchase_file)
-            else:
+            if not purchase_file.exists():
                 return None
-        return self._clean_purchases(df)
+        if _is_header_only(purchase_file):
+            return _empty_frame(purchase_file, 'purchases')
+        df = self._from_cache(purchase_file, 'purchases')
+        if df is not None:
+            return df
+        chunks = _iter_csv(purchase_file, 'purchases')
+        df = _to_categorical(_concat_chunks([self._clean_purchases(chunk) for chunk in chunks]), CATEGORICAL_COLUMNS)
+        return self._to_cache(purchase_file, 'purchases', df)
     
     def load_shipments(self, file_path: Optional[str] = None) -> pd.DataFrame:
         """Load shipment details"""
         if file_path:
-            df = pd.read_csv(file_path)
+            shipment_file = file_path
         else:
             shipment_file = self.data_dir / "shipments.csv"
-            if shipment_file.exists():
-                df = pd.read_csv(shipment_file)
-            else:
+            if not shipment_file.exists():
                 return None
-        return self._clean_shipments(df)
+        if _is_header_only(shipment_file):
+            return _empty_frame(shipment_file, 'shipments')
+        df = self._from_cache(shipment_file, 'shipments')
+        if df is not None:
+            return df
+        chunks = _iter_csv(shipment_file, 'shipments')
+        df = _to_categorical(_concat_chunks([self._clean_shipments(chunk) for chunk in chunks]), CATEGORICAL_COLUMNS)
+        return self._to_cache(shipment_file, 'shipments', df)
     
     def load_ingredients(self, file_path: Optional[str] = None) -> pd.DataFrame:
         """Load ingredient master list"""
         if file_path:
-            df = pd.read_csv(file_path)
+            ingredient_file = file_path
         else:
             ingredient_file = self.data_dir / "ingredients.csv"
-            if ingredient_file.exists():
-                df = pd.read_csv(ingredient_file)
-            else:
+            if not ingredient_file.exists():
                 return None
-        return self._clean_ingredients(df)
+        if _is_header_only(ingredient_file):
+            return _empty_frame(ingredient_file, 'ingredients')
+        df = self._from_cache(ingredient_file, 'ingredients')
+        if df is not None:
+            return df
+        chunks = _iter_csv(ingredient_file, 'ingredients')
+        # Ingredients are de-duplicated across rows, so clean them after concatenating
+        df = _to_categorical(self._clean_ingredients(_concat_chunks(list(chunks))), CATEGORICAL_COLUMNS)
+        return self._to_cache(ingredient_file, 'ingredients', df)
     
     def load_sales(self, file_path: Optional[str] = None) -> pd.DataFrame:
         """Load menu item sales data"""
         if file_path:
-            df = pd.read_csv(file_path)
+            sales_file = file_path
         else:
             sales_file = self.data_dir / "sales.csv"
-            if sales_file.exists():
-                df = pd.read_csv(sales_file)
-            else:
+            if not sales_file.exists():
                 return None
-        return self._clean_sales(df)
+        if _is_header_only(sales_file):
+            return _empty_frame(sales_file, 'sales')
+        df = self._from_cache(sales_file, 'sales')
+        if df is not None:
+            return df
+        chunks = _iter_csv(sales_file, 'sales')
+        df = _to_categorical(_concat_chunks([self._clean_sales(chunk) for chunk in chunks]), CATEGORICAL_COLUMNS)
+        return self._to_cache(sales_file, 'sales', df)
     
     def load_usage(self, file_path: Optional[str] = None) -> pd.DataFrame:
         """Load ingredient usage data"""
         if file_path:
-            df = pd.read_csv(file_path)
+            usage_file = file_path
         else:
             usage_file = self.data_dir / "usage.csv"
-            if usage_file.exists():
-                df = pd.read_csv(usage_file)
-            else:
+            if not usage_file.exists():
                 return None
-        return self._clean_usage(df)
+        if _is_header_only(usage_file):
+            return _empty_frame(usage_file, 'usage')
+        df = self._from_cache(usage_file, 'usage')
+        if df is not None:
+            return df
+        chunks = _iter_csv(usage_file, 'usage')
+        df = _to_categorical(_concat_chunks([self._clean_usage(chunk) for chunk in chunks]), CATEGORICAL_COLUMNS)
+        return self._to_cache(usage_file, 'usage', df)
+    
+    def _from_cache(self, path, kind: str) -> Optional[pd.DataFrame]:
+        """
+        Return a copy of a previously loaded file, or None if it changed since it was loaded.
+        
+        Checks the in-process cache first, then the Feather sidecar written by an earlier run.
+        """
+        stamp = _file_stamp(path)
+        entry = self._frame_cache.get((str(path), kind))
+        if entry is not None and entry[0] == stamp:
+            return entry[1].copy()
+        
+        if PYARROW_AVAILABLE:
+            sidecar = self._sidecar_path(path, kind, stamp)
+            if sidecar.exists():
+                try:
+                    df = pd.read_feather(sidecar)
+                except Exception:
+                    # Unreadable sidecar (e.g. a partial write) - re-parse the CSV
+                    return None
+                self._frame_cache[(str(path), kind)] = (stamp, df)
+                return df.copy()
+        return None
+    
+    def _to_cache(self, path, kind: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Remember a cleaned file keyed on its mtime and size, returning a copy for the caller"""
+        stamp = _file_stamp(path)
+        # Row labels left over from dropped rows carry no meaning, and Feather needs a default index
+        df = df.reset_index(drop=True)
+        self._frame_cache[(str(path), kind)] = (stamp, df)
+        if PYARROW_AVAILABLE:
+            self._write_sidecar(path, kind, stamp, df)
+        return df.copy()
+    
+    def _sidecar_prefix(self, path, kind: str) -> str:
+        """Sidecar name prefix shared by every cached version of one CSV file"""
+        # Hash of the resolved path, so files with the same name in other directories don't collide
+        path_hash = hashlib.sha1(str(Path(path).resolve()).encode('utf-8')).hexdigest()[:12]
+        return f"{Path(path).stem}-{path_hash}.{kind}"
+    
+    def _sidecar_path(self, path, kind: str, stamp: tuple) -> Path:
+        """Feather sidecar for a CSV, named after its mtime, size and preprocessing so edits invalidate it"""
+        mtime_ns, size = stamp
+        name = f"{self._sidecar_prefix(path, kind)}.v{FEATHER_CACHE_VERSION}.{self._preprocessor_tag}.{mtime_ns}-{size}.feather"
+        return self.data_dir / FEATHER_CACHE_DIR / name
+    
+    def _write_sidecar(self, path, kind: str, stamp: tuple, df: pd.DataFrame):
+        """Write the Feather sidecar for a cleaned CSV and remove stale ones for the same file"""
+        sidecar = self._sidecar_path(path, kind, stamp)
+        try:
+            sidecar.parent.mkdir(exist_ok=True)
+            tmp_path = sidecar.with_suffix('.tmp')
+            df.to_feather(tmp_path)
+            os.replace(tmp_path, sidecar)
+            for stale in sidecar.parent.glob(f"{glob.escape(self._sidecar_prefix(path, kind))}.*.feather"):
+                if stale != sidecar:
+                    stale.unlink()
+        except Exception as e:
+            # The sidecar is only an optimization (e.g. read-only data dir, mixed-type columns)
+            logger.warning("Could not write cache file for %s: %s", path, e)
     
     def _clean_purchases(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean purchase data"""
-        # Standardize date column
-        date_cols = ['date', 'purchase_date', 'Date', 'Purchase Date']
-        for col in date_cols:
-            if col in df.columns:
-                df['date'] = pd.to_datetime(df[col], errors='coerce')
-                break
-        
-        # Standardize quantity and cost columns
-        if 'quantity' not in df.columns:
-            qty_cols = ['qty', 'Quantity', 'Qty', 'amount']
-            for col in qty_cols:
-                if col in df.columns:
-                    df['quantity'] = pd.to_numeric(df[col], errors='coerce')
-                    break
+        # Standardize date, quantity, cost and ingredient columns
+        renamed = _rename_aliases(df, 'purchases')
+        if 'date' in df.columns:
+            df['date'] = _to_datetime(df['date'])
+        if 'quantity' in renamed:
+            df['quantity'] = _to_numeric(df['quantity'])
         
         # Handle cost columns - prioritize total_cost
-        if 'total_cost' not in df.columns:
-            cost_cols = ['total_cost', 'Total Cost', 'cost', 'Cost', 'price', 'Price']
-            cost_found = False
-            for col in cost_cols:
-                if col in df.columns:
-                    df['total_cost'] = pd.to_numeric(df[col], errors='coerce')
-                    cost_found = True
-                    break
-            
-            # If we have cost_per_unit and quantity, calculate total_cost
-            if not cost_found and 'cost_per_unit' in df.columns and 'quantity' in df.columns:
-                df['total_cost'] = pd.to_numeric(df['cost_per_unit'], errors='coerce') * pd.to_numeric(df['quantity'], errors='coerce')
-            elif not cost_found and 'price' in df.columns and 'quantity' in df.columns:
-                df['total_cost'] = pd.to_numeric(df['price'], errors='coerce') * pd.to_numeric(df['quantity'], errors='coerce')
+        if 'total_cost' in renamed:
+            df['total_cost'] = _to_numeric(df['total_cost'])
+        elif 'total_cost' not in df.columns:
+            price_col = next((col for col in PURCHASES_PRICE_COLUMNS if col in df.columns), None)
+            if price_col is not None:
+                df['total_cost'] = _to_numeric(df[price_col])
+            elif 'quantity' in df.columns and 'cost_per_unit' in df.columns:
+                # If we have cost_per_unit and quantity, calculate total_cost
+                qty = _to_numeric(df['quantity']).to_numpy(dtype='float64', na_value=np.nan)
+                unit_cost = _to_numeric(df['cost_per_unit']).to_numpy(dtype='float64', na_value=np.nan)
+                df['total_cost'] = np.multiply(qty, unit_cost)
         
-        # Ensure we have ingredient column
-        if 'ingredient' not in df.columns:
-            ing_cols = ['ingredient', 'Ingredient', 'ingredient_name', 'item']
-            for col in ing_cols:
-                if col in df.columns:
-                    df['ingredient'] = df[col]
-                    break
-        
-        df = df.dropna(subset=['date'])
+        df.dropna(subset=['date'], inplace=True)
         
         # Apply preprocessor if available
         if self.preprocessor is not None:
@@ -157,19 +582,19 @@ class DataLoader:
     
     def _clean_shipments(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean shipment data"""
-        date_cols = ['date', 'ship_date', 'Date', 'Ship Date', 'expected_date', 'Expected Date']
-        for col in date_cols:
-            if col in df.columns:
-                df['date'] = pd.to_datetime(df[col], errors='coerce')
-                break
+        _rename_aliases(df, 'shipments')
+        if 'date' not in df.columns and 'expected_date' in df.columns:
+            # No ship date - fall back to the expected date, keeping both columns
+            df['date'] = df['expected_date']
+        if 'date' in df.columns:
+            df['date'] = _to_datetime(df['date'])
         
         # Handle delay calculations
-        if 'expected_date' in df.columns or 'Expected Date' in df.columns:
-            exp_col = 'expected_date' if 'expected_date' in df.columns else 'Expected Date'
-            df['expected_date'] = pd.to_datetime(df[exp_col], errors='coerce')
-            df['delay_days'] = (df['date'] - df['expected_date']).dt.days
+        if 'expected_date' in df.columns:
+            df['expected_date'] = _to_datetime(df['expected_date'])
+            df['delay_days'] = _days_between(df['date'], df['expected_date'])
         
-        df = df.dropna(subset=['date'])
+        df.dropna(subset=['date'], inplace=True)
         
         # Apply preprocessor if available
         if self.preprocessor is not None:
@@ -180,12 +605,7 @@ class DataLoader:
     def _clean_ingredients(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean ingredient data"""
         # Ensure we have ingredient names and units
-        if 'ingredient' not in df.columns:
-            name_cols = ['name', 'Name', 'ingredient_name', 'Ingredient Name']
-            for col in name_cols:
-                if col in df.columns:
-                    df['ingredient'] = df[col]
-                    break
+        _rename_aliases(df, 'ingredients')
         
         # Apply preprocessor if available
         if self.preprocessor is not None:
@@ -195,13 +615,11 @@ class DataLoader:
     
     def _clean_sales(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean sales data"""
-        date_cols = ['date', 'sale_date', 'Date', 'Sale Date']
-        for col in date_cols:
-            if col in df.columns:
-                df['date'] = pd.to_datetime(df[col], errors='coerce')
-                break
+        _rename_aliases(df, 'sales')
+        if 'date' in df.columns:
+            df['date'] = _to_datetime(df['date'])
         
-        df = df.dropna(subset=['date'])
+        df.dropna(subset=['date'], inplace=True)
         
         # Apply preprocessor if available
         if self.preprocessor is not None:
@@ -211,21 +629,12 @@ class DataLoader:
     
     def _clean_usage(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean usage data"""
-        date_cols = ['date', 'usage_date', 'Date', 'Usage Date']
-        for col in date_cols:
-            if col in df.columns:
-                df['date'] = pd.to_datetime(df[col], errors='coerce')
-                break
-        
-        # Ensure menu_item column is preserved if it exists
-        # Standardize menu_item column names
-        menu_item_cols = ['menu_item', 'Menu Item', 'menuItem', 'dish', 'Dish']
-        for col in menu_item_cols:
-            if col in df.columns and col != 'menu_item':
-                df['menu_item'] = df[col]
-                break
+        # Standardize date and menu_item column names - menu_item is kept for recipe mapping
+        _rename_aliases(df, 'usage')
+        if 'date' in df.columns:
+            df['date'] = _to_datetime(df['date'])
         
-        df = df.dropna(subset=['date'])
+        df.dropna(subset=['date'], inplace=True)
         
         # Apply preprocessor if available
         if self.preprocessor is not None:
@@ -258,18 +667,21 @@ class DataLoader:
                             if key not in data:
                                 data[key] = pd.DataFrame()
                         
-                        # Apply preprocessing to all data (especially shipments for unit standardization)
-                        if self.preprocessor:
-                            if 'shipments' in data and not data['shipments'].empty:
-                                data['shipments'] = self.preprocessor.preprocess_shipments(data['shipments'])
-                            if 'purchases' in data and not data['purchases'].empty:
-                                data['purchases'] = self.preprocessor.preprocess_purchases(data['purchases'])
-                            if 'usage' in data and not data['usage'].empty:
-                                data['usage'] = self.preprocessor.preprocess_usage(data['usage'])
-                            if 'sales' in data and not data['sales'].empty:
-                                data['sales'] = self.preprocessor.preprocess_sales(data['sales'])
-                            if 'ingredients' in data and not data['ingredients'].empty:
-                                data['ingredients'] = self.preprocessor.preprocess_ingredients(data['ingredients'])
+                        # Apply preprocessing to all data (especially shipments for unit standardization),
+                        # skipping frames the MSY loader already ran through the preprocessor
+                        preprocessor = self.preprocessor
+                        if preprocessor:
+                            jobs = (
+                                ('shipments', preprocessor.preprocess_shipments),
+                                ('purchases', preprocessor.preprocess_purchases),
+                                ('usage', preprocessor.preprocess_usage),
+                                ('sales', preprocessor.preprocess_sales),
+                                ('ingredients', preprocessor.preprocess_ingredients),
+                            )
+                            for key, preprocess in jobs:
+                                frame = data.get(key)
+                                if frame is not None and not frame.empty and not frame.attrs.get('preprocessed'):
+                                    data[key] = preprocess(frame)
                         
                         return data
             except Exception as e:
@@ -280,35 +692,22 @@ class DataLoader:
         
         # Fall back to standard loading only if MSY loader not available or failed completely
         # This handles cases where user has standard CSV files instead of MSY format
-        purchases = self.load_purchases()
-        if purchases is not None and not purchases.empty:
-            data['purchases'] = purchases
-        else:
-            data['purchases'] = pd.DataFrame()
-        
-        shipments = self.load_shipments()
-        if shipments is not None and not shipments.empty:
-            data['shipments'] = shipments
-        else:
-            data['shipments'] = pd.DataFrame()
+        # List the data directory once instead of checking each file separately
+        present = {entry.name: entry.path for entry in os.scandir(self.data_dir) if entry.is_file()}
         
-        ingredients = self.load_ingredients()
-        if ingredients is not None and not ingredients.empty:
-            data['ingredients'] = ingredients
-        else:
-            data['ingredients'] = pd.DataFrame()
-        
-        sales = self.load_sales()
-        if sales is not None and not sales.empty:
-            data['sales'] = sales
-        else:
-            data['sales'] = pd.DataFrame()
-        
-        usage = self.load_usage()
-        if usage is not None and not usage.empty:
-            data['usage'] = usage
-        else:
-            data['usage'] = pd.DataFrame()
+        # Each file is independent and the CSV parsers release the GIL, so read them concurrently
+        kinds = ['purchases', 'shipments', 'ingredients', 'sales', 'usage']
+        with ThreadPoolExecutor(max_workers=len(kinds)) as executor:
+            futures = {
+                kind: executor.submit(getattr(self, f'load_{kind}'), present[f'{kind}.csv'])
+                for kind in kinds if f'{kind}.csv' in present
+            }
+            for kind in kinds:
+                df = futures[kind].result() if kind in futures else None
+                if df is not None and not df.empty:
+                    data[kind] = df
+                else:
+                    data[kind] = pd.DataFrame()
         
         return data
 
@@ -2,12 +2,48 @@
 Data Preprocessing Module
 Centralized data cleaning, normalization, and validation for inventory management system
 """
+import bisect
+import hashlib
+import logging
+import re
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-import warnings
-warnings.filterwarnings('ignore')
+
+logger = logging.getLogger(__name__)
+
+# Try to import pyahocorasick for single-pass substring matching of ingredient names (optional)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+# Unit and descriptor suffixes stripped from ingredient names that have no canonical mapping
+NAME_SUFFIXES = (
+    ' (g)', '(g)', ' (G)', '(G)',
+    ' (count)', '(count)', ' (Count)', '(Count)',
+    ' used', ' Used', ' USED',
+    ' used (g)', ' Used (g)',
+    ' (kg)', '(kg)', ' (KG)', '(KG)',
+    ' (lb)', '(lb)', ' (LB)', '(LB)',
+    ' (oz)', '(oz)', ' (OZ)', '(OZ)',
+    ' (pcs)', '(pcs)', ' (PCS)', '(PCS)',
+)
+# All suffixes in one pattern, longest first so ' used (g)' wins over ' used'
+_NAME_SUFFIX_RE = re.compile('|'.join(re.escape(suffix) for suffix in sorted(NAME_SUFFIXES, key=len, reverse=True)))
+_NAME_AND_RE = re.compile(' (?:and|And|AND) ')
+
+# Bump whenever cleaning logic changes in a way the mapping tables don't show, so cached
+# frames cleaned by older code are not reused (see DataPreprocessor.fingerprint)
+PREPROCESSOR_VERSION = 1
+
+# Low-cardinality name columns stored as categoricals once preprocessing is done
+CATEGORICAL_COLUMNS = ('ingredient', 'supplier', 'menu_item', 'frequency', 'unit')
 
 
 class DataPreprocessor:
@@ -78,8 +114,38 @@ class DataPreprocessor:
             'flour (g)': 'Flour',  # Recipe matrix format
         }
         
+        # Lowercased variations in mapping order, for the substring scan
+        self._variations_lower = [(variation.lower(), canonical) for variation, canonical in self.ingredient_mappings.items()]
+        # All variations in one string, so the first variation containing a name is one str.find away
+        self._variation_text = '\x00'.join(variation_lower for variation_lower, _ in self._variations_lower)
+        self._variation_starts = list(accumulate((len(variation_lower) + 1 for variation_lower, _ in self._variations_lower[:-1]), initial=0))
+        # Automaton over the variations, so every variation contained in a name is found in one walk
+        self._variation_automaton = None
+        if AHOCORASICK_AVAILABLE and self._variations_lower:
+            self._variation_automaton = ahocorasick.Automaton()
+            for index, (variation_lower, _) in enumerate(self._variations_lower):
+                if variation_lower not in self._variation_automaton:
+                    self._variation_automaton.add_word(variation_lower, index)
+            self._variation_automaton.make_automaton()
+        # Names equal to a variation resolve with one dict lookup. Each value comes from the same
+        # ordered scan, so an earlier substring match keeps precedence over the exact entry.
+        self._exact_map = {}
+        for variation_lower, _ in self._variations_lower:
+            if variation_lower not in self._exact_map:
+                self._exact_map[variation_lower] = self._match_mapping(variation_lower)
+        # Raw name -> normalized name, filled lazily since the same names recur across every frame
+        self._norm_cache = {}
+        
         # Count-based ingredient keywords
         self.count_keywords = ['wing', 'ramen', 'egg', 'count', 'pcs', 'piece', 'roll', 'whole', 'noodle']
+        # Keywords that mark an ingredient name (rather than a unit) as count-based
+        self.count_ingredient_keywords = ['wing', 'ramen', 'egg', 'noodle', 'chicken wing', 'chicken wings']
+        # Compiled once so each check is a single regex search instead of one scan per keyword
+        self._count_unit_re = re.compile('|'.join(re.escape(keyword) for keyword in self.count_keywords))
+        self._count_ingredient_re = re.compile('|'.join(re.escape(keyword) for keyword in self.count_ingredient_keywords))
+        
+        # Unit substrings that mark a unit as non-weight
+        self.non_weight_unit_keywords = ['roll', 'piece', 'pcs', 'pc', 'egg', 'whole', 'onion', 'count', 'rolls', 'pieces', 'eggs', 'onions']
         
         # Standard unit mappings
         # Non-weight units (rolls, pieces, eggs, etc.) are mapped to 'units'
@@ -112,25 +178,57 @@ class DataPreprocessor:
             'onions': 'units',
         }
     
-    def normalize_ingredient_name(self, name: str) -> str:
+    def fingerprint(self) -> str:
         """
-        Normalize ingredient name for consistent matching.
+        Short hash of PREPROCESSOR_VERSION and the name and unit tables used for cleaning.
+        
+        Changes whenever the version is bumped or a mapping, suffix or keyword list is edited,
+        so on-disk caches of preprocessed frames can be keyed on it.
+        """
+        state = repr((
+            PREPROCESSOR_VERSION,
+            NAME_SUFFIXES,
+            list(self.ingredient_mappings.items()),
+            self.count_keywords,
+            self.count_ingredient_keywords,
+            self.non_weight_unit_keywords,
+            list(self.unit_mappings.items()),
+        ))
+        return hashlib.sha1(state.encode('utf-8')).hexdigest()[:12]
+    
+    def _match_mapping(self, name_lower: str) -> Optional[str]:
+        """
+        Scan the canonical mappings in order for a lowercase name.
         
         Args:
-            name: Raw ingredient name
+            name_lower: Stripped, lowercase ingredient name
             
         Returns:
-            Normalized ingredient name
+            Canonical name of the first matching variation, or None
         """
-        if pd.isna(name) or name == '':
-            return ""
-        
-        name = str(name).strip()
+        if self._variation_automaton is None or not name_lower or '\x00' in name_lower:
+            return self._scan_mapping(name_lower)
+        
+        # A variation matches when it contains the name or the name contains it; the earliest
+        # variation in mapping order wins, as in the sequential scan
+        position = self._variation_text.find(name_lower)
+        best = bisect.bisect_right(self._variation_starts, position) - 1 if position >= 0 else None
+        for _, index in self._variation_automaton.iter(name_lower):
+            if best is None or index < best:
+                best = index
+        return self._variations_lower[best][1] if best is not None else None
+    
+    def _scan_mapping(self, name_lower: str) -> Optional[str]:
+        """
+        Sequential fallback for _match_mapping when pyahocorasick is not installed.
         
-        # Check canonical mappings first
-        name_lower = name.lower()
-        for variation, canonical in self.ingredient_mappings.items():
-            variation_lower = variation.lower()
+        Args:
+            name_lower: Stripped, lowercase ingredient name
+            
+        Returns:
+            Canonical name of the first matching variation, or None
+        """
+        for variation_lower, canonical in self._variations_lower:
             # Exact match first (most precise)
             if name_lower == variation_lower:
                 return canonical
@@ -141,24 +239,49 @@ class DataPreprocessor:
             # Also handle reverse: if name is longer and contains variation (e.g., "braised chicken used (g)" contains "braised chicken (g)")
             if len(name_lower) > len(variation_lower) and variation_lower in name_lower:
                 return canonical
+        return None
+    
+    def normalize_ingredient_name(self, name: str) -> str:
+        """
+        Normalize ingredient name for consistent matching.
+        
+        Args:
+            name: Raw ingredient name
+            
+        Returns:
+            Normalized ingredient name
+        """
+        if pd.isna(name) or name == '':
+            return ""
+        
+        normalized = self._norm_cache.get(name)
+        if normalized is None:
+            normalized = self._norm_cache[name] = self._normalize_name(str(name).strip())
+        return normalized
+    
+    def _normalize_name(self, name: str) -> str:
+        """
+        Uncached body of normalize_ingredient_name.
+        
+        Args:
+            name: Stripped ingredient name
+            
+        Returns:
+            Normalized ingredient name
+        """
+        # Check canonical mappings first - exact variations are a dict lookup, anything else is scanned
+        name_lower = name.lower()
+        canonical = self._exact_map.get(name_lower)
+        if canonical is None:
+            canonical = self._match_mapping(name_lower)
+        if canonical is not None:
+            return canonical
         
         # Remove common units and descriptors
-        name_cleaned = name
-        suffixes = [
-            ' (g)', '(g)', ' (G)', '(G)',
-            ' (count)', '(count)', ' (Count)', '(Count)',
-            ' used', ' Used', ' USED',
-            ' used (g)', ' Used (g)',
-            ' (kg)', '(kg)', ' (KG)', '(KG)',
-            ' (lb)', '(lb)', ' (LB)', '(LB)',
-            ' (oz)', '(oz)', ' (OZ)', '(OZ)',
-            ' (pcs)', '(pcs)', ' (PCS)', '(PCS)',
-        ]
-        for suffix in suffixes:
-            name_cleaned = name_cleaned.replace(suffix, '')
+        name_cleaned = _NAME_SUFFIX_RE.sub('', name)
         
         # Normalize compound names (handle "Peas + Carrot", "Peas and Carrot")
-        name_cleaned = name_cleaned.replace(' and ', '+').replace(' And ', '+').replace(' AND ', '+')
+        name_cleaned = _NAME_AND_RE.sub('+', name_cleaned)
         
         # Remove extra whitespace
         name_cleaned = ' '.join(name_cleaned.split())
@@ -170,6 +293,51 @@ class DataPreprocessor:
         
         return name_cleaned if name_cleaned else name
     
+    def _normalize_series(self, names: pd.Series) -> pd.Series:
+        """
+        Vectorized normalize_ingredient_name for a column of ingredient names.
+        
+        Exact variations are resolved with one Series.map over the lowercased column. The
+        remaining distinct names are scanned against the mappings, and names with no mapping
+        are cleaned up with vectorized string ops.
+        
+        Args:
+            names: Series of raw ingredient names
+            
+        Returns:
+            Series of normalized names (empty string for missing names)
+        """
+        names = names.astype(object)
+        missing = names.isna() | (names == '')
+        normalized = names.astype(str).str.strip().str.lower().map(self._exact_map)
+        residual = normalized.isna() & ~missing
+        if residual.any():
+            residual_names = names[residual]
+            uniques = pd.Series(residual_names.unique(), dtype=object)
+            stripped = uniques.astype(str).str.strip()
+            resolved = stripped.str.lower().map(self._match_mapping)
+            unmatched = resolved.isna()
+            if unmatched.any():
+                resolved[unmatched] = self._clean_names(stripped[unmatched])
+            normalized[residual] = residual_names.map(dict(zip(uniques, resolved)))
+        normalized[missing] = ""
+        return normalized
+    
+    def _clean_names(self, names: pd.Series) -> pd.Series:
+        """
+        Vectorized cleanup of stripped ingredient names that have no canonical mapping.
+        
+        Args:
+            names: Series of stripped ingredient names
+            
+        Returns:
+            Series with unit suffixes removed, compounds joined with '+', and words capitalized
+        """
+        cleaned = names.str.replace(_NAME_SUFFIX_RE, '', regex=True)
+        cleaned = cleaned.str.replace(_NAME_AND_RE, '+', regex=True)
+        cleaned = cleaned.str.split().map(lambda words: ' '.join(word.capitalize() for word in words))
+        return cleaned.where(cleaned != '', names)
+    
     def is_count_based_ingredient(self, ingredient: str, unit: str = None) -> bool:
         """
         Check if ingredient is count-based (pieces, rolls, eggs, ramen, noodles) vs weight-based.
@@ -184,16 +352,52 @@ class DataPreprocessor:
         ingredient_lower = str(ingredient).lower() if ingredient else ""
         unit_lower = str(unit).lower() if unit and pd.notna(unit) else ""
         
-        # Check unit for count keywords
-        if any(keyword in unit_lower for keyword in self.count_keywords):
-            return True
+        # Check unit, then ingredient name, for count keywords
+        return bool(self._count_unit_re.search(unit_lower) or self._count_ingredient_re.search(ingredient_lower))
+    
+    def _count_based_mask(self, ingredients: pd.Series) -> pd.Series:
+        """
+        Vectorized is_count_based_ingredient for a column of ingredient names (no unit).
         
-        # Check ingredient name for count keywords
-        count_ingredient_keywords = ['wing', 'ramen', 'egg', 'noodle', 'chicken wing', 'chicken wings']
-        if any(keyword in ingredient_lower for keyword in count_ingredient_keywords):
-            return True
+        Args:
+            ingredients: Series of ingredient names
+            
+        Returns:
+            Boolean Series, True where the ingredient is count-based
+        """
+        return ingredients.astype(str).str.lower().str.contains(self._count_ingredient_re, na=False)
+    
+    def _coerce_quantities(self, quantities: pd.Series, ingredients: Optional[pd.Series] = None,
+                           round_all: bool = False) -> np.ndarray:
+        """
+        Coerce a quantity column to numbers (missing/invalid -> 0) and round whole-number rows.
         
-        return False
+        Args:
+            quantities: Raw quantity Series
+            ingredients: Ingredient names aligned with quantities; count-based rows are rounded
+            round_all: Round every row (e.g. sales, which are always whole numbers)
+            
+        Returns:
+            Numeric quantity array aligned with quantities
+        """
+        values = pd.to_numeric(quantities, errors='coerce').fillna(0).to_numpy()
+        if round_all:
+            return np.round(values)
+        if ingredients is not None:
+            return np.where(self._count_based_mask(ingredients).to_numpy(), np.round(values), values)
+        return values
+    
+    def _coerce_non_negative(self, values: pd.Series) -> np.ndarray:
+        """
+        Coerce a cost/price column to numbers, with missing/invalid values as 0 and negatives clipped to 0.
+        
+        Args:
+            values: Raw numeric Series
+            
+        Returns:
+            Non-negative numeric array aligned with values
+        """
+        return np.maximum(pd.to_numeric(values, errors='coerce').fillna(0).to_numpy(), 0)
     
     def detect_and_standardize_unit(self, ingredient: str, unit: str = None, column_name: str = None) -> str:
         """
@@ -232,8 +436,7 @@ class DataPreprocessor:
                 return self.unit_mappings[unit_lower]
             
             # Check if it's a non-weight unit (contains count keywords) - be more aggressive
-            non_weight_keywords = ['roll', 'piece', 'pcs', 'pc', 'egg', 'whole', 'onion', 'count', 'rolls', 'pieces', 'eggs', 'onions']
-            if any(keyword in unit_lower for keyword in non_weight_keywords):
+            if any(keyword in unit_lower for keyword in self.non_weight_unit_keywords):
                 return 'units'
             
             # Check if it's a weight unit
@@ -263,6 +466,67 @@ class DataPreprocessor:
         # Default to 'units' if not weight-based and no unit detected
         return 'units'
     
+    def _standardize_unit_series(self, units: pd.Series) -> pd.Series:
+        """
+        Vectorized detect_and_standardize_unit for a unit column (no column-name hint).
+        
+        Without a column name the standardized unit depends only on the unit itself: mapped
+        units first, then non-weight keywords, then the standard weight units, else 'units'.
+        
+        Args:
+            units: Series of raw unit strings
+            
+        Returns:
+            Series of standardized units
+        """
+        unit_lower = units.astype(str).str.lower().str.strip()
+        mapped = unit_lower.map(self.unit_mappings)
+        non_weight_pattern = '|'.join(re.escape(keyword) for keyword in self.non_weight_unit_keywords)
+        conditions = [
+            mapped.notna(),
+            unit_lower.str.contains(non_weight_pattern, regex=True, na=False),
+            unit_lower.isin(['g', 'kg', 'lb', 'oz']),
+        ]
+        standardized = np.select(conditions, [mapped, 'units', unit_lower], default='units')
+        return pd.Series(standardized, index=units.index, dtype=object)
+    
+    def _to_datetime(self, values: pd.Series) -> pd.Series:
+        """
+        Parse a column to datetime, skipping columns that are already datetime64.
+        
+        ISO 8601 strings are parsed in one pass; entries in any other format are re-parsed
+        individually instead of being dropped.
+        
+        Args:
+            values: Raw date column
+            
+        Returns:
+            datetime64 Series with NaT for unparseable entries
+        """
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return values
+        
+        parsed = pd.to_datetime(values, errors='coerce', format='ISO8601', cache=True)
+        missed = parsed.isna() & values.notna()
+        if missed.any():
+            parsed[missed] = pd.to_datetime(values[missed], errors='coerce', format='mixed', cache=True)
+        return parsed
+    
+    def _to_categorical(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert the low-cardinality name columns of a preprocessed DataFrame to categoricals.
+        
+        Args:
+            df: Preprocessed DataFrame
+            
+        Returns:
+            DataFrame with CATEGORICAL_COLUMNS stored as category dtype
+        """
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns and (df[col].dtype == object or isinstance(df[col].dtype, pd.StringDtype)):
+                df[col] = df[col].astype('category')
+        return df
+    
     def preprocess_purchases(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Preprocess purchases DataFrame.
@@ -276,82 +540,55 @@ class DataPreprocessor:
         if df.empty:
             return df.copy()
         
-        df = df.copy()
+        # Shallow copy: every column below is replaced by assignment, never modified in place
+        df = df.copy(deep=False)
         
         # Normalize ingredient names
         if 'ingredient' in df.columns:
             # First, handle combined ingredients like "Peas+Carrot" by splitting them
-            combined_rows = []
-            rows_to_drop = []
+            ingredient_lower = df['ingredient'].astype(str).str.strip().str.lower()
+            combined = ingredient_lower.str.contains('peas', regex=False) & ingredient_lower.str.contains('carrot', regex=False)
             
-            for idx, row in df.iterrows():
-                ingredient = str(row.get('ingredient', '')).strip()
-                ingredient_lower = ingredient.lower()
+            if combined.any():
+                # Split into separate Peas and Carrot rows, 50/50 (or we could use recipe
+                # proportions, but 50/50 is simplest), one Peas/Carrot pair per combined row
+                positions = np.repeat(np.flatnonzero(combined.to_numpy()), 2)
+                # One take builds every split row; the index is discarded by the concat below. The
+                # shallow copy detaches it from df so the column updates aren't chained assignments
+                split_df = df.iloc[positions].copy(deep=False)
+                split_df['ingredient'] = np.tile(['Peas', 'Carrot'], len(positions) // 2)
+                split_df['quantity'] = pd.to_numeric(split_df.get('quantity', 0), errors='coerce') / 2
+                if 'total_cost' in split_df.columns:
+                    split_df['total_cost'] = pd.to_numeric(split_df['total_cost'], errors='coerce') / 2
                 
-                # Check if this is a combined ingredient that should be split
-                if 'peas' in ingredient_lower and 'carrot' in ingredient_lower:
-                    # Split into separate Peas and Carrot rows
-                    quantity = pd.to_numeric(row.get('quantity', 0), errors='coerce') or 0
-                    # Split 50/50 (or we could use recipe proportions, but 50/50 is simplest)
-                    peas_qty = quantity / 2
-                    carrot_qty = quantity / 2
-                    
-                    # Create new rows for Peas and Carrot
-                    peas_row = row.copy()
-                    peas_row['ingredient'] = 'Peas'
-                    peas_row['quantity'] = peas_qty
-                    if 'total_cost' in row:
-                        peas_row['total_cost'] = row.get('total_cost', 0) / 2
-                    combined_rows.append(peas_row)
-                    
-                    carrot_row = row.copy()
-                    carrot_row['ingredient'] = 'Carrot'
-                    carrot_row['quantity'] = carrot_qty
-                    if 'total_cost' in row:
-                        carrot_row['total_cost'] = row.get('total_cost', 0) / 2
-                    combined_rows.append(carrot_row)
-                    
-                    rows_to_drop.append(idx)
-            
-            # Add the split rows
-            if combined_rows:
-                split_df = pd.DataFrame(combined_rows)
-                df = pd.concat([df, split_df], ignore_index=True)
-                # Remove original combined rows
-                if rows_to_drop:
-                    df = df.drop(index=rows_to_drop).reset_index(drop=True)
+                # Replace the original combined rows with the split rows
+                df = pd.concat([df[~combined], split_df], ignore_index=True, copy=False)
             
             # Now normalize all ingredient names
-            df['ingredient'] = df['ingredient'].apply(self.normalize_ingredient_name)
+            df['ingredient'] = self._normalize_series(df['ingredient'])
         
         # Ensure date is datetime
         if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'], errors='coerce')
+            df['date'] = self._to_datetime(df['date'])
             # Remove rows with invalid dates
             df = df[df['date'].notna()]
         
         # Convert quantities to numeric
         if 'quantity' in df.columns:
-            df['quantity'] = pd.to_numeric(df['quantity'], errors='coerce').fillna(0)
-            # Round count-based ingredients to whole numbers
-            if 'ingredient' in df.columns:
-                df['quantity'] = df.apply(
-                    lambda row: round(row['quantity']) if self.is_count_based_ingredient(row['ingredient']) else row['quantity'],
-                    axis=1
-                )
-            # Remove rows with zero or negative quantities
-            df = df[df['quantity'] > 0]
+            # Round count-based ingredients to whole numbers, then remove rows with zero or negative quantities
+            quantity = self._coerce_quantities(df['quantity'], df.get('ingredient'))
+            df['quantity'] = quantity
+            df = df[quantity > 0]
         
         # Handle costs
         if 'total_cost' in df.columns:
-            df['total_cost'] = pd.to_numeric(df['total_cost'], errors='coerce').fillna(0)
-            df['total_cost'] = df['total_cost'].clip(lower=0)  # Ensure non-negative
+            df['total_cost'] = self._coerce_non_negative(df['total_cost'])  # Ensure non-negative
         
         # Normalize supplier names
         if 'supplier' in df.columns:
             df['supplier'] = df['supplier'].astype(str).str.strip()
         
-        return df
+        return self._to_categorical(df)
     
     def preprocess_usage(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -366,35 +603,30 @@ class DataPreprocessor:
         if df.empty:
             return df.copy()
         
-        df = df.copy()
+        # Shallow copy: every column below is replaced by assignment, never modified in place
+        df = df.copy(deep=False)
         
         # Normalize ingredient names
         if 'ingredient' in df.columns:
-            df['ingredient'] = df['ingredient'].apply(self.normalize_ingredient_name)
+            df['ingredient'] = self._normalize_series(df['ingredient'])
         
         # Ensure date is datetime
         if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'], errors='coerce')
+            df['date'] = self._to_datetime(df['date'])
             df = df[df['date'].notna()]
         
         # Convert quantities to numeric
         if 'quantity_used' in df.columns:
-            df['quantity_used'] = pd.to_numeric(df['quantity_used'], errors='coerce').fillna(0)
-            # Round count-based ingredients to whole numbers
-            if 'ingredient' in df.columns:
-                df['quantity_used'] = df.apply(
-                    lambda row: round(row['quantity_used']) if self.is_count_based_ingredient(row['ingredient']) else row['quantity_used'],
-                    axis=1
-                )
-            # Remove rows with zero or negative quantities
-            df = df[df['quantity_used'] > 0]
+            # Round count-based ingredients to whole numbers, then remove rows with zero or negative quantities
+            quantity_used = self._coerce_quantities(df['quantity_used'], df.get('ingredient'))
+            df['quantity_used'] = quantity_used
+            df = df[quantity_used > 0]
         
         # Normalize menu_item names (optional field)
         if 'menu_item' in df.columns:
-            df['menu_item'] = df['menu_item'].astype(str).str.strip()
-            df['menu_item'] = df['menu_item'].replace('nan', '')
+            df['menu_item'] = df['menu_item'].astype('string').fillna('').str.strip().astype(object)
         
-        return df
+        return self._to_categorical(df)
     
     def preprocess_sales(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -409,36 +641,38 @@ class DataPreprocessor:
         if df.empty:
             return df.copy()
         
-        df = df.copy()
+        # Shallow copy: every column below is replaced by assignment, never modified in place
+        df = df.copy(deep=False)
         
         # Ensure date is datetime
         if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'], errors='coerce')
+            df['date'] = self._to_datetime(df['date'])
             df = df[df['date'].notna()]
         
-        # Normalize menu_item names
+        # Normalize menu_item names (object categories, matching the ones read back from the Feather cache)
         if 'menu_item' in df.columns:
-            df['menu_item'] = df['menu_item'].astype(str).str.strip()
-            df['menu_item'] = df['menu_item'].replace('nan', '')
-            # Remove rows with empty menu items
-            df = df[df['menu_item'] != '']
+            menu_item = df['menu_item'].astype('string').fillna('').str.strip().astype(object).astype('category')
+            # Remove rows with empty menu items: dropping the '' category turns them into missing
+            # codes, so the filter compares integer codes instead of strings
+            if '' in menu_item.cat.categories:
+                menu_item = menu_item.cat.remove_categories([''])
+            df['menu_item'] = menu_item
+            df = df[menu_item.notna()]
         
         # Convert quantities to numeric
         if 'quantity_sold' in df.columns:
-            df['quantity_sold'] = pd.to_numeric(df['quantity_sold'], errors='coerce').fillna(0)
-            df['quantity_sold'] = df['quantity_sold'].round()  # Sales are always whole numbers
-            df = df[df['quantity_sold'] > 0]
+            quantity_sold = self._coerce_quantities(df['quantity_sold'], round_all=True)  # Sales are always whole numbers
+            df['quantity_sold'] = quantity_sold
+            df = df[quantity_sold > 0]
         
         # Handle revenue and price
         if 'revenue' in df.columns:
-            df['revenue'] = pd.to_numeric(df['revenue'], errors='coerce').fillna(0)
-            df['revenue'] = df['revenue'].clip(lower=0)
+            df['revenue'] = self._coerce_non_negative(df['revenue'])
         
         if 'price' in df.columns:
-            df['price'] = pd.to_numeric(df['price'], errors='coerce').fillna(0)
-            df['price'] = df['price'].clip(lower=0)
+            df['price'] = self._coerce_non_negative(df['price'])
         
-        return df
+        return self._to_categorical(df)
     
     def preprocess_shipments(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -453,30 +687,26 @@ class DataPreprocessor:
         if df.empty:
             return df.copy()
         
-        df = df.copy()
+        # Shallow copy: every column below is replaced by assignment, never modified in place
+        df = df.copy(deep=False)
         
         # Normalize ingredient names
         if 'ingredient' in df.columns:
-            df['ingredient'] = df['ingredient'].apply(self.normalize_ingredient_name)
+            df['ingredient'] = self._normalize_series(df['ingredient'])
         
         # Handle date if present (shipments may be frequency-based)
         if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'], errors='coerce')
+            df['date'] = self._to_datetime(df['date'])
             # Don't drop rows with missing dates (frequency-based shipments don't have dates)
         
         # Handle expected_date if present
         if 'expected_date' in df.columns:
-            df['expected_date'] = pd.to_datetime(df['expected_date'], errors='coerce')
+            df['expected_date'] = self._to_datetime(df['expected_date'])
         
         # Convert quantities to numeric
         if 'quantity' in df.columns:
-            df['quantity'] = pd.to_numeric(df['quantity'], errors='coerce').fillna(0)
             # Round count-based ingredients
-            if 'ingredient' in df.columns:
-                df['quantity'] = df.apply(
-                    lambda row: round(row['quantity']) if self.is_count_based_ingredient(row['ingredient']) else row['quantity'],
-                    axis=1
-                )
+            df['quantity'] = self._coerce_quantities(df['quantity'], df.get('ingredient'))
         
         # Normalize frequency
         if 'frequency' in df.columns:
@@ -485,13 +715,7 @@ class DataPreprocessor:
         # Normalize unit - handle both 'Unit of shipment' and 'unit' columns
         # Note: MSY loader renames 'Unit of shipment' to 'unit', so we need to handle both
         if 'Unit of shipment' in df.columns:
-            df['Unit of shipment'] = df.apply(
-                lambda row: self.detect_and_standardize_unit(
-                    row.get('ingredient', ''),
-                    row.get('Unit of shipment', '')
-                ),
-                axis=1
-            )
+            df['Unit of shipment'] = self._standardize_unit_series(df['Unit of shipment'])
             # Also create/update 'unit' column for consistency
             if 'unit' not in df.columns:
                 df['unit'] = df['Unit of shipment']
@@ -542,7 +766,7 @@ class DataPreprocessor:
             # Apply conversion
             df['unit'] = df['unit'].apply(convert_unit)
         
-        return df
+        return self._to_categorical(df)
     
     def preprocess_ingredients(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -560,26 +784,19 @@ class DataPreprocessor:
         if df.empty:
             return df.copy()
         
-        df = df.copy()
+        # Shallow copy: every column below is replaced by assignment, never modified in place
+        df = df.copy(deep=False)
         
         # Clean ingredient names (strip whitespace, but don't normalize to avoid merging distinct ingredients)
         if 'ingredient' in df.columns:
             df['ingredient'] = df['ingredient'].astype(str).str.strip()
             # Remove duplicates based on exact name match only (case-insensitive)
-            # Create a temporary column for case-insensitive comparison
-            df['_ingredient_lower'] = df['ingredient'].str.lower()
-            df = df.drop_duplicates(subset=['_ingredient_lower'], keep='first', ignore_index=True)
-            df = df.drop(columns=['_ingredient_lower'])
+            lowered = df['ingredient'].str.lower()
+            df = df.loc[~lowered.duplicated(keep='first')].reset_index(drop=True)
         
         # Standardize units
         if 'unit' in df.columns:
-            df['unit'] = df.apply(
-                lambda row: self.detect_and_standardize_unit(
-                    row.get('ingredient', ''),
-                    row.get('unit', '')
-                ),
-                axis=1
-            )
+            df['unit'] = self._standardize_unit_series(df['unit'])
         
         # Ensure numeric columns are numeric
         numeric_cols = ['min_stock_level', 'max_stock_level', 'shelf_life_days', 'storage_space_units']
@@ -590,7 +807,7 @@ class DataPreprocessor:
                     df[col] = df[col].fillna(20 if 'stock_level' in col else 14)
                     df[col] = df[col].clip(lower=0)
         
-        return df
+        return self._to_categorical(df)
     
     def validate_data_quality(self, data: Dict[str, pd.DataFrame]) -> Dict[str, List[str]]:
         """
@@ -632,24 +849,22 @@ class DataPreprocessor:
             
             # Check date ranges
             if 'date' in df.columns:
-                dates = pd.to_datetime(df['date'], errors='coerce')
-                valid_dates = dates.dropna()
-                if not valid_dates.empty:
-                    max_date = valid_dates.max()
+                # Preprocessed frames are already datetime64, so this only parses raw input
+                max_date = self._to_datetime(df['date']).max()
+                if pd.notna(max_date):
                     future_buffer = datetime.now() + timedelta(days=90)
                     if max_date > future_buffer:
                         df_warnings.append(f"Found dates beyond 90 days in future: {max_date.date()}")
             
-            # Check for suspicious values
-            if 'quantity' in df.columns:
-                qty_col = pd.to_numeric(df['quantity'], errors='coerce')
-                if qty_col.max() > 100000:
-                    df_warnings.append(f"Suspiciously high quantity: {qty_col.max()}")
-            
-            if 'quantity_used' in df.columns:
-                qty_col = pd.to_numeric(df['quantity_used'], errors='coerce')
-                if qty_col.max() > 100000:
-                    df_warnings.append(f"Suspiciously high quantity_used: {qty_col.max()}")
+            # Check for suspicious values (coercing only columns that aren't numeric yet)
+            for qty_name in ('quantity', 'quantity_used'):
+                if qty_name in df.columns:
+                    qty_col = df[qty_name]
+                    if not pd.api.types.is_numeric_dtype(qty_col):
+                        qty_col = pd.to_numeric(qty_col, errors='coerce')
+                    qty_max = qty_col.max()
+                    if qty_max > 100000:
+                        df_warnings.append(f"Suspiciously high {qty_name}: {qty_max}")
             
             if df_warnings:
                 warnings[key] = df_warnings
@@ -668,21 +883,21 @@ class DataPreprocessor:
         """
         preprocessed = {}
         
-        # Preprocess each DataFrame type
-        if 'purchases' in data:
-            preprocessed['purchases'] = self.preprocess_purchases(data['purchases'])
-        
-        if 'usage' in data:
-            preprocessed['usage'] = self.preprocess_usage(data['usage'])
-        
-        if 'sales' in data:
-            preprocessed['sales'] = self.preprocess_sales(data['sales'])
-        
-        if 'shipments' in data:
-            preprocessed['shipments'] = self.preprocess_shipments(data['shipments'])
-        
-        if 'ingredients' in data:
-            preprocessed['ingredients'] = self.preprocess_ingredients(data['ingredients'])
+        # Preprocess each DataFrame type. The frames are independent and most of the work is in
+        # pandas C routines, so run them concurrently
+        steps = {
+            'purchases': self.preprocess_purchases,
+            'usage': self.preprocess_usage,
+            'sales': self.preprocess_sales,
+            'shipments': self.preprocess_shipments,
+            'ingredients': self.preprocess_ingredients,
+        }
+        present = [key for key in steps if key in data]
+        if present:
+            with ThreadPoolExecutor(max_workers=len(present)) as executor:
+                futures = {key: executor.submit(steps[key], data[key]) for key in present}
+                for key in present:
+                    preprocessed[key] = futures[key].result()
         
         # Keep other keys as-is
         for key, value in data.items():
@@ -692,9 +907,10 @@ class DataPreprocessor:
         # Validate data quality
         quality_warnings = self.validate_data_quality(preprocessed)
         if quality_warnings:
-            print("Data Quality Warnings:")
-            for key, warnings in quality_warnings.items():
-                print(f"  {key}: {', '.join(warnings)}")
+            logger.warning(
+                "Data Quality Warnings: %s",
+                '; '.join(f"{key}: {', '.join(warnings)}" for key, warnings in quality_warnings.items())
+            )
         
         return preprocessed
 
@@ -7,11 +7,16 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+import bisect
+import os
 import warnings
 import glob
 import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
 from datetime import datetime, timedelta
-warnings.filterwarnings('ignore')
 
 # Try to import DataPreprocessor
 try:
@@ -22,6 +27,95 @@ except ImportError:
     except ImportError:
         DataPreprocessor = None
 
+# Try to import pyahocorasick for single-pass partial matching of menu item names (optional)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+# Try to import pyarrow for pandas' multi-threaded CSV engine (optional)
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Try to import python-calamine, a much faster Excel reader than openpyxl (optional)
+try:
+    import python_calamine
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# Ingredient name keywords that decide the inferred storage type (frozen is checked first)
+_FROZEN_KEYWORDS = ['frozen', 'ice']
+_REFRIGERATED_KEYWORDS = ['chicken', 'pork', 'beef', 'shrimp', 'tofu', 'egg', 'braised',
+                          'onion', 'cilantro', 'cabbage', 'carrot', 'boychoy', 'peas']
+_FROZEN_RE = re.compile('|'.join(map(re.escape, _FROZEN_KEYWORDS)))
+_REFRIGERATED_RE = re.compile('|'.join(map(re.escape, _REFRIGERATED_KEYWORDS)))
+
+# Strings pd.to_datetime accepts as a (missing) date rather than rejecting
+_NAT_STRINGS = ['', 'nan', 'NaN', 'NAN', 'nat', 'NaT', 'NAT']
+# The only strings without a digit that pd.to_datetime reads as a date
+_DATE_WORDS = ['now', 'today']
+
+# Known schemas of the MSY CSVs, so the readers skip type inference. Recipe cells are
+# per-dish amounts (blank when unused); shipment counts are left to inference to stay integers.
+_RECIPE_DTYPES = defaultdict(lambda: 'float64', {'Item name': str})
+_SHIPMENT_DTYPES = {'Ingredient': str, 'Unit of shipment': str, 'frequency': str}
+
+# Words that mark a name as a menu item when there is no recipe matrix to check against
+_MENU_KEYWORDS = ('ramen', 'rice', 'noodle', 'fried', 'soup', 'tossed', 'cutlet', 'wings')
+
+# On-disk Parquet copies of each monthly workbook's parsed frames, kept under data_dir. Bump
+# the version whenever sheet parsing changes so sidecars written by older code are ignored.
+MONTHLY_CACHE_DIR = '.cache'
+MONTHLY_CACHE_VERSION = 1
+
+# Repeated name columns stored as categoricals once the monthly matrices are combined
+_CATEGORICAL_COLUMNS = ('ingredient', 'menu_item', 'supplier')
+
+
+def _find_column(columns, lowered: List[str], keywords: Tuple[str, ...]):
+    """First of columns whose lowercased name (from lowered) contains any keyword, or None"""
+    for col, name in zip(columns, lowered):
+        if any(keyword in name for keyword in keywords):
+            return col
+    return None
+
+
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """pd.to_datetime(values, errors='coerce'), without the warning pandas gives when it can't infer one format"""
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', message='Could not infer format', category=UserWarning)
+        return pd.to_datetime(values, errors='coerce')
+
+
+
+def _stack_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    pd.concat(frames, ignore_index=True) for frames sharing one schema, stacking each column's
+    arrays directly; anything else (other columns, mixed or extension dtypes) goes through pd.concat
+    """
+    if len(frames) == 1:
+        return frames[0]
+    columns = frames[0].columns
+    same_schema = all(
+        len(df.columns) == len(columns) and set(df.columns) == set(columns) for df in frames[1:]
+    ) and columns.is_unique
+    if same_schema:
+        dtypes = [frames[0][col].dtype for col in columns]
+        same_schema = all(isinstance(dtype, np.dtype) for dtype in dtypes) and all(
+            df[col].dtype == dtype for df in frames[1:] for col, dtype in zip(columns, dtypes)
+        )
+    if not same_schema:
+        return pd.concat(frames, ignore_index=True)
+    return pd.DataFrame(
+        {col: np.concatenate([df[col].to_numpy() for df in frames]) for col in columns},
+        columns=columns
+    )
 
 class MSYDataLoader:
     """Load and process real MSY restaurant inventory data"""
@@ -30,6 +124,42 @@ class MSYDataLoader:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self.recipe_matrix = None
+        # Lookup tables for recipe_matrix, rebuilt whenever the matrix object changes
+        self._recipe_lookup = None
+        # (recipe_matrix, lowercased menu item names) for _is_menu_item, rebuilt the same way
+        self._menu_item_names = None
+        # Raw CSV reads keyed by path, reused while the file's (mtime, size) is unchanged
+        self._csv_cache = {}
+    
+    def _read_csv(self, path, dtype=None) -> pd.DataFrame:
+        """
+        Read a CSV, reusing the previous read of the same file if it hasn't changed since.
+        
+        dtype is the file's expected schema; if the file doesn't fit it, types are inferred instead.
+        """
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        entry = self._csv_cache.get(str(path))
+        if entry is None or entry[0] != stamp:
+            df = None
+            if PYARROW_AVAILABLE:
+                try:
+                    df = pd.read_csv(path, engine='pyarrow', dtype=dtype)
+                except Exception:
+                    # Files pyarrow rejects (e.g. ragged rows) fall back to the default engine below
+                    pass
+            if df is None and dtype is not None:
+                try:
+                    df = pd.read_csv(path, dtype=dtype)
+                except (ValueError, TypeError):
+                    # A column that doesn't hold the expected type - let pandas infer them all
+                    pass
+            if df is None:
+                df = pd.read_csv(path)
+            entry = (stamp, df)
+            self._csv_cache[str(path)] = entry
+        # Hand out a copy so callers can't modify the cached frame
+        return entry[1].copy()
     
     def load_recipe_matrix(self) -> pd.DataFrame:
         """Load recipe matrix from MSY Data - Ingredient.csv"""
@@ -38,7 +168,7 @@ class MSYDataLoader:
             return pd.DataFrame()
         
         try:
-            df = pd.read_csv(msy_file)
+            df = self._read_csv(msy_file, dtype=_RECIPE_DTYPES)
             # First column is menu items (Item name), rest are ingredients
             if df.empty:
                 return pd.DataFrame()
@@ -56,74 +186,82 @@ class MSYDataLoader:
         if self.recipe_matrix is None:
             self.load_recipe_matrix()
         
-        ingredients_list = []
+        unique_ingredients = pd.Index([], dtype=object)
         
         # Get ingredients from recipe matrix (all columns except first)
         if self.recipe_matrix is not None and not self.recipe_matrix.empty:
             ingredient_cols = [col for col in self.recipe_matrix.columns if col != 'Item name']
-            ingredients_list.extend(ingredient_cols)
+            unique_ingredients = pd.Index(ingredient_cols, dtype=object).unique()
         
-        # Get ingredients from shipment data
+        # Get ingredients from shipment data, de-duplicated against the recipe columns
         shipments = self.load_msy_shipments()
         if shipments is not None and not shipments.empty and 'ingredient' in shipments.columns:
-            ingredients_list.extend(shipments['ingredient'].unique().tolist())
-        
-        # Remove duplicates and create ingredient master list
-        unique_ingredients = list(set(ingredients_list))
+            shipment_ingredients = pd.Index(shipments['ingredient'].dropna().unique(), dtype=object)
+            unique_ingredients = unique_ingredients.union(shipment_ingredients, sort=False)
         
-        if not unique_ingredients:
+        if unique_ingredients.empty:
             return pd.DataFrame()
         
         # Create ingredient DataFrame with defaults
-        ingredients_df = pd.DataFrame({
-            'ingredient': unique_ingredients
-        })
-        
-        # Add default values
-        ingredients_df['min_stock_level'] = 20
-        ingredients_df['max_stock_level'] = 200
-        ingredients_df['shelf_life_days'] = 14
-        ingredients_df['unit'] = 'units'
-        ingredients_df['category'] = 'Other'
-        
-        # Infer storage type
-        ingredients_df['storage_type'] = ingredients_df['ingredient'].apply(self._infer_storage_type_from_name)
-        ingredients_df['storage_space_units'] = 1.0
+        ingredients_df = self._default_ingredient_rows(unique_ingredients)
         
         # Update from shipment data if available
         if shipments is not None and not shipments.empty and 'ingredient' in shipments.columns:
             # Extract units from shipment data
             if 'Unit of shipment' in shipments.columns:
-                unit_map = shipments.set_index('ingredient')['Unit of shipment'].to_dict()
+                # Build the lookup straight from the two columns (last shipment row per ingredient
+                # wins, as with an indexed to_dict) instead of materializing an indexed copy
+                unit_map = dict(zip(shipments['ingredient'], shipments['Unit of shipment']))
                 ingredients_df['unit'] = ingredients_df['ingredient'].map(unit_map).fillna('units')
         
         return ingredients_df
     
+    def _default_ingredient_rows(self, names) -> pd.DataFrame:
+        """Ingredient master rows with default stock levels and storage inferred from each name"""
+        names = pd.Series(names, dtype=object)
+        return pd.DataFrame({
+            'ingredient': names,
+            'min_stock_level': 20,
+            'max_stock_level': 200,
+            'shelf_life_days': 14,
+            'unit': 'units',
+            'category': 'Other',
+            'storage_type': self._infer_storage_types(names),
+            'storage_space_units': 1.0
+        })
+    
     def _infer_storage_type_from_name(self, ingredient_name: str) -> str:
         """Infer storage type from ingredient name"""
         ingredient = str(ingredient_name).lower()
         
-        if any(word in ingredient for word in ['frozen', 'ice']):
+        if _FROZEN_RE.search(ingredient):
             return 'frozen'
-        elif any(word in ingredient for word in ['chicken', 'pork', 'beef', 'shrimp', 'tofu', 'egg', 'braised']):
-            return 'refrigerated'
-        elif any(word in ingredient for word in ['onion', 'cilantro', 'cabbage', 'carrot', 'boychoy', 'peas']):
+        elif _REFRIGERATED_RE.search(ingredient):
             return 'refrigerated'
         else:
             return 'shelf'
     
+    def _infer_storage_types(self, ingredient_names: pd.Series) -> np.ndarray:
+        """Vectorized _infer_storage_type_from_name for a column of ingredient names"""
+        names = ingredient_names.astype(str).str.lower()
+        return np.select(
+            [names.str.contains(_FROZEN_RE), names.str.contains(_REFRIGERATED_RE)],
+            ['frozen', 'refrigerated'],
+            default='shelf'
+        ).astype(object)
+    
     def load_msy_shipments(self, file_path: Optional[str] = None) -> pd.DataFrame:
         """Load MSY shipment data"""
         if file_path:
-            df = pd.read_csv(file_path)
+            df = self._read_csv(file_path)
         else:
             msy_file = self.data_dir / "MSY Data - Shipment.csv"
             if msy_file.exists():
-                df = pd.read_csv(msy_file)
+                df = self._read_csv(msy_file, dtype=_SHIPMENT_DTYPES)
             else:
                 shipment_file = self.data_dir / "shipments.csv"
                 if shipment_file.exists():
-                    df = pd.read_csv(shipment_file)
+                    df = self._read_csv(shipment_file)
                 else:
                     return None
         
@@ -153,49 +291,56 @@ class MSYDataLoader:
         if shipments_df.empty or 'frequency' not in shipments_df.columns:
             return pd.DataFrame()
         
-        purchases_list = []
         # Generate purchase dates based on frequency for the last 6 months
         start_date = datetime.now() - timedelta(days=180)
         end_date = datetime.now()
         
-        for _, row in shipments_df.iterrows():
-            ingredient = row['ingredient']
-            qty_per_shipment = pd.to_numeric(row.get('quantity', 0), errors='coerce') or 0
-            num_shipments = pd.to_numeric(row.get('num_shipments', 0), errors='coerce') or 0
-            frequency = str(row.get('frequency', 'weekly')).lower()
-            
-            if qty_per_shipment <= 0:
-                continue
-            
-            # Calculate shipment dates based on frequency
-            if 'weekly' in frequency:
-                days_between = 7
-            elif 'biweekly' in frequency:
-                days_between = 14
-            elif 'monthly' in frequency:
-                days_between = 30
-            else:
-                days_between = 7  # Default to weekly
-            
-            # Generate purchase dates
-            current_date = start_date
-            purchase_count = 0
-            max_purchases = max(num_shipments, 24)  # At least generate some purchases
-            
-            while current_date <= end_date and purchase_count < max_purchases:
-                purchases_list.append({
-                    'date': current_date,
-                    'ingredient': ingredient,
-                    'quantity': qty_per_shipment,
-                    'total_cost': 0,  # Cost not available in shipment data
-                    'supplier': 'Unknown'
-                })
-                current_date += timedelta(days=days_between)
-                purchase_count += 1
+        n_rows = len(shipments_df)
+        if 'quantity' in shipments_df.columns:
+            qty_per_shipment = pd.to_numeric(shipments_df['quantity'], errors='coerce').to_numpy()
+        else:
+            qty_per_shipment = np.zeros(n_rows)
+        if 'num_shipments' in shipments_df.columns:
+            num_shipments = pd.to_numeric(shipments_df['num_shipments'], errors='coerce').to_numpy(dtype=float)
+        else:
+            num_shipments = np.zeros(n_rows)
+        frequency = shipments_df['frequency'].astype(str).str.lower()
+        
+        # Calculate shipment dates based on frequency (first matching keyword wins,
+        # so 'biweekly' resolves through the 'weekly' check as before)
+        days_between = np.select(
+            [frequency.str.contains('weekly', regex=False).to_numpy(),
+             frequency.str.contains('biweekly', regex=False).to_numpy(),
+             frequency.str.contains('monthly', regex=False).to_numpy()],
+            [7, 14, 30],
+            default=7  # Default to weekly
+        )
+        
+        # Number of purchase dates per row: bounded by the date window and by
+        # max(num_shipments, 24); a missing shipment count yields no purchases
+        max_purchases = np.maximum(num_shipments, 24)  # At least generate some purchases
+        window_days = (end_date - start_date) / timedelta(days=1)
+        dates_in_window = np.floor(window_days / days_between) + 1
+        counts = np.where(np.isnan(max_purchases), 0,
+                          np.minimum(np.ceil(max_purchases), dates_in_window))
+        counts[qty_per_shipment <= 0] = 0
+        counts = counts.astype(np.int64)
+        
+        total = int(counts.sum())
+        if total == 0:
+            return pd.DataFrame()
         
-        if purchases_list:
-            return pd.DataFrame(purchases_list)
-        return pd.DataFrame()
+        rows = np.repeat(np.arange(n_rows), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        dates = pd.Timestamp(start_date) + pd.to_timedelta(offsets * days_between[rows], unit='D')
+        
+        return pd.DataFrame({
+            'date': dates,
+            'ingredient': shipments_df['ingredient'].to_numpy()[rows],
+            'quantity': qty_per_shipment[rows],
+            'total_cost': 0,  # Cost not available in shipment data
+            'supplier': 'Unknown'
+        })
     
     def load_monthly_matrices(self) -> Dict[str, pd.DataFrame]:
         """Load monthly data matrices from Excel files"""
@@ -212,65 +357,140 @@ class MSYDataLoader:
         if not excel_files:
             excel_files = list(self.data_dir.glob("*.xlsx"))
         
-        for excel_file in excel_files:
-            try:
-                # Convert to Path if it's a string
-                if isinstance(excel_file, str):
-                    excel_file = Path(excel_file)
-                
-                # Extract month/year from filename
-                month_year = self._extract_month_year_from_filename(excel_file.name)
-                
-                # Read all sheets
-                xls = pd.ExcelFile(excel_file)
-                
-                for sheet_name in xls.sheet_names:
-                    try:
-                        df = pd.read_excel(str(excel_file), sheet_name=sheet_name, header=None)
-                        
-                        # Try different parsing strategies
-                        # Strategy 1: Matrix format (dates in first column/row, ingredients/menu items in columns/rows)
-                        parsed_data = self._parse_matrix_sheet(df, sheet_name, month_year, excel_file.stem)
-                        
-                        if parsed_data:
-                            if 'purchases' in parsed_data:
-                                monthly_data['purchases'].extend(parsed_data['purchases'])
-                            if 'sales' in parsed_data:
-                                monthly_data['sales'].extend(parsed_data['sales'])
-                            if 'usage' in parsed_data:
-                                monthly_data['usage'].extend(parsed_data['usage'])
-                        
-                        # Strategy 2: Standard format (try existing parsers)
-                        purchases = self._parse_purchase_sheet(df, excel_file.stem)
-                        if purchases is not None and not purchases.empty:
-                            monthly_data['purchases'].append(purchases)
-                        
-                        sales = self._parse_sales_sheet(df, excel_file.stem, month_year)
-                        if sales is not None and not sales.empty:
-                            monthly_data['sales'].append(sales)
-                        
-                        usage = self._parse_usage_sheet(df, excel_file.stem)
-                        if usage is not None and not usage.empty:
-                            monthly_data['usage'].append(usage)
-                    
-                    except Exception as e:
-                        print(f"Warning: Could not parse sheet {sheet_name} in {excel_file}: {str(e)}")
-                        continue
+        if excel_files:
+            # Load the recipe matrix up front so worker threads only read it in _is_menu_item
+            if self.recipe_matrix is None:
+                self.load_recipe_matrix()
             
-            except Exception as e:
-                print(f"Warning: Could not parse {excel_file}: {str(e)}")
-                continue
+            # Workbooks are independent and most of the reading happens outside the GIL, so parse
+            # them concurrently; results come back in file order and are merged here
+            with ThreadPoolExecutor(max_workers=min(8, len(excel_files))) as executor:
+                for file_data in executor.map(self._parse_monthly_file, excel_files):
+                    for key, frames in file_data.items():
+                        monthly_data[key].extend(frames)
         
         # Combine all monthly data
         result = {}
         for key, data_list in monthly_data.items():
             if data_list:
-                result[key] = pd.concat(data_list, ignore_index=True)
+                combined = pd.concat(data_list, ignore_index=True)
+                for col in _CATEGORICAL_COLUMNS:
+                    if col in combined.columns and combined[col].dtype == object:
+                        combined[col] = combined[col].astype('category')
+                result[key] = combined
             else:
                 result[key] = pd.DataFrame()
         
         return result
     
+    def _parse_monthly_file(self, excel_file) -> Dict[str, List[pd.DataFrame]]:
+        """Parse one monthly Excel file into purchase, sales and usage frames, via its Parquet sidecars if current"""
+        file_data = {
+            'purchases': [],
+            'sales': [],
+            'usage': []
+        }
+        
+        try:
+            # Convert to Path if it's a string
+            if isinstance(excel_file, str):
+                excel_file = Path(excel_file)
+            
+            sidecars = self._monthly_sidecar_paths(excel_file) if PYARROW_AVAILABLE else None
+            if sidecars is not None and all(path.exists() for path in sidecars.values()):
+                try:
+                    for key, path in sidecars.items():
+                        df = pd.read_parquet(path)
+                        if not df.empty:
+                            file_data[key].append(df)
+                    return file_data
+                except Exception:
+                    # Unreadable sidecar (e.g. a partial write) - re-parse the workbook
+                    file_data = {key: [] for key in file_data}
+            
+            self._parse_monthly_workbook(excel_file, file_data)
+            if sidecars is not None:
+                self._write_monthly_sidecars(excel_file, sidecars, file_data)
+        
+        except Exception as e:
+            print(f"Warning: Could not parse {excel_file}: {str(e)}")
+        
+        return file_data
+    
+    def _parse_monthly_workbook(self, excel_file: Path, file_data: Dict[str, List[pd.DataFrame]]):
+        """Parse every sheet of a monthly workbook, appending the frames found to file_data"""
+        # Extract month/year from filename
+        month_year = self._extract_month_year_from_filename(excel_file.name)
+        
+        # Open the workbook once and read every sheet from the same handle
+        with pd.ExcelFile(excel_file, engine='calamine' if CALAMINE_AVAILABLE else None) as xls:
+            for sheet_name in xls.sheet_names:
+                try:
+                    df = xls.parse(sheet_name, header=None)
+                    
+                    # Try different parsing strategies
+                    # Strategy 1: Matrix format (dates in first column/row, ingredients/menu items in columns/rows)
+                    parsed_data = self._parse_matrix_sheet(df, sheet_name, month_year, excel_file.stem)
+                    
+                    if parsed_data:
+                        for key, parsed_df in parsed_data.items():
+                            if not parsed_df.empty:
+                                file_data[key].append(parsed_df)
+                    
+                    # Strategy 2: Standard format (try existing parsers)
+                    purchases = self._parse_purchase_sheet(df, excel_file.stem)
+                    if purchases is not None and not purchases.empty:
+                        file_data['purchases'].append(purchases)
+                    
+                    sales = self._parse_sales_sheet(df, excel_file.stem, month_year)
+                    if sales is not None and not sales.empty:
+                        file_data['sales'].append(sales)
+                    
+                    usage = self._parse_usage_sheet(df, excel_file.stem)
+                    if usage is not None and not usage.empty:
+                        file_data['usage'].append(usage)
+                
+                except Exception as e:
+                    print(f"Warning: Could not parse sheet {sheet_name} in {excel_file}: {str(e)}")
+                    continue
+    
+    def _monthly_sidecar_paths(self, excel_file: Path) -> Dict[str, Path]:
+        """
+        Parquet sidecars for a monthly workbook, one per data kind.
+        
+        Named after the workbook's mtime and size and the recipe matrix's (menu item detection
+        depends on it), so editing either file invalidates them.
+        """
+        stat = os.stat(excel_file)
+        recipe_file = self.data_dir / "MSY Data - Ingredient.csv"
+        if recipe_file.exists():
+            recipe_stat = os.stat(recipe_file)
+            recipe_stamp = f"{recipe_stat.st_mtime_ns}-{recipe_stat.st_size}"
+        else:
+            recipe_stamp = "none"
+        stamp = f"v{MONTHLY_CACHE_VERSION}.{stat.st_mtime_ns}-{stat.st_size}.{recipe_stamp}"
+        cache_dir = self.data_dir / MONTHLY_CACHE_DIR
+        return {key: cache_dir / f"{excel_file.stem}.{key}.{stamp}.parquet" for key in ('purchases', 'sales', 'usage')}
+    
+    def _write_monthly_sidecars(self, excel_file: Path, sidecars: Dict[str, Path],
+                                file_data: Dict[str, List[pd.DataFrame]]):
+        """Write a workbook's parsed frames to its Parquet sidecars and remove stale ones"""
+        try:
+            next(iter(sidecars.values())).parent.mkdir(exist_ok=True)
+            for key, sidecar in sidecars.items():
+                frames = file_data[key]
+                df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+                # Per-thread temp name: the same workbook can be parsed by two workers at once
+                tmp_path = sidecar.with_name(f"{sidecar.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+                df.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+                os.replace(tmp_path, sidecar)
+                for stale in sidecar.parent.glob(f"{glob.escape(excel_file.stem)}.{key}.*.parquet"):
+                    if stale != sidecar:
+                        stale.unlink(missing_ok=True)
+        except Exception as e:
+            # The sidecars are only an optimization (e.g. read-only data dir, mixed-type columns)
+            print(f"Warning: Could not write cache file for {excel_file}: {str(e)}")
+    
     def _extract_month_year_from_filename(self, filename: str) -> Tuple[Optional[int], Optional[int]]:
         """Extract month and year from filename"""
         # Try to extract month name and year
@@ -314,82 +534,63 @@ class MSYDataLoader:
         if df.empty or df.shape[0] < 2 or df.shape[1] < 2:
             return None
         
-        result = {'purchases': [], 'sales': [], 'usage': []}
+        result = {'purchases': pd.DataFrame(), 'sales': pd.DataFrame(), 'usage': pd.DataFrame()}
         month, year = month_year
         
-        # Try to identify if first row/column contains dates
+        # Try to identify if first column contains dates: parse the whole column at once, each
+        # cell in its own format, and treat the cells pandas reads as missing dates as dates too.
+        # (Dates in the first row alone never produced data, so the row isn't checked.)
         first_col = df.iloc[:, 0].astype(str)
-        first_row = df.iloc[0, :].astype(str)
-        
-        # Check if first column contains dates
-        date_col_indices = []
-        for idx, val in enumerate(first_col):
-            try:
-                pd.to_datetime(val, errors='raise')
-                date_col_indices.append(idx)
-            except:
-                pass
-        
-        # Check if first row contains dates
-        date_row_indices = []
-        for idx, val in enumerate(first_row):
-            try:
-                pd.to_datetime(val, errors='raise')
-                date_row_indices.append(idx)
-            except:
-                pass
+        missing_dates = first_col.isin(_NAT_STRINGS)
+        # Only cells with a digit (or 'now'/'today') can parse, so item names skip the slow
+        # per-cell parser, and a sheet with no such cells is done here
+        candidates = first_col.str.contains(r'\d', regex=True) | first_col.isin(_DATE_WORDS)
+        if not candidates.any() and not missing_dates.any():
+            return None
+        parsed_dates = pd.to_datetime(first_col.where(candidates), errors='coerce', format='mixed')
+        date_col_indices = np.flatnonzero((parsed_dates.notna() | missing_dates).to_numpy())
         
         # If we found dates, parse as matrix
-        if date_col_indices or date_row_indices:
-            # Assume dates are in first column, items in first row (after header)
-            if date_col_indices:
-                # Dates in rows, items in columns
-                dates = []
-                for idx in date_col_indices:
-                    try:
-                        date_val = pd.to_datetime(first_col.iloc[idx])
-                        # If only month/year provided, use day 1
-                        if month and year and pd.isna(date_val):
-                            date_val = datetime(year, month, 1)
-                        dates.append(date_val)
-                    except:
-                        if month and year:
-                            dates.append(datetime(year, month, 1))
+        if len(date_col_indices):
+            # Dates in rows (first column), items in columns (first row, after header)
+            dates = parsed_dates.iloc[date_col_indices]
+            # If only month/year provided, use day 1
+            if month and year:
+                dates = dates.fillna(pd.Timestamp(datetime(year, month, 1)))
+            
+            # Get item names from header row (skip first column)
+            items = df.iloc[0, 1:].astype(str).to_numpy()
+            
+            # Parse the whole date x item body at once and keep the positive cells, row by row
+            body = df.iloc[date_col_indices, 1:].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+            rows, cols = np.nonzero(body > 0)
+            if len(rows):
+                dates_arr = dates.to_numpy()[rows]
+                items_arr = items[cols]
+                values = body[rows, cols]
                 
-                # Get item names from header row (skip first column)
-                items = df.iloc[0, 1:].astype(str).tolist()
+                # Determine if each column is sales (menu item) or usage (ingredient)
+                is_menu = np.array([self._is_menu_item(item_name) for item_name in items], dtype=bool)[cols]
+                is_usage = ~is_menu
                 
-                # Parse data
-                for date_idx, date_val in enumerate(date_col_indices):
-                    if date_idx >= len(dates):
-                        continue
-                    date = dates[date_idx]
-                    row_data = df.iloc[date_val, 1:]
-                    
-                    for item_idx, item_name in enumerate(items):
-                        if item_idx >= len(row_data):
-                            continue
-                        value = pd.to_numeric(row_data.iloc[item_idx], errors='coerce')
-                        if pd.notna(value) and value > 0:
-                            # Determine if this is sales (menu item) or usage (ingredient)
-                            if self._is_menu_item(item_name):
-                                result['sales'].append({
-                                    'date': date,
-                                    'menu_item': item_name,
-                                    'quantity_sold': value,
-                                    'revenue': 0,
-                                    'price': 0
-                                })
-                            else:
-                                result['usage'].append({
-                                    'date': date,
-                                    'ingredient': item_name,
-                                    'quantity_used': value,
-                                    'menu_item': 'Unknown'
-                                })
+                if is_menu.any():
+                    result['sales'] = pd.DataFrame({
+                        'date': dates_arr[is_menu],
+                        'menu_item': items_arr[is_menu],
+                        'quantity_sold': values[is_menu],
+                        'revenue': 0,
+                        'price': 0
+                    })
+                if is_usage.any():
+                    result['usage'] = pd.DataFrame({
+                        'date': dates_arr[is_usage],
+                        'ingredient': items_arr[is_usage],
+                        'quantity_used': values[is_usage],
+                        'menu_item': 'Unknown'
+                    })
         
         # Return result if we found data
-        if any(result.values()):
+        if any(not frame.empty for frame in result.values()):
             return result
         return None
     
@@ -399,13 +600,14 @@ class MSYDataLoader:
             self.load_recipe_matrix()
         
         if self.recipe_matrix is not None and not self.recipe_matrix.empty:
-            menu_items = self.recipe_matrix['Item name'].astype(str).str.lower().tolist()
-            return str(name).lower() in menu_items
+            if self._menu_item_names is None or self._menu_item_names[0] is not self.recipe_matrix:
+                menu_items = frozenset(self.recipe_matrix['Item name'].astype(str).str.lower())
+                self._menu_item_names = (self.recipe_matrix, menu_items)
+            return str(name).lower() in self._menu_item_names[1]
         
         # Heuristic: menu items often contain words like "ramen", "rice", "noodles", "fried"
-        menu_keywords = ['ramen', 'rice', 'noodle', 'fried', 'soup', 'tossed', 'cutlet', 'wings']
         name_lower = str(name).lower()
-        return any(keyword in name_lower for keyword in menu_keywords)
+        return any(keyword in name_lower for keyword in _MENU_KEYWORDS)
     
     def _parse_purchase_sheet(self, df: pd.DataFrame, source: str) -> Optional[pd.DataFrame]:
         """Parse purchase data from a sheet"""
@@ -413,39 +615,40 @@ class MSYDataLoader:
         if df.empty:
             return None
         
-        # Try with header
-        df_with_header = df.copy()
+        # Try with header (the sheet is only read below, so relabel a view of its rows instead of copying it)
+        df_with_header = df
         if df.shape[0] > 0:
-            df_with_header.columns = df.iloc[0] if df.shape[0] > 0 else df.columns
-            df_with_header = df_with_header.iloc[1:]
+            df_with_header = df.iloc[1:].set_axis(df.iloc[0], axis=1, copy=False)
         
-        # Look for date, ingredient, quantity, cost columns
-        date_cols = [col for col in df_with_header.columns if 'date' in str(col).lower() or 'time' in str(col).lower()]
-        ingredient_cols = [col for col in df_with_header.columns if 'ingredient' in str(col).lower() or 'item' in str(col).lower()]
-        qty_cols = [col for col in df_with_header.columns if 'qty' in str(col).lower() or 'quantity' in str(col).lower() or 'amount' in str(col).lower()]
-        cost_cols = [col for col in df_with_header.columns if 'cost' in str(col).lower() or 'price' in str(col).lower() or 'total' in str(col).lower()]
+        # Look for date, ingredient, quantity, cost columns (header names lowercased once)
+        columns = df_with_header.columns
+        lowered = [str(col).lower() for col in columns]
+        date_col = _find_column(columns, lowered, ('date', 'time'))
+        ingredient_col = _find_column(columns, lowered, ('ingredient', 'item'))
+        qty_col = _find_column(columns, lowered, ('qty', 'quantity', 'amount'))
+        cost_col = _find_column(columns, lowered, ('cost', 'price', 'total'))
         
-        if not date_cols or not ingredient_cols:
+        if date_col is None or ingredient_col is None:
             return None
         
         result = pd.DataFrame()
-        result['date'] = pd.to_datetime(df_with_header[date_cols[0]], errors='coerce')
-        result['ingredient'] = df_with_header[ingredient_cols[0]].astype(str)
+        result['date'] = _parse_dates(df_with_header[date_col])
+        result['ingredient'] = df_with_header[ingredient_col].astype(str)
         
-        if qty_cols:
-            result['quantity'] = pd.to_numeric(df_with_header[qty_cols[0]], errors='coerce')
+        if qty_col is not None:
+            result['quantity'] = pd.to_numeric(df_with_header[qty_col], errors='coerce')
         else:
             result['quantity'] = 0
         
-        if cost_cols:
-            result['total_cost'] = pd.to_numeric(df_with_header[cost_cols[0]], errors='coerce')
+        if cost_col is not None:
+            result['total_cost'] = pd.to_numeric(df_with_header[cost_col], errors='coerce')
         else:
             result['total_cost'] = 0
         
         # Try to find supplier column
-        supplier_cols = [col for col in df_with_header.columns if 'supplier' in str(col).lower() or 'vendor' in str(col).lower()]
-        if supplier_cols:
-            result['supplier'] = df_with_header[supplier_cols[0]].astype(str)
+        supplier_col = _find_column(columns, lowered, ('supplier', 'vendor'))
+        if supplier_col is not None:
+            result['supplier'] = df_with_header[supplier_col].astype(str)
         else:
             result['supplier'] = 'Unknown'
         
@@ -464,39 +667,41 @@ class MSYDataLoader:
             return None
         
         # Use first row as header if it looks like headers
-        df_with_header = df.copy()
+        df_with_header = df
         if df.shape[0] > 0:
             # Check if first row looks like data or headers
             first_row_str = [str(x).lower() for x in df.iloc[0]]
             if any(keyword in ' '.join(first_row_str) for keyword in ['category', 'group', 'count', 'amount', 'menu', 'item']):
-                df_with_header.columns = df.iloc[0]
-                df_with_header = df_with_header.iloc[1:]
+                df_with_header = df.iloc[1:].set_axis(df.iloc[0], axis=1, copy=False)
         
-        # Look for menu item columns (Category, Group, Menu Item, Dish, Item)
-        menu_cols = [col for col in df_with_header.columns if any(keyword in str(col).lower() for keyword in ['category', 'group', 'menu', 'dish', 'item'])]
-        qty_cols = [col for col in df_with_header.columns if any(keyword in str(col).lower() for keyword in ['count', 'qty', 'quantity', 'sold'])]
-        revenue_cols = [col for col in df_with_header.columns if any(keyword in str(col).lower() for keyword in ['amount', 'revenue', 'price', 'total', 'cost'])]
-        date_cols = [col for col in df_with_header.columns if 'date' in str(col).lower() or 'time' in str(col).lower()]
+        # Look for menu item columns (Category, Group, Menu Item, Dish, Item), header names lowercased once
+        columns = df_with_header.columns
+        lowered = [str(col).lower() for col in columns]
+        menu_col = _find_column(columns, lowered, ('category', 'group', 'menu', 'dish', 'item'))
+        qty_col = _find_column(columns, lowered, ('count', 'qty', 'quantity', 'sold'))
+        revenue_col = _find_column(columns, lowered, ('amount', 'revenue', 'price', 'total', 'cost'))
+        date_col = _find_column(columns, lowered, ('date', 'time'))
         
         # Need at least menu item column
-        if not menu_cols:
+        if menu_col is None:
             return None
         
         result = pd.DataFrame()
-        result['menu_item'] = df_with_header[menu_cols[0]].astype(str)
+        # Blank cells stay missing instead of turning into the text 'nan'
+        result['menu_item'] = df_with_header[menu_col].map(str, na_action='ignore')
         
         # Quantity
-        if qty_cols:
+        if qty_col is not None:
             # Remove commas and convert to numeric
-            qty_data = df_with_header[qty_cols[0]].astype(str).str.replace(',', '').str.replace('$', '')
+            qty_data = df_with_header[qty_col].astype(str).str.replace(',', '').str.replace('$', '')
             result['quantity_sold'] = pd.to_numeric(qty_data, errors='coerce').fillna(0)
         else:
             result['quantity_sold'] = 1
         
         # Revenue
-        if revenue_cols:
+        if revenue_col is not None:
             # Remove $ and commas, convert to numeric
-            revenue_data = df_with_header[revenue_cols[0]].astype(str).str.replace('$', '').str.replace(',', '')
+            revenue_data = df_with_header[revenue_col].astype(str).str.replace('$', '').str.replace(',', '')
             result['revenue'] = pd.to_numeric(revenue_data, errors='coerce').fillna(0)
             result['price'] = result['revenue'] / result['quantity_sold'].replace(0, 1)
         else:
@@ -504,8 +709,8 @@ class MSYDataLoader:
             result['price'] = 0
         
         # Date - infer from filename if not in data
-        if date_cols:
-            result['date'] = pd.to_datetime(df_with_header[date_cols[0]], errors='coerce')
+        if date_col is not None:
+            result['date'] = _parse_dates(df_with_header[date_col])
         else:
             # Infer date from month_year or use current date
             month, year = month_year
@@ -536,31 +741,32 @@ class MSYDataLoader:
             return None
         
         # Try with header
-        df_with_header = df.copy()
+        df_with_header = df
         if df.shape[0] > 0:
-            df_with_header.columns = df.iloc[0] if df.shape[0] > 0 else df.columns
-            df_with_header = df_with_header.iloc[1:]
+            df_with_header = df.iloc[1:].set_axis(df.iloc[0], axis=1, copy=False)
         
-        # Look for date, ingredient, quantity used, menu item columns
-        date_cols = [col for col in df_with_header.columns if 'date' in str(col).lower() or 'time' in str(col).lower()]
-        ingredient_cols = [col for col in df_with_header.columns if 'ingredient' in str(col).lower()]
-        menu_cols = [col for col in df_with_header.columns if 'menu' in str(col).lower() or 'dish' in str(col).lower()]
-        qty_cols = [col for col in df_with_header.columns if 'qty' in str(col).lower() or 'quantity' in str(col).lower() or 'used' in str(col).lower()]
+        # Look for date, ingredient, quantity used, menu item columns (header names lowercased once)
+        columns = df_with_header.columns
+        lowered = [str(col).lower() for col in columns]
+        date_col = _find_column(columns, lowered, ('date', 'time'))
+        ingredient_col = _find_column(columns, lowered, ('ingredient',))
+        menu_col = _find_column(columns, lowered, ('menu', 'dish'))
+        qty_col = _find_column(columns, lowered, ('qty', 'quantity', 'used'))
         
-        if not date_cols or not ingredient_cols:
+        if date_col is None or ingredient_col is None:
             return None
         
         result = pd.DataFrame()
-        result['date'] = pd.to_datetime(df_with_header[date_cols[0]], errors='coerce')
-        result['ingredient'] = df_with_header[ingredient_cols[0]].astype(str)
+        result['date'] = _parse_dates(df_with_header[date_col])
+        result['ingredient'] = df_with_header[ingredient_col].astype(str)
         
-        if menu_cols:
-            result['menu_item'] = df_with_header[menu_cols[0]].astype(str)
+        if menu_col is not None:
+            result['menu_item'] = df_with_header[menu_col].map(str, na_action='ignore')
         else:
             result['menu_item'] = 'Unknown'
         
-        if qty_cols:
-            result['quantity_used'] = pd.to_numeric(df_with_header[qty_cols[0]], errors='coerce').fillna(0)
+        if qty_col is not None:
+            result['quantity_used'] = pd.to_numeric(df_with_header[qty_col], errors='coerce').fillna(0)
         else:
             result['quantity_used'] = 0
         
@@ -573,6 +779,88 @@ class MSYDataLoader:
             return None
         return result
     
+    def _get_recipe_lookup(self) -> Dict:
+        """
+        Lookup tables for the recipe matrix: item name -> row maps, each item's positive
+        ingredient amounts in sparse row form (non-numeric or non-positive amounts dropped)
+        and a cache of resolved menu items, built once per matrix object
+        """
+        recipe_matrix = self.recipe_matrix
+        if self._recipe_lookup is not None and self._recipe_lookup['matrix'] is recipe_matrix:
+            return self._recipe_lookup
+        
+        # Map menu item names (exact and normalized) to recipe rows; later duplicates win
+        recipe_map = {}
+        for position, item_name in enumerate(recipe_matrix['Item name'].astype(str).str.strip()):
+            recipe_map[item_name.lower()] = position
+            recipe_map[item_name] = position
+        partial_keys = [(key.lower(), position) for key, position in recipe_map.items()]
+        
+        # Partial matching: the first key containing a name is one str.find over the joined keys,
+        # and (with pyahocorasick) every key contained in a name is one automaton walk
+        key_text = '\x00'.join(key_lower for key_lower, _ in partial_keys)
+        key_starts = list(accumulate((len(key_lower) + 1 for key_lower, _ in partial_keys[:-1]), initial=0))
+        automaton = None
+        if AHOCORASICK_AVAILABLE and partial_keys:
+            automaton = ahocorasick.Automaton()
+            for order, (key_lower, _) in enumerate(partial_keys):
+                if key_lower not in automaton:
+                    automaton.add_word(key_lower, order)
+            automaton.make_automaton()
+        
+        # Ingredients are all columns except 'Item name'
+        ingredient_cols = [col for col in recipe_matrix.columns if col != 'Item name']
+        quantities = recipe_matrix[ingredient_cols].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        # Sparse rows: recipe row r uses ingredient_columns[starts[r]:starts[r] + counts[r]]
+        positive = quantities > 0
+        item_positions, ingredient_columns = np.nonzero(positive)
+        ingredient_counts = positive.sum(axis=1)
+        
+        self._recipe_lookup = {
+            'matrix': recipe_matrix,
+            'recipe_map': recipe_map,
+            'partial_keys': partial_keys,
+            'key_text': key_text,
+            'key_starts': key_starts,
+            'automaton': automaton,
+            'ingredient_starts': np.cumsum(ingredient_counts) - ingredient_counts,
+            'ingredient_counts': ingredient_counts,
+            'ingredient_columns': ingredient_columns,
+            'ingredient_amounts': quantities[item_positions, ingredient_columns],
+            'ingredient_names': np.array([str(col).strip() for col in ingredient_cols], dtype=object),
+            'resolved': {},
+        }
+        return self._recipe_lookup
+    
+    def _find_recipe_row(self, lookup: Dict, menu_item_lower: str) -> int:
+        """Recipe row position for a lowercased menu item (exact, then partial match), or -1 if none"""
+        resolved = lookup['resolved']
+        if menu_item_lower in resolved:
+            return resolved[menu_item_lower]
+        
+        partial_keys = lookup['partial_keys']
+        if menu_item_lower in lookup['recipe_map']:
+            # Try exact match (case-insensitive)
+            position = lookup['recipe_map'][menu_item_lower]
+        elif lookup['automaton'] is not None and menu_item_lower and '\x00' not in menu_item_lower:
+            # Try partial match: the earliest key containing, or contained in, the menu item wins
+            found = lookup['key_text'].find(menu_item_lower)
+            best = bisect.bisect_right(lookup['key_starts'], found) - 1 if found >= 0 else None
+            for _, order in lookup['automaton'].iter(menu_item_lower):
+                if best is None or order < best:
+                    best = order
+            position = partial_keys[best][1] if best is not None else -1
+        else:
+            # Try partial match
+            position = next(
+                (position for key_lower, position in partial_keys
+                 if menu_item_lower in key_lower or key_lower in menu_item_lower),
+                -1
+            )
+        
+        resolved[menu_item_lower] = position
+        return position
+    
     def generate_usage_from_sales_and_recipes(self, sales_df: pd.DataFrame) -> pd.DataFrame:
         """Generate usage data from sales and recipe matrix"""
         if self.recipe_matrix is None:
@@ -581,62 +869,98 @@ class MSYDataLoader:
         if self.recipe_matrix is None or self.recipe_matrix.empty or sales_df.empty:
             return pd.DataFrame()
         
-        usage_list = []
+        lookup = self._get_recipe_lookup()
+        ingredient_names = lookup['ingredient_names']
         
-        # Create a mapping of menu item names (normalized) to recipe rows
-        recipe_map = {}
-        for idx, row in self.recipe_matrix.iterrows():
-            item_name = str(row['Item name']).strip()
-            # Store both exact and normalized versions
-            recipe_map[item_name.lower()] = row
-            recipe_map[item_name] = row
-        
-        # Iterate through sales
-        for _, sale in sales_df.iterrows():
-            menu_item = str(sale.get('menu_item', '')).strip()
-            quantity_sold = pd.to_numeric(sale.get('quantity_sold', 0), errors='coerce') or 0
-            date = sale.get('date', datetime.now())
-            
-            if not menu_item or quantity_sold <= 0 or pd.isna(quantity_sold):
-                continue
-            
-            # Find recipe for this menu item (try normalized first)
-            recipe_row = None
-            menu_item_lower = menu_item.lower()
-            
-            # Try exact match (case-insensitive)
-            if menu_item_lower in recipe_map:
-                recipe_row = recipe_map[menu_item_lower]
+        if 'menu_item' not in sales_df.columns or 'quantity_sold' not in sales_df.columns:
+            return pd.DataFrame()
+        menu_items = sales_df['menu_item'].astype(str).str.strip()
+        quantity_sold = pd.to_numeric(sales_df['quantity_sold'], errors='coerce').to_numpy(dtype=float)
+        if 'date' in sales_df.columns:
+            dates = pd.to_datetime(sales_df['date'], errors='coerce', format='mixed')
+        else:
+            dates = pd.Series(pd.Timestamp(datetime.now()), index=sales_df.index)
+        
+        # Find the recipe row for each distinct menu item (resolutions are cached across calls)
+        lowered = menu_items.str.lower()
+        recipe_rows = lowered.map({name: self._find_recipe_row(lookup, name) for name in lowered.unique()}).to_numpy()
+        
+        # Skip sales without a menu item, a positive quantity or a recipe
+        valid = (menu_items != '').to_numpy() & (quantity_sold > 0) & (recipe_rows >= 0)
+        if not valid.any():
+            return pd.DataFrame()
+        
+        # Repeat every sale once per ingredient its recipe uses and scale the sparse recipe
+        # amounts by quantity sold; records come out in sale then column order
+        sale_positions = np.flatnonzero(valid)
+        sale_recipes = recipe_rows[sale_positions]
+        counts = lookup['ingredient_counts'][sale_recipes]
+        total = int(counts.sum())
+        if total == 0:
+            return pd.DataFrame()
+        rows = np.repeat(sale_positions, counts)
+        entries = np.repeat(lookup['ingredient_starts'][sale_recipes] - (np.cumsum(counts) - counts), counts) + np.arange(total)
+        
+        return pd.DataFrame({
+            'date': dates.to_numpy()[rows],
+            'ingredient': ingredient_names[lookup['ingredient_columns'][entries]],
+            'menu_item': menu_items.to_numpy()[rows],
+            'quantity_used': lookup['ingredient_amounts'][entries] * quantity_sold[rows],
+        })
+    
+    def _strip_names(self, names: pd.Series) -> pd.Series:
+        """names.astype(str).str.strip() as a categorical, stripping each distinct name only once"""
+        codes, uniques = pd.factorize(names)
+        labels = np.asarray(uniques, dtype=object)
+        missing = codes < 0
+        if missing.any():
+            # None and NaN stringify differently, so missing entries get their own labels
+            missing_codes, missing_labels = pd.factorize(names[missing].astype(str))
+            codes = codes.copy()
+            codes[missing] = len(labels) + missing_codes
+            labels = np.concatenate([labels, np.asarray(missing_labels, dtype=object)])
+        stripped_codes, stripped_labels = pd.factorize(pd.Index(labels, dtype=object).astype(str).str.strip())
+        return pd.Series(
+            pd.Categorical.from_codes(stripped_codes[codes], stripped_labels), index=names.index, name=names.name
+        )
+    
+    def _resolve_master_names(self, names, ingredient_master: pd.Series) -> Dict[str, str]:
+        """
+        Match distinct stripped ingredient names to the lowercased master list: names already in it
+        are kept, others become the first master name containing them (e.g. "beef" -> "braised beef
+        used (g)") and names with no match are left unchanged. Returns a name -> match dict.
+        """
+        master_names = [name for name in ingredient_master if isinstance(name, str)]
+        known = frozenset(master_names)
+        distinct = {name: name.lower() for name in names}
+        residual = list(dict.fromkeys(lowered for lowered in distinct.values() if lowered not in known))
+        
+        # Search every unmatched name in the joined master names at once; the earliest hit falls
+        # inside the first master name containing it
+        matched = {}
+        if residual and master_names:
+            master_text = '\x00'.join(master_names)
+            master_starts = list(accumulate((len(name) + 1 for name in master_names[:-1]), initial=0))
+            if AHOCORASICK_AVAILABLE:
+                # One automaton walk over the master text finds the first occurrence of every name
+                automaton = ahocorasick.Automaton()
+                for name in residual:
+                    if name:
+                        automaton.add_word(name, name)
+                if len(automaton):
+                    automaton.make_automaton()
+                    for end, name in automaton.iter(master_text):
+                        if name not in matched:
+                            matched[name] = master_names[bisect.bisect_right(master_starts, end - len(name) + 1) - 1]
+                if '' in residual:
+                    matched[''] = master_names[0]
             else:
-                # Try partial match
-                for key, row in recipe_map.items():
-                    if menu_item_lower in key.lower() or key.lower() in menu_item_lower:
-                        recipe_row = row
-                        break
-            
-            if recipe_row is None:
-                # Skip if no recipe found
-                continue
-            
-            # Get ingredients from recipe (all columns except 'Item name')
-            ingredient_cols = [col for col in self.recipe_matrix.columns if col != 'Item name']
-            
-            for ingredient in ingredient_cols:
-                ingredient_qty = pd.to_numeric(recipe_row[ingredient], errors='coerce')
-                if pd.notna(ingredient_qty) and ingredient_qty > 0:
-                    # Calculate total usage for this sale
-                    total_usage = ingredient_qty * quantity_sold
-                    
-                    usage_list.append({
-                        'date': pd.to_datetime(date),
-                        'ingredient': str(ingredient).strip(),
-                        'menu_item': menu_item,
-                        'quantity_used': total_usage
-                    })
+                for name in residual:
+                    position = master_text.find(name)
+                    if position >= 0:
+                        matched[name] = master_names[bisect.bisect_right(master_starts, position) - 1]
         
-        if usage_list:
-            return pd.DataFrame(usage_list)
-        return pd.DataFrame()
+        return {name: matched.get(lowered, name) for name, lowered in distinct.items()}
     
     def load_all_data(self) -> Dict[str, pd.DataFrame]:
         """Load all available MSY data"""
@@ -672,7 +996,7 @@ class MSYDataLoader:
         if 'purchases' in monthly_data and not monthly_data['purchases'].empty:
             purchases_list.append(monthly_data['purchases'])
         if purchases_list:
-            data['purchases'] = pd.concat(purchases_list, ignore_index=True) if len(purchases_list) > 1 else purchases_list[0]
+            data['purchases'] = _stack_frames(purchases_list)
         else:
             data['purchases'] = pd.DataFrame()
         
@@ -694,7 +1018,7 @@ class MSYDataLoader:
                 usage_list.append(usage_from_sales)
         
         if usage_list:
-            data['usage'] = pd.concat(usage_list, ignore_index=True) if len(usage_list) > 1 else usage_list[0]
+            data['usage'] = _stack_frames(usage_list)
         else:
             data['usage'] = pd.DataFrame()
         
@@ -706,57 +1030,35 @@ class MSYDataLoader:
         
         # Collect ALL unique ingredients from all data sources (before preprocessing)
         # This ensures we don't lose ingredients that exist in purchases/usage but not in recipe matrix
-        all_ingredient_names = set()
-        
-        # Add ingredients from existing ingredients DataFrame
-        if not data['ingredients'].empty and 'ingredient' in data['ingredients'].columns:
-            all_ingredient_names.update(data['ingredients']['ingredient'].astype(str).str.strip())
-        
-        # Add ingredients from purchases
-        if not data['purchases'].empty and 'ingredient' in data['purchases'].columns:
-            all_ingredient_names.update(data['purchases']['ingredient'].astype(str).str.strip())
-        
-        # Add ingredients from usage
-        if not data['usage'].empty and 'ingredient' in data['usage'].columns:
-            all_ingredient_names.update(data['usage']['ingredient'].astype(str).str.strip())
-        
-        # Add ingredients from shipments
-        if not data['shipments'].empty and 'ingredient' in data['shipments'].columns:
-            all_ingredient_names.update(data['shipments']['ingredient'].astype(str).str.strip())
+        # Each source's names are stripped once here and reused by the fallback normalization below
+        # (the sources are independent columns, so they're stripped concurrently when there are several)
+        sources = [key for key in ['ingredients', 'purchases', 'usage', 'shipments']
+                   if not data[key].empty and 'ingredient' in data[key].columns]
+        if len(sources) > 1:
+            with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+                futures = {key: executor.submit(self._strip_names, data[key]['ingredient']) for key in sources}
+                stripped_names = {key: futures[key].result() for key in sources}
+        else:
+            stripped_names = {key: self._strip_names(data[key]['ingredient']) for key in sources}
+        all_ingredient_names = pd.Index([], dtype=object)
+        if stripped_names:
+            all_ingredient_names = pd.Index(np.concatenate(
+                [names.cat.categories.to_numpy(dtype=object) for names in stripped_names.values()]
+            ))
         
         # Remove empty strings and update ingredients DataFrame
-        all_ingredient_names = {name for name in all_ingredient_names if name and name != 'nan' and str(name).strip() != ''}
+        all_ingredient_names = all_ingredient_names[(all_ingredient_names != '') & (all_ingredient_names != 'nan')].unique()
         
-        if all_ingredient_names:
-            # Create or update ingredients DataFrame with all found ingredients
+        if len(all_ingredient_names):
+            # Create or update ingredients DataFrame with all found ingredients (names in sorted order)
             if data['ingredients'].empty:
                 # Create new DataFrame
-                ingredients_df = pd.DataFrame({
-                    'ingredient': sorted(list(all_ingredient_names))
-                })
-                ingredients_df['min_stock_level'] = 20
-                ingredients_df['max_stock_level'] = 200
-                ingredients_df['shelf_life_days'] = 14
-                ingredients_df['unit'] = 'units'
-                ingredients_df['category'] = 'Other'
-                ingredients_df['storage_type'] = ingredients_df['ingredient'].apply(self._infer_storage_type_from_name)
-                ingredients_df['storage_space_units'] = 1.0
-                data['ingredients'] = ingredients_df
+                data['ingredients'] = self._default_ingredient_rows(all_ingredient_names.sort_values())
             else:
-                # Add missing ingredients to existing DataFrame
-                existing_ingredients = set(data['ingredients']['ingredient'].astype(str).str.strip())
-                new_ingredients = all_ingredient_names - existing_ingredients
-                if new_ingredients:
-                    new_rows = pd.DataFrame({
-                        'ingredient': sorted(list(new_ingredients))
-                    })
-                    new_rows['min_stock_level'] = 20
-                    new_rows['max_stock_level'] = 200
-                    new_rows['shelf_life_days'] = 14
-                    new_rows['unit'] = 'units'
-                    new_rows['category'] = 'Other'
-                    new_rows['storage_type'] = new_rows['ingredient'].apply(self._infer_storage_type_from_name)
-                    new_rows['storage_space_units'] = 1.0
+                # Add missing ingredients to existing DataFrame (difference() returns them sorted)
+                new_ingredients = all_ingredient_names.difference(stripped_names['ingredients'].cat.categories)
+                if len(new_ingredients):
+                    new_rows = self._default_ingredient_rows(new_ingredients)
                     data['ingredients'] = pd.concat([data['ingredients'], new_rows], ignore_index=True)
         
         # Apply preprocessing pipeline using DataPreprocessor
@@ -766,37 +1068,45 @@ class MSYDataLoader:
             
             # Normalize ingredient names in the master list to match normalized purchases/usage
             if not data['ingredients'].empty and 'ingredient' in data['ingredients'].columns:
-                data['ingredients']['ingredient'] = data['ingredients']['ingredient'].apply(
-                    preprocessor.normalize_ingredient_name
+                # Normalize each distinct name once and map the results back (per category, as
+                # DataPreprocessor returns the column as a categorical)
+                names = data['ingredients']['ingredient']
+                normalized = {name: preprocessor.normalize_ingredient_name(name) for name in names.dropna().unique()}
+                # and drop the duplicates that normalization produces in the same chain
+                data['ingredients'] = data['ingredients'].assign(ingredient=names.map(normalized)).drop_duplicates(
+                    subset=['ingredient'], keep='first', ignore_index=True
                 )
-                # Remove duplicates after normalization
-                data['ingredients'] = data['ingredients'].drop_duplicates(subset=['ingredient'], keep='first').reset_index(drop=True)
+            
+            # Let callers know these frames don't need another preprocessing pass
+            for df in data.values():
+                if isinstance(df, pd.DataFrame):
+                    df.attrs['preprocessed'] = True
         else:
             # Fallback to basic normalization if preprocessor not available
-            if not data['ingredients'].empty and 'ingredient' in data['ingredients'].columns:
-                # Create a mapping of normalized names
-                ingredient_master = data['ingredients']['ingredient'].str.strip().str.lower()
-                
-                # Normalize ingredient names in other dataframes
-                for key in ['purchases', 'usage', 'shipments']:
-                    if key in data and not data[key].empty and 'ingredient' in data[key].columns:
-                        # Strip whitespace
-                        data[key]['ingredient'] = data[key]['ingredient'].astype(str).str.strip()
-                        
-                        # Try to match ingredient names (case-insensitive, handle variations)
-                        # Create a mapping for common variations
-                        normalized = data[key]['ingredient'].str.lower()
-                        
-                        # Try to find matches in ingredient master list
-                        # This helps with slight variations in naming
-                        for idx, ing in enumerate(normalized):
-                            # Check for exact match
-                            if ing in ingredient_master.values:
-                                continue
-                            # Check for partial matches (e.g., "beef" matches "braised beef used (g)")
-                            matches = ingredient_master[ingredient_master.str.contains(ing, na=False, case=False)]
-                            if len(matches) > 0:
-                                # Use the first match
-                                data[key].iloc[idx, data[key].columns.get_loc('ingredient')] = matches.iloc[0]
+            self._normalize_without_preprocessor(data, stripped_names)
         
         return data
+    
+    def _normalize_without_preprocessor(self, data: Dict[str, pd.DataFrame], stripped_names: Dict[str, pd.Series]):
+        """Basic in-place ingredient name normalization for load_all_data when DataPreprocessor is unavailable"""
+        if data['ingredients'].empty or 'ingredient' not in data['ingredients'].columns:
+            return
+        
+        # Create a mapping of normalized names
+        ingredient_master = data['ingredients']['ingredient'].str.strip().str.lower()
+        
+        # Normalize ingredient names in other dataframes: strip whitespace, then try to match
+        # ingredient names against the master list (case-insensitive, handle variations). The
+        # distinct names of all sources are resolved together, so the master lookups are built once.
+        sources = {
+            key: stripped_names[key] for key in ['purchases', 'usage', 'shipments']
+            if key in data and not data[key].empty and 'ingredient' in data[key].columns
+        }
+        if not sources:
+            return
+        resolved = self._resolve_master_names(
+            set().union(*(names.cat.categories for names in sources.values())), ingredient_master
+        )
+        for key, names in sources.items():
+            # Map the column per category
+            data[key]['ingredient'] = names.map(resolved)
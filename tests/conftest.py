@@ -0,0 +1,11 @@
+"""
+Shared pytest setup: make the dashboard modules in src/ and the backend `app` package importable
+"""
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+for path in (PROJECT_ROOT / "src", PROJECT_ROOT, PROJECT_ROOT / "backend"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
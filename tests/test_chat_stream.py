@@ -0,0 +1,99 @@
+"""
+Tests for the streaming chat path: InventoryChatbot.ask_stream and the /api/chat/stream route
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('openai')
+pytest.importorskip('fastapi')
+
+from fastapi import HTTPException
+
+from analytics import InventoryAnalytics
+from chatbot import InventoryChatbot
+from app.api import routes
+
+
+def _stream_chunk(content):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+class _FakeCompletions:
+    """Stands in for client.chat.completions, replaying fixed chunks for streamed requests"""
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.requests = []
+
+    def create(self, **kwargs):
+        self.requests.append(kwargs)
+        assert kwargs.get('stream') is True
+        return iter([_stream_chunk(piece) for piece in self.pieces] + [SimpleNamespace(choices=[])])
+
+
+def _read_events(response):
+    async def collect():
+        return [chunk async for chunk in response.body_iterator]
+
+    body = ''.join(
+        chunk.decode() if isinstance(chunk, bytes) else chunk for chunk in asyncio.run(collect())
+    )
+    return [json.loads(line) for line in body.splitlines()]
+
+
+def test_ask_stream_yields_llm_chunks_and_records_history():
+    bot = InventoryChatbot(InventoryAnalytics({}), api_key='test-key')
+    completions = _FakeCompletions(['Hello', ', ', 'chef!'])
+    bot.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    chunks, chart_info = bot.ask_stream('How long should pork belly braise?')
+    assert chart_info is None
+    # Nothing is recorded until the response has been streamed out
+    assert bot.conversation_history == []
+
+    assert list(chunks) == ['Hello', ', ', 'chef!']
+    assert len(completions.requests) == 1
+    assert bot.conversation_history == [
+        {"role": "user", "content": 'How long should pork belly braise?'},
+        {"role": "assistant", "content": 'Hello, chef!'},
+    ]
+
+
+def test_chat_stream_route_sends_chart_then_text_events(monkeypatch):
+    chart_info = {'type': 'bar', 'data': {'Rice': 12.5}, 'title': 'Top Ingredients by Usage'}
+    monkeypatch.setattr(
+        routes.chatbot_service, 'ask_stream', lambda query: (iter(['Rice ', 'leads.']), chart_info)
+    )
+
+    response = asyncio.run(routes.chat_stream({'query': 'What ingredient is used the most?'}))
+
+    assert response.media_type == 'application/x-ndjson'
+    assert _read_events(response) == [
+        {'type': 'chart', 'chart_info': chart_info},
+        {'type': 'text', 'text': 'Rice '},
+        {'type': 'text', 'text': 'leads.'},
+    ]
+
+
+def test_chat_stream_route_reports_errors_after_streaming_started(monkeypatch):
+    def chunks():
+        yield 'Partial'
+        raise RuntimeError('connection lost')
+
+    monkeypatch.setattr(routes.chatbot_service, 'ask_stream', lambda query: (chunks(), None))
+
+    response = asyncio.run(routes.chat_stream({'query': 'Show me the cost analysis'}))
+
+    assert _read_events(response) == [
+        {'type': 'text', 'text': 'Partial'},
+        {'type': 'error', 'detail': 'connection lost'},
+    ]
+
+
+def test_chat_stream_route_requires_query():
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(routes.chat_stream({'query': ''}))
+    assert excinfo.value.status_code == 400
@@ -0,0 +1,67 @@
+"""
+Tests for how InventoryChatbot carries earlier turns into the LLM prompt
+"""
+import pandas as pd
+import pytest
+
+pytest.importorskip('openai')
+
+from analytics import InventoryAnalytics
+from chatbot import InventoryChatbot
+
+
+@pytest.fixture
+def chatbot():
+    return InventoryChatbot(InventoryAnalytics({}), api_key='test-key')
+
+
+def _exchange(bot, n):
+    bot.conversation_history.append({"role": "user", "content": f"question {n}"})
+    bot.conversation_history.append({"role": "assistant", "content": f"answer {n}"})
+    bot._fold_history()
+
+
+def _prompt_text(messages):
+    return '\n'.join(str(msg['content']) for msg in messages)
+
+
+@pytest.mark.parametrize('exchanges', [1, 2, 3, 6])
+def test_every_previous_exchange_reaches_the_prompt(chatbot, exchanges):
+    for n in range(exchanges):
+        _exchange(chatbot, n)
+
+    messages = chatbot._build_llm_messages('next question', {'error': 'no data'}, has_data=False)
+    prompt = _prompt_text(messages[1:])
+    for n in range(exchanges):
+        assert f"question {n}" in prompt
+        assert f"answer {n}" in prompt
+
+
+def test_recent_exchanges_are_sent_verbatim(chatbot):
+    for n in range(5):
+        _exchange(chatbot, n)
+
+    messages = chatbot._build_llm_messages('next question', {'error': 'no data'}, has_data=False)
+    # System prompt, folded summary, the two most recent exchanges, then the new question
+    assert [msg['role'] for msg in messages] == ['system', 'system', 'user', 'assistant', 'user', 'assistant', 'user']
+    assert messages[2:6] == chatbot.conversation_history
+    assert 'question 2' in messages[1]['content'] and 'question 3' not in messages[1]['content']
+
+
+def test_follow_up_lookups_keep_four_raw_messages(chatbot):
+    for n in range(5):
+        _exchange(chatbot, n)
+
+    # _resolve_query looks back over conversation_history[-4:] for follow-up questions
+    assert [msg['content'] for msg in chatbot.conversation_history] == [
+        'question 3', 'answer 3', 'question 4', 'answer 4'
+    ]
+
+
+def test_clear_history_drops_summary(chatbot):
+    for n in range(4):
+        _exchange(chatbot, n)
+    chatbot.clear_history()
+
+    messages = chatbot._build_llm_messages('next question', {'error': 'no data'}, has_data=False)
+    assert [msg['role'] for msg in messages] == ['system', 'user']
@@ -0,0 +1,103 @@
+"""
+Tests for the analytics lookups InventoryChatbot runs before prompting the LLM
+"""
+import json
+import warnings
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('openai')
+
+from analytics import InventoryAnalytics
+from chatbot import InventoryChatbot
+
+
+def _sales():
+    # Five dishes on the menu, only two of them sold in June 2026
+    menu = ['Beef Noodle Soup', 'Dan Dan Noodles', 'Fried Rice', 'Mapo Tofu', 'Wontons']
+    sales = pd.DataFrame({
+        'date': pd.to_datetime(['2026-05-03', '2026-05-20', '2026-06-02', '2026-06-15', '2026-06-28', '2026-07-01']),
+        'menu_item': ['Wontons', 'Mapo Tofu', 'Fried Rice', 'Beef Noodle Soup', 'Fried Rice', 'Dan Dan Noodles'],
+        'quantity_sold': [4, 2, 3, 1, 5, 6],
+        'revenue': [40.0, 24.0, 30.0, 15.0, 50.0, 72.0],
+    })
+    sales['menu_item'] = sales['menu_item'].astype(pd.CategoricalDtype(menu))
+    return sales
+
+
+def test_revenue_by_dish_lists_only_dishes_sold_in_the_month():
+    bot = InventoryChatbot(InventoryAnalytics({'sales': _sales()}), api_key='test-key')
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', FutureWarning)
+        result = bot._get_revenue_by_dish(month=6, year=2026)
+
+    assert len(result['data']) == 2
+    assert [row['menu_item'] for row in result['data']] == ['Fried Rice', 'Beef Noodle Soup']
+    assert result['total_revenue'] == pytest.approx(95.0)
+
+
+def test_prompt_data_keeps_every_row_the_query_returned():
+    bot = InventoryChatbot(InventoryAnalytics({}), api_key='test-key')
+    result = {
+        'data': [{'ingredient': f'Ingredient {n}', 'quantity_to_order': n + 0.125} for n in range(12)],
+        'total_items': 12,
+        '_internal': 'skipped',
+    }
+
+    compact = json.loads(bot._compact_for_prompt(result))
+
+    assert [row['ingredient'] for row in compact['data']] == [f'Ingredient {n}' for n in range(12)]
+    assert compact['data'][0]['quantity_to_order'] == 0.12
+    assert '_internal' not in compact
+
+
+def _top_usage(items):
+    return {'metric': 'usage', 'data': [{'ingredient': f'Ingredient {n}', 'value': n} for n in range(items)]}
+
+
+def _revenue_by_dish(items):
+    return {
+        'data': [{'menu_item': f'Dish {n}', 'revenue': 10.0 * n, 'quantity_sold': n} for n in range(items)],
+        'total_revenue': 10.0 * sum(range(items)),
+        'period_note': 'June 2026',
+    }
+
+
+def _reorder_recommendations(items):
+    return {
+        'data': [{'ingredient': f'Ingredient {n}', 'recommended_order_quantity': n} for n in range(items)],
+        'total_items': items,
+    }
+
+
+def _inventory_status(items):
+    rows = [{'ingredient': f'Ingredient {n}', 'current_stock': n, 'days_until_stockout': n} for n in range(items)]
+    return {
+        'total_ingredients': 2 * items,
+        'low_stock_count': items,
+        'reorder_needed_count': items,
+        'low_stock_items': rows,
+        'reorder_items': rows,
+    }
+
+
+@pytest.mark.parametrize('make_result', [_top_usage, _revenue_by_dish, _reorder_recommendations])
+@pytest.mark.parametrize('items, minimum', [(3, 270), (10, 550), (25, 1150), (60, 2550)])
+def test_top_n_answers_get_room_for_every_item(make_result, items, minimum):
+    bot = InventoryChatbot(InventoryAnalytics({}), api_key='test-key')
+
+    assert bot._max_tokens_for(make_result(items)) >= minimum
+
+
+def test_inventory_status_counts_both_item_lists():
+    bot = InventoryChatbot(InventoryAnalytics({}), api_key='test-key')
+
+    assert bot._max_tokens_for(_inventory_status(10)) >= 150 + 40 * 20
+
+
+def test_single_value_answers_keep_a_small_budget():
+    bot = InventoryChatbot(InventoryAnalytics({}), api_key='test-key')
+
+    assert bot._max_tokens_for({'error': 'No sales data available'}) == 300
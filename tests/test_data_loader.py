@@ -0,0 +1,78 @@
+"""
+Tests for DataLoader: column handling on CSVs that use alternative headers, and the Feather cache
+"""
+import os
+
+import pandas as pd
+import pytest
+
+from data_loader import FEATHER_CACHE_DIR, PYARROW_AVAILABLE, DataLoader
+
+
+def _write_purchases(directory, header, rows):
+    lines = [','.join(header)] + [','.join(map(str, row)) for row in rows]
+    (directory / 'purchases.csv').write_text('\n'.join(lines) + '\n')
+
+
+def test_unit_price_column_is_kept_and_copied_into_total_cost(tmp_path):
+    _write_purchases(tmp_path, ['date', 'Ingredient', 'qty', 'price', 'supplier'], [
+        ['2025-01-02', 'Rice', 10, 2.5, 'Supplier A'],
+        ['2025-01-03', 'Tofu', 4, 1.25, 'Supplier B'],
+    ])
+
+    # Second load reads the cleaned frame back from the on-disk cache
+    for _ in range(2):
+        purchases = DataLoader(str(tmp_path)).load_purchases()
+        assert list(purchases['price']) == [2.5, 1.25]
+        assert list(purchases['total_cost']) == [2.5, 1.25]
+        assert list(purchases['ingredient'].astype(str)) == ['Rice', 'Tofu']
+        assert list(purchases['quantity']) == [10.0, 4.0]
+
+
+def test_total_cost_alias_takes_priority_over_price(tmp_path):
+    _write_purchases(tmp_path, ['date', 'ingredient', 'quantity', 'Price', 'Total Cost'], [
+        ['2025-01-02', 'Rice', 10, 2.5, 25],
+    ])
+
+    purchases = DataLoader(str(tmp_path)).load_purchases()
+    assert purchases.loc[0, 'total_cost'] == 25
+    assert pd.to_numeric(purchases['Price']).tolist() == [2.5]
+
+
+def _write_sales(path, rows):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = ['date,menu_item,quantity_sold,revenue'] + [','.join(map(str, row)) for row in rows]
+    path.write_text('\n'.join(lines) + '\n')
+    # Same mtime for every file, so only the path tells them apart
+    os.utime(path, ns=(1_700_000_000_000_000_000, 1_700_000_000_000_000_000))
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason='Feather sidecars need pyarrow')
+def test_sidecars_of_same_named_files_do_not_collide(tmp_path):
+    first, second = tmp_path / 'upload_a' / 'sales.csv', tmp_path / 'upload_b' / 'sales.csv'
+    _write_sales(first, [['2025-01-02', 'Fried Rice', 3, 30.0]])
+    _write_sales(second, [['2025-01-02', 'Mapo Tofu!', 3, 30.0]])
+    assert first.stat().st_size == second.stat().st_size
+
+    DataLoader(str(tmp_path / 'data')).load_sales(str(first))
+    DataLoader(str(tmp_path / 'data')).load_sales(str(second))
+    assert len(list((tmp_path / 'data' / FEATHER_CACHE_DIR).glob('sales-*.feather'))) == 2
+
+    # Fresh loaders read each file back from its own sidecar
+    for path, dish in ((first, 'Fried Rice'), (second, 'Mapo Tofu!')):
+        sales = DataLoader(str(tmp_path / 'data')).load_sales(str(path))
+        assert list(sales['menu_item'].astype(str)) == [dish]
+
+
+def test_sidecar_name_follows_the_preprocessor_tables(tmp_path):
+    path = tmp_path / 'sales.csv'
+    _write_sales(path, [['2025-01-02', 'Fried Rice', 3, 30.0]])
+    stamp = (path.stat().st_mtime_ns, path.stat().st_size)
+
+    loader = DataLoader(str(tmp_path))
+    changed = DataLoader(str(tmp_path))
+    changed.preprocessor.unit_mappings['tray'] = 'units'
+    changed._preprocessor_tag = changed.preprocessor.fingerprint()
+
+    assert loader._sidecar_path(path, 'sales', stamp) != changed._sidecar_path(path, 'sales', stamp)
+    assert DataLoader(str(tmp_path))._sidecar_path(path, 'sales', stamp) == loader._sidecar_path(path, 'sales', stamp)
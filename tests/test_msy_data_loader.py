@@ -0,0 +1,42 @@
+"""
+Tests for MSYDataLoader's parsing of monthly matrix sheets
+"""
+import numpy as np
+import pandas as pd
+
+from data_preprocessor import DataPreprocessor
+from msy_data_loader import MSYDataLoader
+
+
+def _sheet(rows):
+    # Sheets are read without a header row, so the column headers arrive as the first data row
+    return pd.DataFrame(rows)
+
+
+def test_blank_sales_menu_cell_is_dropped(tmp_path):
+    loader = MSYDataLoader(str(tmp_path))
+    sheet = _sheet([
+        ['Group', 'Count', 'Amount'],
+        ['Fried Rice', 3, 30.0],
+        [np.nan, 2, 20.0],
+        ['Mapo Tofu', 1, 12.0],
+    ])
+
+    sales = loader._parse_sales_sheet(sheet, 'June_Data_Matrix.xlsx', (6, 2025))
+    assert list(sales['menu_item']) == ['Fried Rice', 'Mapo Tofu']
+
+    cleaned = DataPreprocessor().preprocess_sales(sales)
+    assert list(cleaned['menu_item'].astype(str)) == ['Fried Rice', 'Mapo Tofu']
+
+
+def test_blank_usage_menu_cell_stays_empty(tmp_path):
+    loader = MSYDataLoader(str(tmp_path))
+    sheet = _sheet([
+        ['Date', 'Ingredient', 'Menu Item', 'Quantity Used'],
+        ['2025-06-01', 'Rice', 'Fried Rice', 30],
+        ['2025-06-01', 'Tofu', np.nan, 10],
+    ])
+
+    usage = loader._parse_usage_sheet(sheet, 'June_Data_Matrix.xlsx')
+    cleaned = DataPreprocessor().preprocess_usage(usage)
+    assert list(cleaned['menu_item'].astype(str)) == ['Fried Rice', '']
@@ -0,0 +1,353 @@
+"""
+Regression tests: loader, preprocessor and analytics outputs on fixed inputs.
+
+Two datasets are covered: a handful of hand-written CSV rows loaded through DataLoader, and the MSY
+workbooks and CSVs shipped in data/. The clock is frozen so "last N days" windows are stable.
+Expected row counts, name sets and column totals were taken from the code before the loader and
+preprocessor were vectorized, so they check that the rewrite kept its results.
+"""
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import analytics as analytics_module
+import data_preprocessor as preprocessor_module
+import msy_data_loader as msy_module
+from analytics import InventoryAnalytics
+from data_loader import DataLoader
+from data_preprocessor import DataPreprocessor
+from msy_data_loader import MSYDataLoader
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+FROZEN_NOW = datetime(2025, 11, 15, 12, 0, 0)
+KINDS = ['purchases', 'shipments', 'ingredients', 'sales', 'usage']
+NAME_COLUMNS = ('ingredient', 'menu_item', 'supplier')
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() is pinned to FROZEN_NOW"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(*FROZEN_NOW.timetuple()[:6])
+
+
+@pytest.fixture(scope='module', autouse=True)
+def frozen_now():
+    with pytest.MonkeyPatch.context() as mp:
+        for module in (analytics_module, preprocessor_module, msy_module):
+            mp.setattr(module, 'datetime', _FrozenDatetime)
+        yield
+
+
+def _assert_summary(df, expected):
+    """Check row count, column set and the per-column figures listed in `expected`
+
+    Numeric columns are compared by their sum and other columns by their number of distinct values.
+    """
+    assert len(df) == expected['rows']
+    assert sorted(df.columns) == sorted(expected['columns'])
+    for col, value in expected.get('totals', {}).items():
+        assert pd.to_numeric(df[col], errors='coerce').fillna(0).sum() == pytest.approx(value, rel=1e-6), col
+    for col, value in expected.get('distinct', {}).items():
+        assert df[col].astype(str).nunique() == value, col
+
+
+def _assert_loaded_dtypes(df):
+    for col in NAME_COLUMNS:
+        if col in df.columns:
+            assert isinstance(df[col].dtype, pd.CategoricalDtype), col
+    for col in ('date', 'expected_date'):
+        if col in df.columns:
+            assert pd.api.types.is_datetime64_any_dtype(df[col]), col
+
+
+# --- Sample CSVs ----------------------------------------------------------------------------
+
+SAMPLE_CSVS = {
+    'purchases': """date,ingredient,quantity,total_cost,supplier
+2025-11-01,Rice,100,50.0,Supplier A
+2025-11-03,Tofu,40,80.0,Supplier A
+2025-11-05,Peas + Carrot,30,24.0,Supplier B
+2025-11-06,braised beef used (g),2000,90.0,Supplier B
+2025-11-08,Rice,60,30.0,Supplier B
+not a date,Rice,10,5.0,Supplier A
+""",
+    'shipments': """date,expected_date,ingredient,quantity,status,supplier
+2025-11-01,2025-11-01,Rice,100,Delivered,Supplier A
+2025-11-05,2025-11-03,Tofu,40,Delayed,Supplier A
+2025-11-08,2025-11-08,Rice,60,Delivered,Supplier B
+""",
+    'ingredients': """ingredient,unit,min_stock_level,max_stock_level,shelf_life_days,storage_type
+Rice,g,20,200,180,dry
+Tofu,g,10,100,7,refrigerated
+Peas,g,5,50,90,frozen
+Carrot,g,5,50,21,refrigerated
+Braised Beef,g,500,5000,5,refrigerated
+""",
+    'sales': """date,menu_item,quantity_sold,revenue
+2025-11-09,Fried Rice,3,30.0
+2025-11-09,Mapo Tofu,1,12.0
+2025-11-10,Fried Rice,2,20.0
+2025-11-11,Beef Noodle Soup,4,60.0
+""",
+    'usage': """date,ingredient,menu_item,quantity_used
+2025-11-09,Rice,Fried Rice,30
+2025-11-09,Tofu,Mapo Tofu,10
+2025-11-10,Rice,Fried Rice,20
+2025-11-11,Braised Beef,Beef Noodle Soup,400
+""",
+}
+
+SAMPLE_EXPECTED = {
+    # The undated row is dropped and 'Peas + Carrot' is split into one row each
+    'purchases': {
+        'rows': 6, 'columns': ['date', 'ingredient', 'quantity', 'supplier', 'total_cost'],
+        'totals': {'quantity': 2230.0, 'total_cost': 274.0},
+        'names': ['Beef', 'Carrot', 'Peas', 'Rice', 'Tofu'],
+    },
+    'shipments': {
+        'rows': 3, 'columns': ['date', 'delay_days', 'expected_date', 'ingredient', 'quantity', 'status', 'supplier'],
+        'totals': {'quantity': 200.0, 'delay_days': 2.0},
+        'names': ['Rice', 'Tofu'],
+    },
+    'ingredients': {
+        'rows': 5, 'columns': ['ingredient', 'max_stock_level', 'min_stock_level', 'shelf_life_days', 'storage_type', 'unit'],
+        'totals': {'min_stock_level': 540.0, 'max_stock_level': 5400.0, 'shelf_life_days': 303.0},
+        'names': ['Braised Beef', 'Carrot', 'Peas', 'Rice', 'Tofu'],
+    },
+    'sales': {
+        'rows': 4, 'columns': ['date', 'menu_item', 'quantity_sold', 'revenue'],
+        'totals': {'quantity_sold': 10.0, 'revenue': 122.0},
+        'names': ['Beef Noodle Soup', 'Fried Rice', 'Mapo Tofu'],
+    },
+    'usage': {
+        'rows': 4, 'columns': ['date', 'ingredient', 'menu_item', 'quantity_used'],
+        'totals': {'quantity_used': 460.0},
+        'names': ['Beef', 'Rice', 'Tofu'],
+    },
+}
+
+
+def _name_column(df):
+    return 'ingredient' if 'ingredient' in df.columns else 'menu_item'
+
+
+@pytest.fixture(scope='module')
+def sample_dir(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('sample')
+    for kind, text in SAMPLE_CSVS.items():
+        (directory / f'{kind}.csv').write_text(text)
+    return directory
+
+
+@pytest.fixture(scope='module')
+def sample_data(sample_dir):
+    loader = DataLoader(str(sample_dir))
+    return {kind: getattr(loader, f'load_{kind}')() for kind in KINDS}
+
+
+@pytest.mark.parametrize('kind', KINDS)
+def test_sample_loads(sample_dir, sample_data, kind):
+    df = sample_data[kind]
+    expected = SAMPLE_EXPECTED[kind]
+    _assert_summary(df, expected)
+    assert sorted(set(df[_name_column(df)].astype(str))) == expected['names']
+    _assert_loaded_dtypes(df)
+
+    # A second loader reads the cleaned frame back from the Feather cache
+    cached = getattr(DataLoader(str(sample_dir)), f'load_{kind}')()
+    pd.testing.assert_frame_equal(cached.reset_index(drop=True), df.reset_index(drop=True))
+
+
+def test_sample_preprocess_all(sample_dir):
+    raw = {kind: pd.read_csv(sample_dir / f'{kind}.csv') for kind in KINDS}
+    data = DataPreprocessor().preprocess_all(raw)
+    for kind in KINDS:
+        expected = dict(SAMPLE_EXPECTED[kind])
+        if kind == 'shipments':
+            # delay_days is added by DataLoader, not by the preprocessor
+            expected['columns'] = [col for col in expected['columns'] if col != 'delay_days']
+            expected['totals'] = {'quantity': 200.0}
+        _assert_summary(data[kind], expected)
+        assert sorted(set(data[kind][_name_column(data[kind])].astype(str))) == expected['names']
+
+
+def test_sample_analytics(sample_data):
+    def analytics():
+        return InventoryAnalytics({kind: frame.copy() for kind, frame in sample_data.items()})
+
+    inventory = analytics().calculate_inventory_levels()
+    _assert_summary(inventory, {
+        'rows': 5,
+        'columns': ['current_stock', 'days_until_stockout', 'ingredient', 'max_stock_level', 'min_stock_level',
+                    'reorder_needed', 'stock_status', 'total_purchased', 'total_used'],
+        'totals': {'current_stock': 1770.0, 'total_purchased': 2230.0, 'total_used': 460.0},
+    })
+    assert not inventory['reorder_needed'].any()
+
+    top_usage = analytics().get_top_ingredients('usage', 10, 30)
+    assert list(top_usage['ingredient'].astype(str)) == ['Beef', 'Rice', 'Tofu']
+    assert list(top_usage['value']) == [400.0, 50.0, 10.0]
+
+    delays = analytics().analyze_shipment_delays()
+    assert len(delays) == 2
+    assert delays['delayed_count'].sum() == 1 and delays['max_delay'].max() == 2
+
+    reorder = analytics().calculate_reorder_recommendations()
+    _assert_summary(reorder, {
+        'rows': 2,
+        'columns': ['current_stock', 'data_quality', 'days_until_stockout', 'estimated_lead_time_days',
+                    'forecasted_demand_30d', 'ingredient', 'min_stock_level', 'recommended_order_quantity',
+                    'reorder_date', 'urgency'],
+        'totals': {'current_stock': 30.0, 'forecasted_demand_30d': 30.0, 'recommended_order_quantity': 10.0},
+    })
+
+    waste = analytics().calculate_waste_analysis(30)
+    _assert_summary(waste, {
+        'rows': 5, 'columns': list(waste.columns),
+        'totals': {'total_purchased': 2230.0, 'total_used': 460.0, 'total_cost': 274.0,
+                   'waste': 979368.72, 'waste_cost': 77151.64},
+    })
+
+    reliability = analytics().track_supplier_reliability()
+    assert sorted(reliability['supplier'].astype(str)) == ['Supplier A', 'Supplier B']
+    assert reliability['total_spending'].sum() == pytest.approx(274.0)
+
+
+# --- MSY data in data/ ----------------------------------------------------------------------
+
+MSY_EXPECTED = {
+    'purchases': {
+        'rows': 309, 'columns': ['date', 'ingredient', 'quantity', 'supplier', 'total_cost'],
+        'totals': {'quantity': 21275.0, 'total_cost': 0.0}, 'distinct': {'ingredient': 15, 'supplier': 1},
+    },
+    'shipments': {
+        'rows': 14, 'columns': ['frequency', 'ingredient', 'num_shipments', 'quantity', 'unit'],
+        'totals': {'quantity': 975.0, 'num_shipments': 58.0}, 'distinct': {'ingredient': 14, 'unit': 2},
+    },
+    'ingredients': {
+        'rows': 18, 'columns': ['category', 'ingredient', 'max_stock_level', 'min_stock_level', 'shelf_life_days',
+                                'storage_space_units', 'storage_type', 'unit'],
+        'totals': {'max_stock_level': 3600.0, 'shelf_life_days': 252.0}, 'distinct': {'ingredient': 18, 'storage_type': 3},
+    },
+    'sales': {
+        'rows': 1574, 'columns': ['date', 'menu_item', 'price', 'quantity_sold', 'revenue'],
+        'totals': {'quantity_sold': 290732.0, 'revenue': 2204205.66}, 'distinct': {'menu_item': 181},
+    },
+    'usage': {
+        'rows': 1782, 'columns': ['date', 'ingredient', 'menu_item', 'quantity_used'],
+        'totals': {'quantity_used': 20112562.0}, 'distinct': {'ingredient': 16, 'menu_item': 25},
+    },
+}
+
+
+@pytest.fixture(scope='module')
+def msy_dir(tmp_path_factory):
+    # A copy, so the loaders' on-disk caches are not written into the repository
+    directory = tmp_path_factory.mktemp('msy') / 'data'
+    shutil.copytree(PROJECT_ROOT / 'data', directory, ignore=shutil.ignore_patterns('.cache'))
+    return directory
+
+
+@pytest.fixture(scope='module')
+def msy_data(msy_dir):
+    return DataLoader(str(msy_dir)).load_all_data()
+
+
+def test_msy_load_all_data(msy_dir, msy_data):
+    for kind in KINDS:
+        _assert_summary(msy_data[kind], MSY_EXPECTED[kind])
+        # The MSY ingredient master keeps its names as plain strings
+        if kind != 'ingredients':
+            _assert_loaded_dtypes(msy_data[kind])
+
+    # Warm load: the monthly matrices come back from their Parquet cache
+    warm = DataLoader(str(msy_dir)).load_all_data()
+    for kind in KINDS:
+        pd.testing.assert_frame_equal(warm[kind].reset_index(drop=True), msy_data[kind].reset_index(drop=True))
+
+
+def test_msy_loader_without_preprocessor(msy_dir, monkeypatch):
+    # Exercises the fallback name normalization and master-list matching
+    monkeypatch.setattr(msy_module, 'DataPreprocessor', None)
+    data = MSYDataLoader(str(msy_dir)).load_all_data()
+
+    _assert_summary(data['purchases'], {**MSY_EXPECTED['purchases'], 'rows': 285,
+                                        'distinct': {'ingredient': 14, 'supplier': 1}})
+    _assert_summary(data['ingredients'], {**MSY_EXPECTED['ingredients'], 'rows': 29,
+                                          'totals': {'max_stock_level': 5800.0, 'shelf_life_days': 406.0},
+                                          'distinct': {'ingredient': 29, 'storage_type': 3}})
+    _assert_summary(data['usage'], {**MSY_EXPECTED['usage'], 'totals': {'quantity_used': 20112579.0}})
+    _assert_summary(data['sales'], MSY_EXPECTED['sales'])
+
+    usage_names = set(data['usage']['ingredient'].astype(str))
+    assert {'Rice(g)', 'braised beef used (g)', 'Egg(count)', 'White onion'} <= usage_names
+    assert 'Peas + Carrot' in set(data['purchases']['ingredient'].astype(str))
+
+
+def test_msy_preprocess_all(msy_dir, monkeypatch):
+    monkeypatch.setattr(msy_module, 'DataPreprocessor', None)
+    raw = MSYDataLoader(str(msy_dir)).load_all_data()
+    data = DataPreprocessor().preprocess_all({kind: raw.get(kind, pd.DataFrame()) for kind in KINDS})
+
+    for kind in ('purchases', 'shipments', 'sales', 'usage'):
+        _assert_summary(data[kind], MSY_EXPECTED[kind])
+    _assert_summary(data['ingredients'], {**MSY_EXPECTED['ingredients'], 'rows': 28,
+                                          'totals': {'max_stock_level': 5600.0, 'shelf_life_days': 392.0},
+                                          'distinct': {'ingredient': 28}})
+
+
+def test_msy_analytics(msy_data):
+    def analytics():
+        return InventoryAnalytics({kind: frame.copy() for kind, frame in msy_data.items()})
+
+    inventory = analytics().calculate_inventory_levels()
+    _assert_summary(inventory, {
+        'rows': 18, 'columns': list(inventory.columns),
+        'totals': {'current_stock': 9470.0, 'total_purchased': 21275.0, 'total_used': 20112562.0},
+    })
+    assert inventory['reorder_needed'].sum() == 16
+
+    for metric, total in (('usage', 15863880.0), ('cost', 101820.0)):
+        top = analytics().get_top_ingredients(metric, 10, 180)
+        assert len(top) == 10 and top['value'].sum() == pytest.approx(total), metric
+
+    cost = analytics().get_cost_analysis(180)
+    assert cost['total_spending'] == pytest.approx(104332.5)
+    assert cost['avg_daily_spending'] == pytest.approx(3477.75)
+
+    reorder = analytics().calculate_reorder_recommendations()
+    _assert_summary(reorder, {
+        'rows': 16, 'columns': list(reorder.columns),
+        'totals': {'forecasted_demand_30d': 956900.0, 'recommended_order_quantity': 651.0},
+    })
+
+    risk = analytics().calculate_risk_alerts()
+    assert len(risk) == 18 and risk['risk_score'].sum() == pytest.approx(860.0)
+
+    waste = analytics().calculate_waste_analysis(180)
+    _assert_summary(waste, {
+        'rows': 15, 'columns': list(waste.columns),
+        'totals': {'total_purchased': 21275.0, 'total_used': 14722030.0, 'waste_cost': 1588314.06},
+    })
+
+    storage = analytics().estimate_storage_load()
+    assert len(storage) == 3 and storage['total_load'].sum() == pytest.approx(10320.0)
+
+    recipes = analytics().map_recipes_to_inventory()
+    assert len(recipes) == 17 and recipes['can_make'].sum() == 1
+    assert analytics().calculate_menu_viability_score() == pytest.approx(5.88, abs=0.01)
+
+    impact = analytics().calculate_ingredient_impact_score()
+    assert len(impact) == 119 and impact['impact_score'].sum() == pytest.approx(170.62, abs=0.01)
+
+    trends = analytics().get_usage_trends()
+    assert len(trends) == 6 and trends['quantity_used'].sum() == pytest.approx(20112562.0)
+
+    assert analytics().analyze_shipment_delays().empty
+    assert analytics().track_supplier_reliability().empty
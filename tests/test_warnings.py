@@ -0,0 +1,38 @@
+"""
+The dashboard modules must not silence warnings for the whole process when imported
+"""
+import subprocess
+import sys
+import warnings
+from pathlib import Path
+
+import pandas as pd
+
+import msy_data_loader
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+
+CHECK_FILTERS = """
+import warnings
+import data_loader, msy_data_loader, data_preprocessor, analytics
+blanket = [f for f in warnings.filters if f[0] == 'ignore' and f[1] is None and f[2] is Warning and f[3] is None]
+print(len(blanket))
+"""
+
+
+def test_imports_add_no_blanket_ignore_filter():
+    # A fresh interpreter, so modules imported by other tests don't mask the check
+    output = subprocess.run(
+        [sys.executable, '-c', CHECK_FILTERS], cwd=SRC_DIR,
+        capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == '0'
+
+
+def test_parse_dates_skips_unparseable_values_quietly():
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        parsed = msy_data_loader._parse_dates(pd.Series(['not a date', '2 Jan 2024', '3 Feb 2024']))
+
+    assert parsed.isna().tolist() == [True, False, False]
+    assert parsed[1] == pd.Timestamp('2024-01-02')